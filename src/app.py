@@ -1,5 +1,6 @@
 import streamlit as st
 import os
+import importlib
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -22,17 +23,29 @@ if db_path and not db_path.exists():
     initialize_database()
 
 # ------------------------------------------------------------
-# Import UI pages
+# Background corpus refresh (scrape → dedupe → embed → index)
 # ------------------------------------------------------------
-from ui import (
-    page_1_create_profile,
-    page_2_resume_builder,
-    page_3_external_jd,
-    page_4_job_scraper,
-    page_5_skill_gap_analyzer,
-    page_6_dashboard,
-    page_7_langgraph_playground       #  Needed import
-)
+# Interactive flows read the stored corpus; with CORPUS_REFRESH_IN_APP=1 the
+# app keeps it fresh itself, otherwise run
+# `python -m smart_applier.workers.corpus_refresh` next to it. Without either,
+# load_corpus_node starts a background refresh when the corpus is older than
+# the refresh interval (and serves the current corpus meanwhile).
+if os.getenv("CORPUS_REFRESH_IN_APP", "0").lower() in ("1", "true", "yes"):
+    from smart_applier.workers.corpus_refresh import start_background_worker
+    start_background_worker()
+
+# ------------------------------------------------------------
+# UI pages (imported only when first opened)
+# ------------------------------------------------------------
+PAGE_MODULES = {
+    "Dashboard": "ui.page_6_dashboard",
+    "Create Profile": "ui.page_1_create_profile",
+    "Resume Builder": "ui.page_2_resume_builder",
+    "External JD Flow": "ui.page_3_external_jd",
+    "Job Scraper Flow": "ui.page_4_job_scraper",
+    "Skill Gap Analyzer": "ui.page_5_skill_gap_analyzer",
+    "Langgraph Playground": "ui.page_7_langgraph_playground",
+}
 
 # ------------------------------------------------------------
 # Streamlit Page Config
@@ -91,15 +104,6 @@ st.session_state["page"] = selected
 # ------------------------------------------------------------
 # Router
 # ------------------------------------------------------------
-page_router = {
-    "Dashboard": page_6_dashboard.run,
-    "Create Profile": page_1_create_profile.run,
-    "Resume Builder": page_2_resume_builder.run,
-    "External JD Flow": page_3_external_jd.run,
-    "Job Scraper Flow": page_4_job_scraper.run,
-    "Skill Gap Analyzer": page_5_skill_gap_analyzer.run,
-    "Langgraph Playground": page_7_langgraph_playground.run
-}
-
 # Render selected page
-page_router[st.session_state["page"]]()
+page_module = importlib.import_module(PAGE_MODULES[st.session_state["page"]])
+page_module.run()
@@ -0,0 +1,136 @@
+# src/benchmarks/ann_recall.py
+# Recall@10 / latency / memory of the ANN index modes against exact (flat) search.
+#
+#   cd src && python -m benchmarks.ann_recall --jobs 100000 --queries 500
+#   cd src && python -m benchmarks.ann_recall --configs ivf_flat:nprobe=8 ivf_flat:nprobe=32 hnsw:ef_search=128
+#
+# Vectors come from synthetic job postings embedded with the offline hashing
+# encoder (or real models with --encoder sentence-transformers).
+import argparse
+import time
+
+import numpy as np
+import faiss
+
+from benchmarks.common import HashingEncoder, write_report
+from benchmarks.synthetic import generate_jobs, generate_profiles
+from smart_applier.search.ann import (
+    build_index,
+    needs_training,
+    resolve_params,
+    index_memory_bytes,
+)
+
+DEFAULT_CONFIGS = [
+    "flat",
+    "ivf_flat:nprobe=8",
+    "ivf_flat:nprobe=16",
+    "ivf_flat:nprobe=64",
+    "ivf_pq:nprobe=16",
+    "ivf_pq:nprobe=64",
+    "hnsw:ef_search=32",
+    "hnsw:ef_search=64",
+    "hnsw:ef_search=128",
+]
+
+
+def parse_config(spec: str):
+    """'ivf_pq:nprobe=32,m=96' -> ('ivf_pq', {'nprobe': 32, 'm': 96})"""
+    index_type, _, rest = spec.partition(":")
+    overrides = {}
+    for pair in filter(None, rest.split(",")):
+        key, value = pair.split("=")
+        overrides[key] = int(value)
+    return index_type, resolve_params(index_type, overrides)
+
+
+def embed(texts, encoder_kind):
+    if encoder_kind == "hashing":
+        vectors = HashingEncoder().encode(texts)
+    else:
+        from sentence_transformers import SentenceTransformer
+        vectors = SentenceTransformer("all-MiniLM-L6-v2").encode(texts, convert_to_numpy=True)
+    vectors = np.ascontiguousarray(vectors, dtype="float32")
+    faiss.normalize_L2(vectors)
+    return vectors
+
+
+def evaluate(spec, corpus, queries, ground_truth, k):
+    index_type, params = parse_config(spec)
+
+    start = time.perf_counter()
+    index = build_index(index_type, corpus.shape[1], params, n_train=len(corpus))
+    if needs_training(index_type):
+        index.train(corpus)
+    train_seconds = time.perf_counter() - start
+    index.add(corpus)
+    build_seconds = time.perf_counter() - start
+
+    # Single-query latency (the interactive path) ...
+    latencies = []
+    for q in queries:
+        t0 = time.perf_counter()
+        index.search(q.reshape(1, -1), k)
+        latencies.append((time.perf_counter() - t0) * 1000)
+    latencies.sort()
+
+    # ... and batched throughput (the multi-profile path)
+    t0 = time.perf_counter()
+    _, found = index.search(queries, k)
+    batch_seconds = time.perf_counter() - t0
+
+    recall = np.mean([
+        len(set(found[i]) & set(ground_truth[i])) / k for i in range(len(queries))
+    ])
+
+    return {
+        "config": spec,
+        "index_type": index_type,
+        "params": params,
+        f"recall@{k}": round(float(recall), 4),
+        "latency_p50_ms": round(latencies[len(latencies) // 2], 3),
+        "latency_p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 3),
+        "batch_qps": round(len(queries) / batch_seconds, 1),
+        "train_seconds": round(train_seconds, 3),
+        "build_seconds": round(build_seconds, 3),
+        "memory_mb": round(index_memory_bytes(index) / 1e6, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ANN recall/latency/memory harness")
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--configs", nargs="+", default=DEFAULT_CONFIGS)
+    parser.add_argument("--encoder", choices=["hashing", "sentence-transformers"], default="hashing")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    print(f" Embedding {args.jobs} jobs and {args.queries} profile queries...")
+    jobs = generate_jobs(args.jobs)
+    corpus = embed([f"{j['skills']} {j['summary']}" for j in jobs], args.encoder)
+    profiles = generate_profiles(args.queries)
+    queries = embed(
+        [" ".join(s for group in p["skills"].values() for s in group) for p in profiles],
+        args.encoder,
+    )
+
+    exact = faiss.IndexFlatIP(corpus.shape[1])
+    exact.add(corpus)
+    _, ground_truth = exact.search(queries, args.k)
+
+    results = []
+    for spec in args.configs:
+        result = evaluate(spec, corpus, queries, ground_truth, args.k)
+        results.append(result)
+        print(
+            f" {spec:<24} recall@{args.k}={result[f'recall@{args.k}']:.3f} "
+            f"p50={result['latency_p50_ms']:.3f}ms mem={result['memory_mb']}MB"
+        )
+
+    write_report("ann_recall", {"jobs": args.jobs, "queries": args.queries, "configs": results}, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# src/benchmarks/common.py
+# Shared helpers for the offline benchmarks: isolated data dir, stub encoder,
+# stage timing and JSON output.
+import json
+import os
+import platform
+import tempfile
+import time
+import zlib
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+
+def isolate_environment(data_dir: str = None) -> Path:
+    """
+    Point the app at a throwaway data dir and disable network-backed features.
+    Must run BEFORE smart_applier modules are imported.
+    """
+    data_dir = Path(data_dir or tempfile.mkdtemp(prefix="smart_applier_bench_"))
+    os.environ["SMART_APPLIER_DATA_DIR"] = str(data_dir)
+    os.environ["USE_IN_MEMORY_DB"] = ""
+    # An explicit empty key wins over .env (load_dotenv doesn't override), so
+    # every agent takes its no-Gemini path.
+    os.environ["GEMINI_API_KEY"] = ""
+    # Stages are timed separately, so inserts must not embed/index on the side
+    os.environ["JOB_INDEX_AUTO_APPEND"] = "0"
+    return data_dir
+
+
+class HashingEncoder:
+    """
+    Deterministic, network-free stand-in for SentenceTransformer: signed
+    feature hashing of word tokens. Texts that share words get similar vectors,
+    which keeps search and skill-gap results meaningful.
+    """
+
+    def __init__(self, dim: int = 384):
+        self.dim = dim
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dim
+
+    def encode(self, sentences, batch_size: int = 32, **kwargs):
+        single = isinstance(sentences, str)
+        sentences = [sentences] if single else list(sentences)
+        out = np.zeros((len(sentences), self.dim), dtype="float32")
+        for row, text in enumerate(sentences):
+            for token in str(text).lower().split():
+                h = zlib.crc32(token.encode("utf-8"))
+                out[row, h % self.dim] += 1.0 if (h >> 16) & 1 else -1.0
+        out /= np.maximum(np.linalg.norm(out, axis=1, keepdims=True), 1e-12)
+        return out[0] if single else out
+
+
+def use_encoder(kind: str):
+    """'hashing' (offline stub, default) or 'sentence-transformers' (real models)."""
+    from smart_applier.embeddings.model_registry import get_model_registry
+
+    if kind == "hashing":
+        registry = get_model_registry()
+        registry.clear()
+        registry.loader = lambda model_name: HashingEncoder()
+    elif kind != "sentence-transformers":
+        raise ValueError(f"Unknown encoder: {kind}")
+
+
+class StageTimer:
+    def __init__(self):
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name: str, items: int = None):
+        start = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - start
+        result = {"seconds": round(seconds, 4)}
+        if items is not None:
+            result["items"] = items
+            result["items_per_sec"] = round(items / seconds, 1) if seconds > 0 else None
+        self.stages[name] = result
+        print(f"   {name:<28} {seconds:9.3f}s" + (f"  ({items} items)" if items is not None else ""))
+
+
+def write_report(name: str, payload, output: str = None) -> Path:
+    report = {
+        "benchmark": name,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": payload,
+    }
+    path = Path(output or f"{name}_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f" Wrote {path}")
+    return path
@@ -0,0 +1,103 @@
+# src/benchmarks/db_writes.py
+# Rows/second of the scraped-jobs and top-matches writes: row-at-a-time
+# (the old code paths, reproduced here) against the batched db_utils APIs.
+#
+#   cd src && python -m benchmarks.db_writes --jobs 5000 --matches 2000
+#
+# "per_row_connection" opens, commits and closes a connection per row like
+# the original helpers did; "per_row_pooled" is one commit per row on the
+# pooled connection; "batched" is one executemany in one transaction.
+# The scraped-jobs baseline is a plain insert, while bulk_upsert_scraped_jobs
+# also looks up fingerprints to de-duplicate, so it does strictly more work.
+import argparse
+import sqlite3
+import time
+
+from benchmarks.common import isolate_environment, write_report
+
+
+def per_row_jobs(db_path, jobs):
+    # The original bulk_insert_scraped_jobs: one execute per row for lastrowid
+    from smart_applier.utils.job_fingerprint import job_fingerprint
+
+    conn = sqlite3.connect(db_path)
+    cur = conn.cursor()
+    ids = []
+    for job in jobs:
+        cur.execute("""
+            INSERT OR IGNORE INTO scraped_jobs
+                (title, company, location, experience, skills, summary, posted_on, fingerprint)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (job["title"], job["company"], job["location"], job["experience"], job["skills"],
+              job["summary"], job["posted_on"], job_fingerprint(job)))
+        ids.append(cur.lastrowid)
+    conn.commit()
+    conn.close()
+    return ids
+
+
+def per_row_connection_matches(db_path, rows):
+    # The original insert_top_matched, called once per match
+    for job_id, user_id, score in rows:
+        conn = sqlite3.connect(db_path)
+        conn.execute("INSERT INTO top_matched_jobs (job_id, user_id, score) VALUES (?, ?, ?)",
+                     (job_id, user_id, score))
+        conn.commit()
+        conn.close()
+
+
+def timed(fn, rows: int):
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+    return {"rows": rows, "seconds": round(seconds, 4), "rows_per_sec": round(rows / seconds, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Row-at-a-time vs batched DB writes")
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--matches", type=int, default=2000)
+    parser.add_argument("--top-k", type=int, default=10, help="matches written per match_jobs call")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    isolate_environment()
+    from benchmarks.synthetic import generate_jobs
+    from smart_applier.database.connection import get_connection_manager
+    from smart_applier.utils.db_utils import (
+        bulk_upsert_scraped_jobs,
+        insert_top_matched,
+        insert_top_matched_many,
+    )
+
+    manager = get_connection_manager()
+    manager.get_connection()  # creates the schema
+    db_path, _ = manager.target()
+    results = {"scraped_jobs": {}, "top_matched_jobs": {}}
+
+    # Distinct postings per mode so every row is a real insert
+    jobs = generate_jobs(args.jobs * 2, seed=11)
+    results["scraped_jobs"]["per_row_no_dedupe"] = timed(lambda: per_row_jobs(db_path, jobs[:args.jobs]), args.jobs)
+    results["scraped_jobs"]["batched_upsert"] = timed(
+        lambda: bulk_upsert_scraped_jobs(jobs[args.jobs:], notify=False), args.jobs)
+
+    rows = [(i % args.jobs + 1, f"bench_user_{i // args.top_k}", 1.0 / (1 + i % args.top_k))
+            for i in range(args.matches)]
+    groups = [rows[i:i + args.top_k] for i in range(0, len(rows), args.top_k)]
+    results["top_matched_jobs"]["per_row_connection"] = timed(
+        lambda: per_row_connection_matches(db_path, rows), len(rows))
+    results["top_matched_jobs"]["per_row_pooled"] = timed(
+        lambda: [insert_top_matched(*row) for row in rows], len(rows))
+    results["top_matched_jobs"]["batched_per_match_call"] = timed(
+        lambda: [insert_top_matched_many(group) for group in groups], len(rows))
+    results["top_matched_jobs"]["batched_single_transaction"] = timed(
+        lambda: insert_top_matched_many(rows), len(rows))
+
+    for table, modes in results.items():
+        for mode, r in modes.items():
+            print(f" {table:<17} {mode:<27} {r['rows_per_sec']:>12,.0f} rows/s  ({r['seconds']:.3f}s)")
+    write_report("db_writes", {"args": vars(args), "results": results}, args.output)
+
+
+if __name__ == "__main__":
+    main()
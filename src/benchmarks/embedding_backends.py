@@ -0,0 +1,103 @@
+# src/benchmarks/embedding_backends.py
+# Compare the PyTorch SentenceTransformer path with the int8 ONNX Runtime backend.
+#
+#   cd src && python -m benchmarks.embedding_backends --texts 2000 --output onnx_vs_torch.json
+import argparse
+import json
+import random
+import statistics
+import time
+
+import numpy as np
+
+from smart_applier.embeddings.onnx_backend import (
+    QUANTIZED_FILE,
+    OnnxSentenceEncoder,
+    default_onnx_dir,
+    export_quantized_onnx,
+)
+
+MODELS = ["all-MiniLM-L6-v2", "paraphrase-mpnet-base-v2"]
+
+WORDS = (
+    "python sql power bi tableau excel machine learning deep learning nlp aws azure gcp docker "
+    "kubernetes spark hadoop airflow pandas numpy statistics communication leadership react java "
+    "analyst engineer developer data cloud pipeline dashboard reporting etl testing agile"
+).split()
+
+
+def sample_texts(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(WORDS, k=rng.randint(4, 60))) for _ in range(n)]
+
+
+def time_throughput(model, texts, batch_size=32):
+    model.encode(texts[:batch_size], batch_size=batch_size)  # warm-up
+    start = time.perf_counter()
+    vectors = model.encode(texts, batch_size=batch_size)
+    elapsed = time.perf_counter() - start
+    return np.asarray(vectors, dtype="float32"), len(texts) / elapsed
+
+
+def time_latency(model, texts, runs=50):
+    samples = []
+    for text in texts[:runs]:
+        start = time.perf_counter()
+        model.encode([text])
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "p50_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 3),
+    }
+
+
+def benchmark_model(model_name, texts):
+    from sentence_transformers import SentenceTransformer
+
+    torch_model = SentenceTransformer(model_name, device="cpu")
+    onnx_dir = default_onnx_dir(model_name)
+    if not (onnx_dir / QUANTIZED_FILE).exists():
+        export_quantized_onnx(model_name, onnx_dir)
+    onnx_model = OnnxSentenceEncoder(onnx_dir)
+
+    torch_vecs, torch_tput = time_throughput(torch_model, texts)
+    onnx_vecs, onnx_tput = time_throughput(onnx_model, texts)
+
+    a = torch_vecs / np.linalg.norm(torch_vecs, axis=1, keepdims=True)
+    b = onnx_vecs / np.linalg.norm(onnx_vecs, axis=1, keepdims=True)
+    agreement = (a * b).sum(axis=1)
+
+    return {
+        "model": model_name,
+        "texts": len(texts),
+        "torch": {"texts_per_sec": round(torch_tput, 1), **time_latency(torch_model, texts)},
+        "onnx_int8": {"texts_per_sec": round(onnx_tput, 1), **time_latency(onnx_model, texts)},
+        "speedup": round(onnx_tput / torch_tput, 2),
+        "cosine_agreement": {
+            "mean": round(float(agreement.mean()), 4),
+            "min": round(float(agreement.min()), 4),
+            "p5": round(float(np.percentile(agreement, 5)), 4),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PyTorch vs int8 ONNX embedding benchmark")
+    parser.add_argument("--texts", type=int, default=1000)
+    parser.add_argument("--models", nargs="+", default=MODELS)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    texts = sample_texts(args.texts)
+    results = [benchmark_model(name, texts) for name in args.models]
+
+    report = json.dumps(results, indent=2)
+    print(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# src/benchmarks/fulltext_search.py
+# Keyword search over scraped_jobs: the full-scan approach (load the table
+# into pandas, regex every text column) against the FTS5 index of
+# search/fulltext.py, plus the hybrid BM25 + cosine match on its candidates.
+#
+#   cd src && python -m benchmarks.fulltext_search --jobs 100000
+#
+# The pandas filter matches whole words case-insensitively; FTS5 also
+# stems (porter), so it can find a few more jobs ("engineers" for
+# "engineer"). "agreement" is the share of pandas hits FTS5 finds too.
+import argparse
+import re
+import statistics
+import time
+
+import pandas as pd
+
+from benchmarks.common import isolate_environment, use_encoder, write_report
+
+TEXT_COLUMNS = ["title", "skills", "summary", "location"]
+# (query, location)
+QUERIES = [
+    ("kubernetes", None),
+    ("kubernetes", "bangalore"),
+    ("machine learning", None),
+    ("data engineer airflow", "pune"),
+    ("power bi", "remote"),
+]
+
+
+def median_ms(fn, repeats: int):
+    samples, result = [], None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 3), result
+
+
+def load_dataframe(limit: int) -> pd.DataFrame:
+    from smart_applier.utils.db_utils import get_all_scraped_jobs
+    df = pd.DataFrame(get_all_scraped_jobs(limit=limit))
+    df["text"] = df[TEXT_COLUMNS].fillna("").agg(" ".join, axis=1)
+    return df
+
+
+def pandas_filter(df: pd.DataFrame, query: str, location: str = None) -> pd.DataFrame:
+    # Every word somewhere in the text columns, like fulltext.to_match_query
+    text = df["text"]
+    mask = pd.Series(True, index=df.index)
+    for word in query.split():
+        mask &= text.str.contains(rf"\b{re.escape(word)}\b", case=False, regex=True)
+    if location:
+        mask &= df["location"].fillna("").str.contains(rf"\b{re.escape(location)}\b", case=False, regex=True)
+    return df[mask]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-scan pandas vs FTS5 keyword search")
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--encoder", choices=["hashing", "sentence-transformers"], default="hashing")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    isolate_environment()
+    use_encoder(args.encoder)
+    from benchmarks.synthetic import generate_jobs, generate_profile
+    from smart_applier.agents.job_matching_agent import JobMatchingAgent
+    from smart_applier.search.fulltext import candidate_ids, search_jobs
+    from smart_applier.utils.db_utils import bulk_upsert_scraped_jobs, get_scraped_jobs_by_ids
+
+    start = time.perf_counter()
+    for offset in range(0, args.jobs, 20000):
+        bulk_upsert_scraped_jobs(generate_jobs(min(20000, args.jobs - offset), seed=offset), notify=False)
+    print(f" Inserted {args.jobs} jobs (FTS5 kept in sync by triggers) in {time.perf_counter() - start:.1f}s")
+
+    # The full-scan approach pays the load on every query; "filter only"
+    # is the best case of a DataFrame kept in memory
+    load_ms, df = median_ms(lambda: load_dataframe(args.jobs), 1)
+
+    matcher = JobMatchingAgent()
+    profile_vec = matcher.embed_user_profile(generate_profile())
+
+    results = []
+    for query, location in QUERIES:
+        label = query + (f" @ {location}" if location else "")
+        filter_ms, hits = median_ms(lambda: pandas_filter(df, query, location), args.repeats)
+        fts_ms, fts_hits = median_ms(lambda: search_jobs(query, location, limit=args.jobs), args.repeats)
+        rows_ms, _ = median_ms(lambda: get_scraped_jobs_by_ids(candidate_ids(query, location)), args.repeats)
+
+        pandas_ids = set(hits["id"])
+        fts_ids = {job_id for job_id, _ in fts_hits}
+        agreement = len(pandas_ids & fts_ids) / len(pandas_ids) if pandas_ids else 1.0
+
+        # Hybrid match on the FTS candidates, as load_corpus_node + match_jobs do
+        candidates = pd.DataFrame(get_scraped_jobs_by_ids(candidate_ids(query, location)))
+        hybrid_ms = None
+        if not candidates.empty:
+            candidates["db_id"] = candidates["id"]
+            start = time.perf_counter()
+            embeddings = matcher.embed_jobs(candidates)
+            matcher.match_jobs(profile_vec.copy(), candidates, embeddings, top_k=10,
+                               user_id="bench_user", keyword_query=query)
+            hybrid_ms = round((time.perf_counter() - start) * 1000, 3)
+
+        results.append({
+            "query": label, "pandas_hits": len(pandas_ids), "fts_hits": len(fts_ids),
+            "agreement": round(agreement, 4), "pandas_load_plus_filter_ms": round(load_ms + filter_ms, 3),
+            "pandas_filter_only_ms": filter_ms, "fts_ids_ms": fts_ms, "fts_candidate_rows_ms": rows_ms,
+            "hybrid_match_ms": hybrid_ms,
+        })
+
+    print(f"\n pandas load of {args.jobs} jobs: {load_ms:.1f} ms")
+    for r in results:
+        print(f" {r['query']:<30} hits {r['pandas_hits']:>6}/{r['fts_hits']:<6} agree {r['agreement']:.1%}  "
+              f"pandas {r['pandas_load_plus_filter_ms']:>8.1f} ms (filter {r['pandas_filter_only_ms']:>7.1f})  "
+              f"FTS5 {r['fts_ids_ms']:>6.1f} ms (+rows {r['fts_candidate_rows_ms']:>6.1f})  "
+              f"hybrid match {r['hybrid_match_ms']} ms")
+    write_report("fulltext_search", {"args": vars(args), "pandas_load_ms": load_ms, "results": results}, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# src/benchmarks/import_time.py
+# Measure cold import time per module with `python -X importtime`.
+#
+#   cd src && python -m benchmarks.import_time --output import_times.json
+#   cd src && python -m benchmarks.import_time smart_applier.langgraph.subworkflows --top 15
+#
+# Each target is imported in a fresh interpreter, so results are cold-start
+# numbers. The report also lists which heavy dependencies each target drags in,
+# which is the regression we care about (e.g. torch loading for the resume flow).
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1]
+
+DEFAULT_TARGETS = [
+    "smart_applier.langgraph.nodes",
+    "smart_applier.langgraph.subworkflows",
+    "smart_applier.langgraph.workflow",
+    "smart_applier.utils.db_utils",
+    "smart_applier.agents.resume_builder_agent",
+    "smart_applier.agents.job_matching_agent",
+    "smart_applier.agents.skill_gap_agent",
+    "ui.page_6_dashboard",
+    "ui.page_2_resume_builder",
+    "ui.page_4_job_scraper",
+]
+
+HEAVY_MODULES = [
+    "torch",
+    "sentence_transformers",
+    "faiss",
+    "google.generativeai",
+    "reportlab",
+    "plotly",
+    "langgraph",
+    "pandas",
+]
+
+
+def measure(target: str):
+    """Import `target` in a fresh interpreter and parse the -X importtime log."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+    )
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        # "import time:       self [us] |  cumulative | imported package"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        parts = line.split(":", 1)[1].split("|")
+        if len(parts) != 3:
+            continue
+        self_us, cumulative_us, name = parts
+        modules[name.strip()] = {
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+        }
+
+    total_us = modules.get(target, {}).get("cumulative_us")
+    return {
+        "target": target,
+        "ok": proc.returncode == 0,
+        "error": proc.stderr.strip().splitlines()[-1] if proc.returncode != 0 else None,
+        "total_ms": round(total_us / 1000, 1) if total_us is not None else None,
+        "heavy_imports": [m for m in HEAVY_MODULES if m in modules],
+        "modules": modules,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-module cold import time")
+    parser.add_argument("targets", nargs="*", default=DEFAULT_TARGETS)
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list per target")
+    parser.add_argument("--output", default=None, help="write the full report as JSON")
+    args = parser.parse_args()
+
+    report = []
+    for target in args.targets:
+        result = measure(target)
+        report.append(result)
+
+        if not result["ok"]:
+            print(f"{target}: FAILED ({result['error']})")
+            continue
+
+        print(f"{target}: {result['total_ms']} ms | heavy: {', '.join(result['heavy_imports']) or '-'}")
+        slowest = sorted(
+            result["modules"].items(), key=lambda kv: kv[1]["self_us"], reverse=True
+        )[:args.top]
+        for name, timing in slowest:
+            print(f"    {timing['self_us'] / 1000:8.1f} ms  {name}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
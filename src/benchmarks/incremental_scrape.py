@@ -0,0 +1,88 @@
+# src/benchmarks/incremental_scrape.py
+# Full vs incremental (watermarked) refresh cost against the local stand-in.
+#
+#   cd src && python -m benchmarks.incremental_scrape --corpus 400 --new 0 5 25 60
+#
+# The stand-in serves a newest-first listing. After an initial scrape, each
+# round prepends `new` postings (shifting older ones to later pages, like the
+# live site) and refreshes once with scrape_karkidi(pages=max_pages) and once
+# with scrape_karkidi_incremental(max_pages). The scraper runs with the
+# default HTTP cache settings, so cached pages are revalidated (304s count
+# as requests) and every new posting must still be found.
+import argparse
+import os
+import time
+from datetime import date, timedelta
+
+from benchmarks.common import isolate_environment, write_report
+from benchmarks.karkidi_stub import start_stub_server, paginate
+from benchmarks.synthetic import generate_jobs
+
+
+def newest_first(jobs, posted_on: date = None):
+    """Sort like the live listing; `posted_on` dates a batch of fresh postings."""
+    if posted_on:
+        for job in jobs:
+            job["posted_on"] = posted_on.strftime("%d %b %Y")
+    return sorted(jobs, key=lambda j: date.fromisoformat(_iso(j["posted_on"])), reverse=True)
+
+
+def _iso(posted_on: str) -> str:
+    from datetime import datetime
+    return datetime.strptime(posted_on, "%d %b %Y").date().isoformat()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental scraping benchmark")
+    parser.add_argument("--corpus", type=int, default=400, help="postings on the site initially")
+    parser.add_argument("--new", type=int, nargs="+", default=[0, 5, 25, 60])
+    parser.add_argument("--jobs-per-page", type=int, default=20)
+    parser.add_argument("--max-pages", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=100)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    isolate_environment()
+    server, stub, base_url = start_stub_server(pages=0, latency_ms=args.latency_ms)
+    os.environ["KARKIDI_BASE_URL"] = base_url
+
+    from smart_applier.agents.job_scraper_agent import JobScraperAgent
+
+    listing = newest_first(generate_jobs(args.corpus, seed=1))
+    stub.pages = paginate(listing, args.jobs_per_page)
+    agent = JobScraperAgent(concurrency=4, rate_per_sec=50)
+    agent.scrape_karkidi_incremental(args.max_pages)
+
+    results = []
+    for round_no, n_new in enumerate(args.new, start=1):
+        fresh = newest_first(generate_jobs(n_new, seed=1000 + round_no), date(2025, 1, 1) + timedelta(days=round_no))
+        listing = fresh + listing
+        stub.pages = paginate(listing, args.jobs_per_page)
+
+        row = {"new_postings": n_new}
+        # Incremental first: the full pass would store the new postings
+        for mode in ("incremental", "full"):
+            before = stub.requests
+            start = time.perf_counter()
+            if mode == "full":
+                df = agent.scrape_karkidi(pages=args.max_pages)
+            else:
+                df = agent.scrape_karkidi_incremental(args.max_pages)
+            row[mode] = {
+                "seconds": round(time.perf_counter() - start, 3),
+                "requests": stub.requests - before,
+                "jobs_seen": len(df),
+                "new_stored": int(df["is_new"].sum()) if "is_new" in df else 0,
+            }
+        if row["incremental"]["new_stored"] != n_new:
+            print(f" WARNING: incremental refresh stored {row['incremental']['new_stored']} of {n_new} new postings")
+        results.append(row)
+        print(f" +{n_new:<4} new: full {row['full']['requests']} requests / {row['full']['seconds']}s, "
+              f"incremental {row['incremental']['requests']} requests / {row['incremental']['seconds']}s")
+
+    server.shutdown()
+    write_report("incremental_scrape", {"args": vars(args), "rounds": results}, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# src/benchmarks/karkidi_stub.py
+# Local stand-in for karkidi.com job listing pages.
+#
+#   cd src && python -m benchmarks.karkidi_stub --port 8765 --latency-ms 300
+#   KARKIDI_BASE_URL=http://127.0.0.1:8765 python -m ...   # point the scraper at it
+#
+# Serves /Find-Jobs/<page>/all/India either from saved pages
+# (--pages-dir with page_<n>.html files) or rendered from synthetic jobs in the
+# same markup the scraper parses. Pages carry ETag / Last-Modified headers and
+# answer conditional requests with 304 (disable with --no-validators).
+import argparse
+import hashlib
+import html
+import re
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from benchmarks.synthetic import generate_jobs
+
+PAGE_PATH = re.compile(r"^/Find-Jobs/(\d+)/all/India/?$")
+
+
+def render_job(job) -> str:
+    e = html.escape
+    return f"""
+<div class="ads-details">
+  <h4>{e(job['title'])}</h4>
+  <a href="/Employer-Profile/{e(job['company']).replace(' ', '-')}">{e(job['company'])}</a>
+  <p>{e(job['location'])}</p>
+  <p class="emp-exp">{e(job['experience'])}</p>
+  <div><span>Key Skills</span><p>{e(job['skills'])}</p></div>
+  <div><span>Summary</span><p>{e(job['summary'])}</p></div>
+  <div><span>Posted On</span><p>{e(job['posted_on'])}</p></div>
+</div>"""
+
+
+def render_jobs(page: int, jobs) -> bytes:
+    body = "\n".join(render_job(j) for j in jobs)
+    return f"<html><head><title>Find Jobs - page {page}</title></head><body>{body}</body></html>".encode("utf-8")
+
+
+def render_page(page: int, jobs_per_page: int = 20) -> bytes:
+    return render_jobs(page, generate_jobs(jobs_per_page, seed=page))
+
+
+def paginate(listing, jobs_per_page: int = 20):
+    """{page: html} for a newest-first list of jobs, like the live site."""
+    return {
+        page: render_jobs(page, listing[start:start + jobs_per_page])
+        for page, start in enumerate(range(0, len(listing), jobs_per_page), start=1)
+    }
+
+
+class KarkidiStub:
+    """Page store + request counters shared by the handler threads."""
+
+    def __init__(self, pages: int = 50, jobs_per_page: int = 20, pages_dir: str = None,
+                 latency_ms: float = 0, validators: bool = True, seed_offset: int = 0):
+        self.latency = latency_ms / 1000
+        self.validators = validators
+        self.last_modified = formatdate(time.time(), usegmt=True)
+        self.requests = 0
+        self.not_modified = 0
+        self.lock = threading.Lock()
+        self.pages = {}
+        if pages_dir:
+            for path in sorted(Path(pages_dir).glob("page_*.html")):
+                self.pages[int(path.stem.split("_")[1])] = path.read_bytes()
+        else:
+            for page in range(1, pages + 1):
+                # seed_offset gives a second stand-in different postings
+                self.pages[page] = render_page(page + seed_offset, jobs_per_page)
+
+    def handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with stub.lock:
+                    stub.requests += 1
+                if stub.latency:
+                    time.sleep(stub.latency)
+                match = PAGE_PATH.match(self.path)
+                content = stub.pages.get(int(match.group(1))) if match else None
+                if content is None:
+                    self.send_error(404)
+                    return
+                etag = '"' + hashlib.md5(content).hexdigest() + '"'
+                if stub.validators and self.headers.get("If-None-Match") == etag:
+                    with stub.lock:
+                        stub.not_modified += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                if stub.validators:
+                    self.send_header("ETag", etag)
+                    self.send_header("Last-Modified", stub.last_modified)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def start_stub_server(port: int = 0, **kwargs):
+    """Start the stand-in on a background thread. Returns (server, stub, base_url)."""
+    stub = KarkidiStub(**kwargs)
+    server = ThreadingHTTPServer(("127.0.0.1", port), stub.handler())
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, stub, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local karkidi.com stand-in")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--jobs-per-page", type=int, default=20)
+    parser.add_argument("--pages-dir", default=None, help="serve saved page_<n>.html files instead")
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--no-validators", action="store_true", help="omit ETag/Last-Modified")
+    args = parser.parse_args()
+
+    server, stub, base_url = start_stub_server(
+        args.port, pages=args.pages, jobs_per_page=args.jobs_per_page,
+        pages_dir=args.pages_dir, latency_ms=args.latency_ms,
+        validators=not args.no_validators,
+    )
+    print(f" Serving {len(stub.pages)} pages at {base_url}/Find-Jobs/<page>/all/India")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
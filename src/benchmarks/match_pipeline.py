@@ -0,0 +1,102 @@
+# src/benchmarks/match_pipeline.py
+# Offline benchmark of the scrape → match → skill-gap → resume pipeline.
+#
+#   cd src && python -m benchmarks.match_pipeline --sizes 100 10000 100000
+#   cd src && python -m benchmarks.match_pipeline --sizes 1000 --encoder sentence-transformers
+#
+# Runs against a throwaway data dir with Gemini disabled and synthetic jobs in
+# place of scraping, so no network is needed (with the default hashing encoder).
+import argparse
+
+from benchmarks.common import isolate_environment, use_encoder, StageTimer, write_report
+
+DEFAULT_SIZES = [100, 10_000, 100_000]
+
+
+def run_size(n_jobs: int, queries: int):
+    import numpy as np
+    import pandas as pd
+
+    from benchmarks.synthetic import generate_jobs, generate_profile
+    from smart_applier.agents.job_matching_agent import JobMatchingAgent
+    from smart_applier.agents.skill_gap_agent import SkillGapAgent
+    from smart_applier.agents.resume_builder_agent import ResumeBuilderAgent
+    from smart_applier.search.job_index import get_job_index
+    from smart_applier.utils.db_utils import bulk_insert_scraped_jobs
+
+    print(f"\n== {n_jobs} jobs ==")
+    timer = StageTimer()
+
+    jobs = generate_jobs(n_jobs, seed=n_jobs)
+    profile = generate_profile()
+    jobs_df = pd.DataFrame(jobs)
+
+    with timer.stage("db_insert_scraped_jobs", n_jobs):
+        jobs_df["db_id"] = bulk_insert_scraped_jobs(jobs)
+
+    matcher = JobMatchingAgent()
+
+    with timer.stage("preprocess_text", n_jobs):
+        for text in jobs_df["skills"].tolist():
+            matcher.preprocess_text(str(text))
+
+    with timer.stage("embed_jobs_cold_cache", n_jobs):
+        job_embeddings = matcher.embed_jobs(jobs_df)
+
+    with timer.stage("embed_jobs_warm_cache", n_jobs):
+        matcher.embed_jobs(jobs_df)
+
+    profile_vec = matcher.embed_user_profile(profile).reshape(1, -1)
+
+    with timer.stage("build_faiss_index", n_jobs):
+        index = matcher.build_faiss_index(job_embeddings.copy())
+
+    with timer.stage("faiss_search", queries):
+        for _ in range(queries):
+            index.search(profile_vec, 10)
+
+    job_index = get_job_index(matcher.model_name)
+    with timer.stage("job_index_add", n_jobs):
+        job_index.add(jobs_df["db_id"].tolist(), job_embeddings)
+
+    with timer.stage("job_index_search", queries):
+        for _ in range(queries):
+            job_index.search(profile_vec, 10)
+
+    with timer.stage("match_jobs", 1):
+        matcher.match_jobs(profile_vec[0].copy(), jobs_df, job_embeddings, top_k=10, user_id=profile["user_id"])
+
+    skill_agent = SkillGapAgent(profile, jobs_df)
+    with timer.stage("skill_gap_top_missing", n_jobs):
+        top_missing = skill_agent.get_top_missing_skills()
+
+    with timer.stage("build_resume", 1):
+        ResumeBuilderAgent(profile).build_resume()
+
+    return {
+        "jobs": n_jobs,
+        "embedding_dim": int(np.asarray(job_embeddings).shape[1]),
+        "top_missing_skills": top_missing,
+        "stages": timer.stages,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline match pipeline benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--queries", type=int, default=100, help="searches per search stage")
+    parser.add_argument("--encoder", choices=["hashing", "sentence-transformers"], default="hashing")
+    parser.add_argument("--data-dir", default=None, help="defaults to a fresh temp dir")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    data_dir = isolate_environment(args.data_dir)
+    use_encoder(args.encoder)
+    print(f" Benchmark data dir: {data_dir}")
+
+    results = [run_size(n, args.queries) for n in args.sizes]
+    write_report("match_pipeline", {"encoder": args.encoder, "runs": results}, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# src/benchmarks/pagination.py
+# Page latency by depth: LIMIT/OFFSET against the keyset pages of db_utils
+# (page_scraped_jobs), unfiltered, per company and inside a date window.
+#
+#   cd src && python -m benchmarks.pagination --jobs 200000
+#
+# OFFSET reads and throws away every row before the page, so it slows down
+# linearly with depth; a keyset page seeks to its cursor and should not.
+import argparse
+import statistics
+import time
+
+from benchmarks.common import isolate_environment, write_report
+
+DEPTHS = (0.0, 0.1, 0.5, 0.9)
+
+
+def median_ms(fn, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OFFSET vs keyset page latency by depth")
+    parser.add_argument("--jobs", type=int, default=200000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    isolate_environment()
+    from benchmarks.synthetic import generate_jobs
+    from smart_applier.database.connection import get_connection, transaction
+    from smart_applier.utils.db_utils import bulk_upsert_scraped_jobs, iter_pages, page_scraped_jobs
+
+    conn = get_connection()
+    for start in range(0, args.jobs, 20000):
+        bulk_upsert_scraped_jobs(generate_jobs(min(20000, args.jobs - start), seed=start), notify=False)
+    # Spread scrape times over a year, in id order like real inserts
+    per_day = max(1, args.jobs // 365)
+    with transaction() as tx:
+        tx.execute("UPDATE scraped_jobs SET scraped_at = datetime('2025-01-01', '-' || ((? - id) / ?) || ' days')",
+                   (args.jobs, per_day))
+    conn.execute("ANALYZE")
+
+    size = args.page_size
+    ids = [row["id"] for row in conn.execute("SELECT id FROM scraped_jobs ORDER BY id DESC")]
+    company = conn.execute("SELECT company FROM scraped_jobs GROUP BY company ORDER BY COUNT(*) DESC LIMIT 1"
+                           ).fetchone()["company"]
+    company_ids = [row["id"] for row in conn.execute(
+        "SELECT id FROM scraped_jobs WHERE company = ? ORDER BY id DESC", (company,))]
+    since, until = "2024-03-01", "2024-09-01"
+    window_ids = [row["id"] for row in conn.execute(
+        "SELECT id FROM scraped_jobs WHERE scraped_at >= ? AND scraped_at < ? ORDER BY id DESC", (since, until))]
+
+    # Correctness: walking every page returns every row exactly once, in order
+    walked = [row["id"] for row in iter_pages(page_scraped_jobs, limit=1000)]
+    assert walked == ids, "keyset pages do not cover the table"
+    walked = [row["id"] for row in iter_pages(page_scraped_jobs, limit=size, since=since, until=until)]
+    assert walked == window_ids, "keyset pages do not cover the date window"
+
+    def cursor(rows, offset):
+        # before_id that starts a page at `offset` rows deep
+        return rows[offset - 1] if offset else None
+
+    cases = {
+        "all": (ids, "", (), {}),
+        "company": (company_ids, "WHERE company = ?", (company,), {"company": company}),
+        "date_window": (window_ids, "WHERE scraped_at >= ? AND scraped_at < ?", (since, until),
+                        {"since": since, "until": until}),
+    }
+    results = {}
+    for case, (rows, where, params, filters) in cases.items():
+        results[case] = []
+        for depth in DEPTHS:
+            offset = min(int(len(rows) * depth), max(0, len(rows) - size))
+            offset_ms = median_ms(lambda: conn.execute(
+                f"SELECT * FROM scraped_jobs {where} ORDER BY id DESC LIMIT ? OFFSET ?",
+                (*params, size, offset)).fetchall(), args.repeats)
+            keyset_ms = median_ms(lambda: page_scraped_jobs(
+                before_id=cursor(rows, offset), limit=size, **filters), args.repeats)
+            results[case].append({"depth": depth, "offset": offset,
+                                  "offset_ms": offset_ms, "keyset_ms": keyset_ms})
+            print(f" {case:<12} depth {depth:>4.0%} (row {offset:>7,})  "
+                  f"OFFSET {offset_ms:>8.2f} ms   keyset {keyset_ms:>6.2f} ms")
+
+    write_report("pagination", {"args": vars(args), "results": results}, args.output)
+
+
+if __name__ == "__main__":
+    main()
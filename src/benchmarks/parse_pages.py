@@ -0,0 +1,82 @@
+# src/benchmarks/parse_pages.py
+# Equivalence check and speed comparison of the Karkidi page parsers.
+#
+#   cd src && python -m benchmarks.parse_pages --check-only      # exits 1 on any mismatch
+#   cd src && python -m benchmarks.parse_pages --pages 200 --processes 4
+#
+# The check compares the lxml parser to the BeautifulSoup reference on every
+# saved page under benchmarks/fixtures/karkidi plus rendered synthetic pages.
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from benchmarks.common import write_report
+from benchmarks.karkidi_stub import render_page
+from smart_applier.scraping.parsers import PARSERS, parse_pages
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "karkidi"
+
+
+def load_pages(n_synthetic: int, jobs_per_page: int):
+    pages = {path.name: path.read_bytes() for path in sorted(FIXTURES_DIR.glob("*.html"))}
+    for page in range(1, n_synthetic + 1):
+        pages[f"synthetic_{page}"] = render_page(page, jobs_per_page)
+    return pages
+
+
+def check_equivalence(pages) -> int:
+    reference, candidate = PARSERS["bs4"], PARSERS["lxml"]
+    mismatches = 0
+    for name, content in pages.items():
+        expected, got = reference(content), candidate(content)
+        if expected != got:
+            mismatches += 1
+            print(f" MISMATCH {name}: bs4={len(expected)} jobs, lxml={len(got)} jobs")
+            for a, b in zip(expected, got):
+                if a != b:
+                    print(f"   bs4:  {a}\n   lxml: {b}")
+                    break
+    print(f" Equivalence: {len(pages) - mismatches}/{len(pages)} pages identical")
+    return mismatches
+
+
+def time_parse(label, contents, parser, processes, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        jobs = sum(len(j) for j in parse_pages(contents, parser, processes))
+        best = min(best, time.perf_counter() - start)
+    print(f" {label:<22} {best:8.3f}s  {len(contents) / best:8.1f} pages/s  ({jobs} jobs)")
+    return {"parser": label, "seconds": round(best, 4), "pages_per_sec": round(len(contents) / best, 1),
+            "jobs": jobs}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Karkidi parser equivalence + benchmark")
+    parser.add_argument("--pages", type=int, default=100, help="synthetic pages")
+    parser.add_argument("--jobs-per-page", type=int, default=20)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--check-only", action="store_true")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages, args.jobs_per_page)
+    mismatches = check_equivalence(pages)
+    if args.check_only:
+        sys.exit(1 if mismatches else 0)
+
+    contents = list(pages.values())
+    runs = [
+        time_parse("bs4", contents, PARSERS["bs4"], 0, args.repeats),
+        time_parse("lxml", contents, PARSERS["lxml"], 0, args.repeats),
+        time_parse(f"bs4 x{args.processes} procs", contents, PARSERS["bs4"], args.processes, args.repeats),
+        time_parse(f"lxml x{args.processes} procs", contents, PARSERS["lxml"], args.processes, args.repeats),
+    ]
+    write_report("parse_pages", {"pages": len(contents), "mismatches": mismatches, "runs": runs}, args.output)
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# src/benchmarks/replay_load.py
+# Load test of scrape → embed → index → match → skill gap through the replay
+# job source, so 100k+ jobs flow through the real scraper code paths without
+# touching the network.
+#
+#   cd src && python -m benchmarks.replay_load --jobs 100000 --jobs-per-page 1000
+#   cd src && python -m benchmarks.replay_load --fixtures recorded/ --pages 200 --rate 50
+#
+# Without --fixtures, synthetic JSON fixtures are written to a temp dir. Pages
+# cycle through the fixtures, with each cycle's postings made distinct.
+import argparse
+import json
+import math
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import isolate_environment, use_encoder, StageTimer, write_report
+
+
+def write_fixtures(out_dir: Path, n_fixtures: int, jobs_per_page: int) -> Path:
+    from benchmarks.synthetic import generate_jobs
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    jobs = generate_jobs(n_fixtures * jobs_per_page, seed=17)
+    for i in range(n_fixtures):
+        page_jobs = jobs[i * jobs_per_page:(i + 1) * jobs_per_page]
+        (out_dir / f"page_{i + 1:03d}.json").write_text(json.dumps(page_jobs))
+    return out_dir
+
+
+def run(source, pages: int, queries: int):
+    import numpy as np
+
+    from benchmarks.synthetic import generate_profile
+    from smart_applier.agents.job_scraper_agent import JobScraperAgent
+    from smart_applier.agents.job_matching_agent import JobMatchingAgent
+    from smart_applier.agents.skill_gap_agent import SkillGapAgent
+    from smart_applier.search.job_index import get_job_index
+
+    timer = StageTimer()
+    profile = generate_profile()
+    scraper = JobScraperAgent(use_cache=False, sources=[source])
+
+    with timer.stage("scrape_replay", pages):
+        jobs_df = scraper.scrape(pages=pages)
+    n_jobs = len(jobs_df)
+
+    matcher = JobMatchingAgent()
+    with timer.stage("embed_jobs", n_jobs):
+        job_embeddings = matcher.embed_jobs(jobs_df)
+
+    job_index = get_job_index(matcher.model_name)
+    with timer.stage("job_index_add", n_jobs):
+        job_index.add(jobs_df["db_id"].tolist(), job_embeddings)
+
+    profile_vec = matcher.embed_user_profile(profile).reshape(1, -1)
+    with timer.stage("job_index_search", queries):
+        for _ in range(queries):
+            job_index.search(profile_vec, 10)
+
+    with timer.stage("match_jobs", 1):
+        matcher.match_jobs(profile_vec[0].copy(), jobs_df, job_embeddings, top_k=10, user_id=profile["user_id"])
+
+    skill_agent = SkillGapAgent(profile, jobs_df)
+    with timer.stage("skill_gap_top_missing", n_jobs):
+        top_missing = skill_agent.get_top_missing_skills()
+
+    return {
+        "source": source.describe(),
+        "pages": pages,
+        "jobs": n_jobs,
+        "new_jobs": int(jobs_df["is_new"].sum()) if "is_new" in jobs_df else 0,
+        "embedding_dim": int(np.asarray(job_embeddings).shape[1]),
+        "top_missing_skills": top_missing,
+        "stages": timer.stages,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay-source load test of the scrape-to-skill-gap pipeline")
+    parser.add_argument("--jobs", type=int, default=100_000, help="target job volume (sets --pages)")
+    parser.add_argument("--pages", type=int, default=None)
+    parser.add_argument("--jobs-per-page", type=int, default=1000, help="synthetic fixture size")
+    parser.add_argument("--fixture-pages", type=int, default=10, help="synthetic fixtures to cycle through")
+    parser.add_argument("--fixtures", default=None, help="recorded .html/.json fixtures (default: synthetic)")
+    parser.add_argument("--rate", type=float, default=None, help="replayed pages per second (default: unthrottled)")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--encoder", choices=["hashing", "sentence-transformers"], default="hashing")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    data_dir = isolate_environment()
+    use_encoder(args.encoder)
+    print(f" Benchmark data dir: {data_dir}")
+
+    from smart_applier.scraping.sources import ReplaySource
+
+    fixtures = Path(args.fixtures) if args.fixtures else write_fixtures(
+        Path(tempfile.mkdtemp(prefix="replay_fixtures_")), args.fixture_pages, args.jobs_per_page)
+    source = ReplaySource(fixtures, rate_per_sec=args.rate)
+    pages = args.pages or max(1, math.ceil(args.jobs / args.jobs_per_page))
+
+    result = run(source, pages, args.queries)
+    print(f" Replayed {result['jobs']} jobs from {pages} pages")
+    write_report("replay_load", {"args": vars(args), "run": result}, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# src/benchmarks/scrape_fetch.py
+# Page-fetch throughput of JobScraperAgent against the local karkidi stand-in.
+#
+#   cd src && python -m benchmarks.scrape_fetch --pages 10 --latency-ms 300
+#   cd src && python -m benchmarks.scrape_fetch --modes 1:1 4:2 8:8 8:20
+#
+# Each mode is concurrency:rate (requests/second per host). 1:1 approximates
+# the old sequential fetch with a one-second pause between pages. Mode runs
+# bypass the HTTP cache; a final section times full scrape_karkidi runs with a
+# cold cache, a revalidating (304) cache and a fresh (within TTL) cache.
+import argparse
+import os
+import time
+
+from benchmarks.common import isolate_environment, write_report
+from benchmarks.karkidi_stub import start_stub_server
+
+DEFAULT_MODES = ["1:1", "4:1", "4:4", "8:8", "8:20"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scraper fetch throughput benchmark")
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=300, help="simulated server round trip")
+    parser.add_argument("--modes", nargs="+", default=DEFAULT_MODES)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    isolate_environment()
+    server, stub, base_url = start_stub_server(pages=args.pages, latency_ms=args.latency_ms)
+    os.environ["KARKIDI_BASE_URL"] = base_url
+
+    from smart_applier.agents.job_scraper_agent import JobScraperAgent
+
+    results = []
+    for mode in args.modes:
+        concurrency, rate = mode.split(":")
+        agent = JobScraperAgent(concurrency=int(concurrency), rate_per_sec=float(rate), use_cache=False)
+        urls = [agent.base_url.format(page=p) for p in range(1, args.pages + 1)]
+
+        start = time.perf_counter()
+        fetched = agent.fetcher.fetch_all(urls)
+        fetch_seconds = time.perf_counter() - start
+        jobs = sum(len(agent.parse_jobs(r.content)) for r in fetched if r.ok)
+
+        results.append({
+            "concurrency": int(concurrency),
+            "rate_per_sec": float(rate),
+            "pages": args.pages,
+            "ok_pages": sum(r.ok for r in fetched),
+            "jobs": jobs,
+            "seconds": round(fetch_seconds, 3),
+            "pages_per_sec": round(args.pages / fetch_seconds, 2),
+        })
+        print(f" concurrency={concurrency:<3} rate={rate:<4}/s  {fetch_seconds:7.2f}s  "
+              f"{args.pages / fetch_seconds:6.2f} pages/s  ({jobs} jobs)")
+
+    cache_runs = run_cache_passes(args.pages, stub)
+    server.shutdown()
+    write_report("scrape_fetch", {"latency_ms": args.latency_ms, "runs": results,
+                                  "cache_runs": cache_runs}, args.output)
+
+
+def run_cache_passes(pages: int, stub):
+    from smart_applier.agents.job_scraper_agent import JobScraperAgent
+
+    agent = JobScraperAgent(concurrency=8, rate_per_sec=20, use_cache=True)
+    agent.cache.clear()
+    runs = []
+    # ttl=0 forces a conditional request on the second pass
+    for name, ttl in [("cold", 0), ("revalidate_304", 0), ("fresh_within_ttl", 3600)]:
+        agent.cache.ttl_seconds = ttl
+        requests_before = stub.requests
+        start = time.perf_counter()
+        df = agent.scrape_karkidi(pages=pages)
+        seconds = time.perf_counter() - start
+        runs.append({
+            "pass": name,
+            "seconds": round(seconds, 3),
+            "jobs": len(df),
+            "server_requests": stub.requests - requests_before,
+            "cache": agent.cache.stats(),
+        })
+        print(f" {name:<18} {seconds:7.3f}s  {stub.requests - requests_before} requests")
+    return runs
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# src/benchmarks/stream_pipeline.py
+# Sequential vs streaming scrape → embed → index → match, against the local
+# karkidi stand-in.
+#
+#   cd src && python -m benchmarks.stream_pipeline --pages 10 --latency-ms 400 --encode-ms 5
+#
+# The sequential run mirrors build_job_scraper_workflow (scrape everything,
+# then embed, then match); the streaming run uses stream_scrape_and_match.
+# --encode-ms adds a per-text cost to the offline hashing encoder so the
+# embed stage weighs like a real model on CPU.
+import argparse
+import os
+import time
+
+from benchmarks.common import isolate_environment, HashingEncoder, write_report
+from benchmarks.karkidi_stub import start_stub_server
+
+
+class TimedHashingEncoder(HashingEncoder):
+    def __init__(self, encode_ms: float):
+        super().__init__()
+        self.encode_ms = encode_ms
+
+    def encode(self, sentences, batch_size: int = 32, **kwargs):
+        n = 1 if isinstance(sentences, str) else len(sentences)
+        time.sleep(n * self.encode_ms / 1000)
+        return super().encode(sentences, batch_size=batch_size, **kwargs)
+
+
+def run_sequential(pages, profile, rate):
+    from smart_applier.agents.job_scraper_agent import JobScraperAgent
+    from smart_applier.agents.job_matching_agent import JobMatchingAgent
+
+    start = time.perf_counter()
+    scraper = JobScraperAgent(concurrency=8, rate_per_sec=rate, use_cache=False)
+    matcher = JobMatchingAgent()
+    df = scraper.scrape_karkidi(pages=pages)
+    scrape_seconds = time.perf_counter() - start
+    vecs = matcher.embed_jobs(df)
+    profile_vec = matcher.embed_user_profile(profile)
+    matcher.match_jobs(profile_vec, df, vecs, top_k=10, user_id=profile["user_id"])
+    total = time.perf_counter() - start
+    return {"mode": "sequential", "jobs": len(df), "scrape_seconds": round(scrape_seconds, 3),
+            "first_matches_seconds": round(total, 3), "total_seconds": round(total, 3)}
+
+
+def run_streaming(pages, profile, rate, batch_size):
+    from smart_applier.agents.job_scraper_agent import JobScraperAgent
+    from smart_applier.agents.job_matching_agent import JobMatchingAgent
+    from smart_applier.search.streaming import stream_scrape_and_match
+
+    start = time.perf_counter()
+    scraper = JobScraperAgent(concurrency=8, rate_per_sec=rate, use_cache=False)
+    matcher = JobMatchingAgent()
+    profile_vec = matcher.embed_user_profile(profile)
+    result = stream_scrape_and_match(pages, profile_vec, top_k=10, user_id=profile["user_id"],
+                                     scraper=scraper, matcher=matcher, batch_size=batch_size)
+    total = time.perf_counter() - start
+    return {"mode": "streaming", "jobs": len(result.jobs_df), "batches": result.batches,
+            "scrape_seconds": result.timings["scrape_seconds"],
+            "first_matches_seconds": result.timings.get("first_matches_seconds"),
+            "total_seconds": round(total, 3), "timings": result.timings}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sequential vs streaming scrape-to-match")
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=400)
+    parser.add_argument("--rate", type=float, default=4, help="requests/second to the stand-in")
+    parser.add_argument("--encode-ms", type=float, default=5, help="simulated encoder cost per text")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    isolate_environment()
+    from smart_applier.embeddings.model_registry import get_model_registry
+    from benchmarks.synthetic import generate_profile
+
+    registry = get_model_registry()
+    registry.clear()
+    registry.loader = lambda model_name: TimedHashingEncoder(args.encode_ms)
+    profile = generate_profile()
+
+    runs = []
+    # Each mode gets its own postings so neither benefits from the other's caches
+    for offset, runner in [(0, lambda: run_sequential(args.pages, profile, args.rate)),
+                           (10_000, lambda: run_streaming(args.pages, profile, args.rate, args.batch_size))]:
+        server, _, base_url = start_stub_server(pages=args.pages, latency_ms=args.latency_ms, seed_offset=offset)
+        os.environ["KARKIDI_BASE_URL"] = base_url
+        runs.append(runner())
+        server.shutdown()
+
+    for run in runs:
+        print(f" {run['mode']:<11} {run['jobs']} jobs  scrape={run['scrape_seconds']:.2f}s  "
+              f"first matches={run['first_matches_seconds']:.2f}s  total={run['total_seconds']:.2f}s")
+    write_report("stream_pipeline", {"args": vars(args), "runs": runs}, args.output)
+
+
+if __name__ == "__main__":
+    main()
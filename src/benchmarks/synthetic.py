@@ -0,0 +1,87 @@
+# src/benchmarks/synthetic.py
+# Synthetic profiles and Karkidi-shaped job postings for offline benchmarks.
+import random
+from datetime import date, timedelta
+from typing import List, Dict, Any
+
+SKILLS = [
+    "python", "sql", "power bi", "tableau", "excel", "machine learning", "deep learning",
+    "nlp", "computer vision", "aws", "azure", "gcp", "docker", "kubernetes", "spark",
+    "hadoop", "airflow", "pandas", "numpy", "statistics", "r", "java", "javascript",
+    "react", "node.js", "django", "flask", "fastapi", "git", "linux", "terraform",
+    "snowflake", "dbt", "kafka", "mongodb", "postgresql", "communication", "leadership",
+    "agile", "scrum", "data visualization", "etl", "mlops", "pytorch", "tensorflow",
+]
+TITLES = [
+    "Data Analyst", "Data Scientist", "Machine Learning Engineer", "Backend Developer",
+    "Cloud Engineer", "BI Developer", "Data Engineer", "Full Stack Developer",
+    "DevOps Engineer", "Business Analyst", "NLP Engineer", "Software Engineer",
+]
+COMPANIES = [f"Company {i}" for i in range(1, 301)]
+CITIES = ["Bangalore", "Chennai", "Hyderabad", "Pune", "Mumbai", "Kochi", "Delhi", "Remote"]
+FILLER = (
+    "responsible for building scalable solutions working with cross functional teams "
+    "delivering insights to stakeholders in a fast paced environment with strong ownership"
+).split()
+
+
+def generate_jobs(n: int, seed: int = 42) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    today = date(2025, 1, 1)
+    jobs = []
+    for i in range(n):
+        skills = rng.sample(SKILLS, rng.randint(3, 9))
+        title = rng.choice(TITLES)
+        summary = " ".join(
+            [f"We are hiring a {title.lower()} skilled in {', '.join(skills[:3])}."]
+            + rng.choices(FILLER, k=rng.randint(10, 40))
+        )
+        jobs.append({
+            "title": title,
+            "company": rng.choice(COMPANIES),
+            "location": rng.choice(CITIES),
+            "experience": f"{rng.randint(0, 5)}-{rng.randint(6, 12)} years",
+            "skills": ", ".join(skills),
+            "summary": f"{summary} (ref {i})",
+            "posted_on": (today - timedelta(days=rng.randint(0, 120))).strftime("%d %b %Y"),
+            "scraped_at": today.isoformat(),
+        })
+    return jobs
+
+
+def generate_profile(seed: int = 7, user_id: str = None) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    skills = rng.sample(SKILLS, 10)
+    return {
+        "user_id": user_id or f"bench_user_{seed}",
+        "personal": {
+            "name": f"Bench User {seed}",
+            "email": f"bench{seed}@example.com",
+            "phone": "+91 90000 00000",
+            "location": rng.choice(CITIES),
+            "linkedin": "https://linkedin.com/in/bench",
+            "github": "https://github.com/bench",
+        },
+        "summary": "Analytical engineer focused on data products.",
+        "education": [{"degree": "MSc Data Analytics", "institution": "DUK", "year": "2025"}],
+        "skills": {
+            "Technical": skills[:6],
+            "Tools": skills[6:9],
+            "Soft": skills[9:],
+        },
+        "projects": [
+            {
+                "title": f"Project {k}",
+                "description": f"Built a pipeline using {', '.join(rng.sample(skills, 3))}.",
+                "skills": rng.sample(skills, 3),
+            }
+            for k in range(3)
+        ],
+        "experience": [{"title": "Intern", "description": "Dashboards and ETL jobs."}],
+        "achievements": ["Hackathon finalist"],
+        "certificates": [{"name": "Cloud Practitioner", "source": "AWS"}],
+    }
+
+
+def generate_profiles(n: int, seed: int = 7) -> List[Dict[str, Any]]:
+    return [generate_profile(seed + i) for i in range(n)]
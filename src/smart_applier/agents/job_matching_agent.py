@@ -1,20 +1,33 @@
 # src/smart_applier/agents/job_matching_agent.py
 
 from pathlib import Path
+from typing import Dict
+import json
 import pandas as pd
 import numpy as np
 import string
+import weakref
 import faiss
-from sentence_transformers import SentenceTransformer
 
+from smart_applier.embeddings.embedding_cache import get_embedding_cache
+from smart_applier.embeddings.model_registry import acquire_model, release_model, embedding_key
+from smart_applier.search import fulltext
+from smart_applier.search.job_index import get_job_index
 from smart_applier.utils.path_utils import get_data_dirs
-from smart_applier.utils.db_utils import insert_top_matched
+from smart_applier.utils.db_utils import (
+    insert_top_matched_many,
+    get_scraped_jobs_by_ids,
+    list_profiles,
+)
 
 
 class JobMatchingAgent:
     def __init__(self, model_name="all-MiniLM-L6-v2"):
-        # SentenceTransformer for embeddings
-        self.model = SentenceTransformer(model_name)
+        # SentenceTransformer for embeddings (shared via the model registry)
+        self.model_name = model_name
+        self.embedding_key = embedding_key(model_name)
+        self.model = acquire_model(model_name)
+        weakref.finalize(self, release_model, model_name)
 
         paths = get_data_dirs()
         self.profiles_dir = paths["profiles"]
@@ -34,7 +47,8 @@ class JobMatchingAgent:
     # ---------------------------------------------------
     # USER PROFILE → VECTOR
     # ---------------------------------------------------
-    def embed_user_profile(self, profile: dict):
+    @classmethod
+    def profile_text(cls, profile: dict) -> str:
         # collect skills
         skills_text = " ".join(
             " ".join(skill_list)
@@ -51,10 +65,11 @@ class JobMatchingAgent:
         achievements_text = " ".join(profile.get("achievements", []))
 
         combined = " ".join([skills_text, projects_text, achievements_text])
-        combined = self.preprocess_text(combined)
+        return cls.preprocess_text(combined)
 
+    def embed_user_profile(self, profile: dict):
         # FIX — ensure float32
-        return self.model.encode(combined, convert_to_numpy=True).astype("float32")
+        return self.model.encode(self.profile_text(profile), convert_to_numpy=True).astype("float32")
 
     # ---------------------------------------------------
     # JOBS TEXT → VECTOR
@@ -70,8 +85,12 @@ class JobMatchingAgent:
             )
             job_texts.append(self.preprocess_text(str(text)))
 
-        # FIX — ensure float32 embeddings
-        return self.model.encode(job_texts, convert_to_numpy=True).astype("float32")
+        # Only texts not seen before (for this model) reach model.encode
+        cache = get_embedding_cache()
+        embeddings = cache.encode(self.model, self.embedding_key, job_texts)
+        stats = cache.stats()
+        print(f" Embedding cache: {stats['hits']} hits, {stats['misses']} misses, {stats['entries']} entries")
+        return embeddings
 
     # ---------------------------------------------------
     # FAISS INDEX
@@ -86,6 +105,29 @@ class JobMatchingAgent:
         index.add(job_embeddings)
         return index
 
+    def search_job_index(self, profile_vector: np.ndarray, jobs_df: pd.DataFrame,
+                         job_embeddings: np.ndarray, top_k: int):
+        """
+        Search the persistent corpus index, restricted to the jobs in `jobs_df`.
+        Returns (D, I) like a FAISS search, with I as row positions in `jobs_df`.
+        """
+        job_index = get_job_index(self.model_name)
+        db_ids = jobs_df["db_id"].astype("int64").tolist()
+
+        # Normally a no-op: rows are indexed when they're inserted
+        job_index.add(db_ids, job_embeddings)
+
+        scores, hit_ids = job_index.search(profile_vector, top_k, restrict_ids=db_ids)
+
+        position = {}
+        for pos, db_id in enumerate(db_ids):
+            position.setdefault(db_id, pos)
+
+        found = hit_ids[0] >= 0
+        I = np.array([[position[int(i)] for i in hit_ids[0][found]]], dtype="int64")
+        D = scores[:, found]
+        return D, I
+
     # ---------------------------------------------------
     # MAIN MATCHING LOGIC
     # ---------------------------------------------------
@@ -95,8 +137,16 @@ class JobMatchingAgent:
         jobs_df: pd.DataFrame,
         job_embeddings: np.ndarray,
         top_k=10,
-        user_id: str = None
+        user_id: str = None,
+        keyword_query: str = None,
+        lexical_weight: float = None,
     ):
+        """
+        With `keyword_query`, only jobs the full-text index finds for it are
+        candidates (every hit, however low its BM25 rank; only the final
+        ranking is cut to top_k), and their score is the BM25 + cosine blend
+        of fulltext.fuse_scores (lexical_weight 0 keeps the plain cosine).
+        """
 
         if job_embeddings.shape[0] == 0:
             raise ValueError(" No job embeddings available.")
@@ -108,22 +158,110 @@ class JobMatchingAgent:
         # normalize profile vector
         faiss.normalize_L2(profile_vector.reshape(1, -1))
 
-        index = self.build_faiss_index(job_embeddings)
-        D, I = index.search(profile_vector.reshape(1, -1), top_k)
+        lexical = None
+        if keyword_query and "db_id" in jobs_df.columns:
+            try:
+                lexical = fulltext.lexical_scores(keyword_query)
+            except fulltext.FullTextUnavailable as e:
+                print(f" Keyword filter skipped: {e}")
+        elif keyword_query:
+            print(" WARNING: db_id column missing in jobs_df. Keyword filter skipped.")
+
+        search_k = top_k
+        if lexical is not None:
+            keep = jobs_df["db_id"].isin(list(lexical)).to_numpy()
+            jobs_df = jobs_df[keep].reset_index(drop=True)
+            job_embeddings = job_embeddings[keep]
+            print(f" Keyword filter '{keyword_query}': {len(jobs_df)} candidate jobs")
+            if jobs_df.empty:
+                return jobs_df.assign(match_score=pd.Series(dtype="float32"))
+            if lexical_weight is None:
+                lexical_weight = fulltext.LEXICAL_WEIGHT
+            if lexical_weight > 0:
+                # Rank every candidate: the fused order differs from the cosine one
+                search_k = len(jobs_df)
+
+        D = I = None
+        if "db_id" in jobs_df.columns:
+            try:
+                D, I = self.search_job_index(profile_vector, jobs_df, job_embeddings, search_k)
+            except Exception as e:
+                print(f" Persistent job index unavailable, using in-memory index: {e}")
+
+        if I is None:
+            index = self.build_faiss_index(job_embeddings)
+            D, I = index.search(profile_vector.reshape(1, -1), search_k)
+
+        if lexical is not None and lexical_weight > 0:
+            db_ids = jobs_df["db_id"].to_numpy()[I[0]]
+            fused = fulltext.fuse_scores(D[0], [lexical[int(i)] for i in db_ids], lexical_weight)
+            order = np.argsort(-fused, kind="stable")[:top_k]
+            I, D = I[:, order], fused[order].reshape(1, -1)
 
         matched = jobs_df.iloc[I[0]].copy().reset_index(drop=True)
         matched["match_score"] = D[0].round(4)
 
-        # SAVE MATCHES FOR DASHBOARD
+        # SAVE MATCHES FOR DASHBOARD (all top-k rows in one transaction)
         if "db_id" in jobs_df.columns:
-            for rank, idx in enumerate(I[0]):
-                try:
-                    db_id = int(jobs_df.iloc[idx]["db_id"])
-                    score = float(D[0][rank])
-                    insert_top_matched(job_id=db_id, user_id=user_id, score=score)
-                except Exception as e:
-                    print(" Failed to save top match:", e)
+            try:
+                db_ids = jobs_df["db_id"].to_numpy()[I[0]]
+                insert_top_matched_many([
+                    (int(db_id), user_id, float(score)) for db_id, score in zip(db_ids, D[0])
+                ])
+            except Exception as e:
+                print(" Failed to save top matches:", e)
         else:
             print(" WARNING: db_id column missing in jobs_df. Top matches not saved.")
 
         return matched
+
+    # ---------------------------------------------------
+    # BATCHED MULTI-PROFILE MATCHING
+    # ---------------------------------------------------
+    def match_jobs_batch(self, profiles: Dict[str, dict], top_k=10, restrict_ids=None):
+        """
+        Match many profiles against the persistent job index at once:
+        one encode call for all profiles, one matrix search, and a single
+        transaction for every top_matched_jobs row.
+        Returns {user_id: matched DataFrame}.
+        """
+        if not profiles:
+            return {}
+
+        job_index = get_job_index(self.model_name)
+        if job_index.ntotal == 0:
+            raise ValueError(" Job index is empty — scrape jobs first.")
+
+        user_ids = list(profiles)
+        texts = [self.profile_text(profiles[user_id]) for user_id in user_ids]
+        vectors = self.model.encode(texts, convert_to_numpy=True).astype("float32")
+
+        D, I = job_index.search(vectors, top_k, restrict_ids=restrict_ids)
+
+        hit_ids = sorted({int(job_id) for job_id in I.ravel() if job_id >= 0})
+        jobs_by_id = {job["id"]: job for job in get_scraped_jobs_by_ids(hit_ids)}
+
+        results = {}
+        match_rows = []
+        for q, user_id in enumerate(user_ids):
+            matched = []
+            for score, job_id in zip(D[q], I[q]):
+                job = jobs_by_id.get(int(job_id))
+                if job is None:
+                    continue
+                matched.append({**job, "db_id": job["id"], "match_score": round(float(score), 4)})
+                match_rows.append((int(job_id), user_id, float(score)))
+            results[user_id] = pd.DataFrame(matched)
+
+        insert_top_matched_many(match_rows)
+        print(f" Batch matching: {len(user_ids)} profiles, {len(match_rows)} matches saved")
+        return results
+
+    def match_all_stored_profiles(self, top_k=10, restrict_ids=None):
+        """Refresh top matches for every saved profile in one batch."""
+        profiles = {
+            row["user_id"]: json.loads(row["data_json"])
+            for row in list_profiles()
+            if row.get("data_json")
+        }
+        return self.match_jobs_batch(profiles, top_k=top_k, restrict_ids=restrict_ids)
@@ -1,77 +1,277 @@
 # src/smart_applier/agents/job_scraper_agent.py
-from typing import List, Dict, Any
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 import pandas as pd
-from bs4 import BeautifulSoup
-import requests
-import time
-from datetime import datetime
-from smart_applier.utils.db_utils import bulk_insert_scraped_jobs
+import os
+from datetime import datetime, date
+from smart_applier.scraping.fetcher import PageFetcher
+from smart_applier.scraping.http_cache import get_response_cache
+from smart_applier.scraping.parsers import get_parser, parse_pages
+from smart_applier.scraping.sources import JobSource, KarkidiSource, build_sources
+from smart_applier.utils.db_utils import (
+    bulk_upsert_scraped_jobs,
+    get_scraped_jobs_by_ids,
+    get_scrape_watermark,
+    set_scrape_watermark,
+)
+from smart_applier.utils.job_fingerprint import job_fingerprint
+
+# Depth limit for incremental scrapes, which normally stop much earlier
+DEFAULT_MAX_PAGES = int(os.getenv("SCRAPER_MAX_PAGES", "10"))
+
+
+def parse_posted_on(value) -> Optional[date]:
+    """Karkidi dates look like '12 Oct 2025'; watermarks are stored as ISO dates."""
+    if not value:
+        return None
+    for fmt in ("%d %b %Y", "%d %B %Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(str(value).strip(), fmt).date()
+        except ValueError:
+            continue
+    return None
+
 
 class JobScraperAgent:
-    def __init__(self):
+    def __init__(self, concurrency: int = None, rate_per_sec: float = None, use_cache: bool = None,
+                 parser: str = None, parse_processes: int = None, sources: List[JobSource] = None):
         self.headers = {'User-Agent': 'Mozilla/5.0'}
-        self.base_url = "https://www.karkidi.com/Find-Jobs/{page}/all/India"
+        if use_cache is None:
+            use_cache = os.getenv("SCRAPER_HTTP_CACHE", "1").lower() in ("1", "true", "yes")
+        self.cache = get_response_cache() if use_cache else None
+        # Pages are fetched concurrently over one keep-alive session, throttled
+        # per host by a token bucket
+        self.fetcher = PageFetcher(self.headers, concurrency=concurrency,
+                                   rate_per_sec=rate_per_sec, cache=self.cache)
+        # lxml/XPath by default (SCRAPER_PARSER), optionally in worker processes
+        self.parser = get_parser(parser)
+        self.parse_processes = parse_processes
 
-    def scrape_karkidi(self, pages: int = 3) -> pd.DataFrame:
-        jobs_list: List[Dict[str, Any]] = []
+        self.karkidi = KarkidiSource(self.fetcher, self.parser)
+        self.base_url = self.karkidi.url_template
+        # JOB_SOURCES, e.g. "karkidi" or "karkidi,replay:/data/fixtures@50"
+        self.sources = sources or build_sources(os.getenv("JOB_SOURCES", "karkidi"), self.fetcher, self.parser)
 
-        for page in range(1, pages + 1):
-            url = self.base_url.format(page=page)
-            print(f" Scraping page {page}: {url}")
+    def parse_jobs(self, content: bytes) -> List[Dict[str, Any]]:
+        return self._stamp(self.parser(content))
 
-            try:
-                response = requests.get(url, headers=self.headers, timeout=10)
-                if response.status_code != 200:
-                    print(f"Failed to fetch page {page}: {response.status_code}")
-                    continue
+    @staticmethod
+    def _stamp(jobs: List[Dict[str, Any]], source: JobSource = None) -> List[Dict[str, Any]]:
+        scraped_at = datetime.now().isoformat()
+        for job in jobs:
+            job["scraped_at"] = scraped_at
+            if source is not None:
+                job["source"] = source.name
+        return jobs
 
-                soup = BeautifulSoup(response.content, "html.parser")
-                job_blocks = soup.find_all("div", class_="ads-details")
-
-                for job in job_blocks:
-                    try:
-                        title = job.find("h4").get_text(strip=True) if job.find("h4") else ""
-                        company_tag = job.find("a", href=lambda x: x and "Employer-Profile" in x)
-                        company = company_tag.get_text(strip=True) if company_tag else "Unknown Company"
-                        location = job.find("p").get_text(strip=True) if job.find("p") else ""
-                        experience_tag = job.find("p", class_="emp-exp")
-                        experience = experience_tag.get_text(strip=True) if experience_tag else ""
-                        key_skills_tag = job.find("span", string="Key Skills")
-                        skills = key_skills_tag.find_next("p").get_text(strip=True) if key_skills_tag else ""
-                        summary_tag = job.find("span", string="Summary")
-                        summary = summary_tag.find_next("p").get_text(strip=True) if summary_tag else ""
-                        posted_tag = job.find("span", string="Posted On")
-                        posted_date = posted_tag.find_next("p").get_text(strip=True) if posted_tag else ""
-
-                        jobs_list.append({
-                            "title": title,
-                            "company": company,
-                            "location": location,
-                            "experience": experience,
-                            "skills": skills,
-                            "summary": summary,
-                            "posted_on": posted_date,
-                            "scraped_at": datetime.now().isoformat()
-                        })
-                    except Exception as e:
-                        print(f" Error parsing job block: {e}")
-                        continue
-
-                time.sleep(1)
-
-            except Exception as e:
-                print(f" Error fetching page {page}: {e}")
+    # ---------------------------------------------------
+    # FULL SCRAPE
+    # ---------------------------------------------------
+    def scrape(self, pages: int = 3) -> pd.DataFrame:
+        """Scrape `pages` pages from every configured source."""
+        frames = [self.scrape_source(source, pages) for source in self.sources]
+        frames = [df for df in frames if not df.empty]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def scrape_karkidi(self, pages: int = 3) -> pd.DataFrame:
+        return self.scrape_source(self.karkidi, pages)
+
+    def scrape_source(self, source: JobSource, pages: int = 3) -> pd.DataFrame:
+        print(f" Scraping {pages} pages from {source.describe()}")
+
+        # (url, jobs, already_stored) per page; results keep page order
+        page_jobs = []
+        to_parse = []
+        for page, result in enumerate(source.fetch_pages(pages), start=1):
+            cached_jobs = self._check_result(page, result)
+            if cached_jobs is False:
                 continue
+            if cached_jobs is not None:
+                page_jobs.append((result.url, cached_jobs, True))
+            else:
+                page_jobs.append((result.url, None, False))
+                to_parse.append((len(page_jobs) - 1, page, result.content))
 
-        df_jobs = pd.DataFrame(jobs_list)
-        print(f" Scraper Agent: fetched {len(df_jobs)} jobs total")
+        parsed = parse_pages([content for _, _, content in to_parse], source.parser, self.parse_processes)
+        for (slot, page, _), jobs in zip(to_parse, parsed):
+            page_jobs[slot] = (page_jobs[slot][0], self._stamp(source.finalize(page, jobs), source), False)
 
-        if df_jobs.empty:
-            return df_jobs
+        new_jobs = self._store_pages(source, page_jobs)
 
-        # Save to DB and get actual DB IDs
-        inserted_ids = bulk_insert_scraped_jobs(jobs_list)
-        df_jobs["db_id"] = inserted_ids
-        print(f" Assigned DB IDs to scraped jobs ({len(inserted_ids)} rows)")
+        jobs_list = [job for _, jobs, _ in page_jobs for job in jobs]
+        df_jobs = pd.DataFrame(jobs_list)
+        print(f" Scraper Agent: fetched {len(df_jobs)} jobs total from {source.name} "
+              f"({len(jobs_list) - len(new_jobs)} from unchanged pages)")
+        if self.cache and isinstance(source, KarkidiSource):
+            print(f" HTTP cache: {self.cache.stats()}")
 
         return df_jobs
+
+    # ---------------------------------------------------
+    # STREAMING SCRAPE
+    # ---------------------------------------------------
+    def iter_scrape(self, pages: int = 3, notify: bool = True) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Streaming variant of scrape: yields (page, jobs) as soon as each page
+        is fetched, parsed and stored, in completion order (sources one after
+        another). Jobs carry their db_id. notify=False skips the scraped-jobs
+        listeners (index append) for callers that embed and index the jobs
+        themselves.
+        """
+        for source in self.sources:
+            yield from self.iter_scrape_source(source, pages, notify)
+
+    def iter_scrape_karkidi(self, pages: int = 3, notify: bool = True) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        return self.iter_scrape_source(self.karkidi, pages, notify)
+
+    def iter_scrape_source(self, source: JobSource, pages: int = 3,
+                           notify: bool = True) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        print(f" Streaming {pages} pages from {source.describe()}")
+        for page, result in source.iter_pages(pages):
+            cached_jobs = self._check_result(page, result)
+            if cached_jobs is False:
+                continue
+            if cached_jobs is not None:
+                yield page, cached_jobs
+                continue
+            jobs = self._stamp(source.finalize(page, source.parser(result.content)), source)
+            self._store_pages(source, [(result.url, jobs, False)], notify=notify)
+            yield page, jobs
+
+    # ---------------------------------------------------
+    # INCREMENTAL SCRAPE
+    # ---------------------------------------------------
+    def scrape_incremental(self, max_pages: int = None) -> pd.DataFrame:
+        """Incremental scrape of every configured source (see scrape_source_incremental)."""
+        frames = [self.scrape_source_incremental(source, max_pages) for source in self.sources]
+        frames = [df for df in frames if not df.empty]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def scrape_karkidi_incremental(self, max_pages: int = None) -> pd.DataFrame:
+        return self.scrape_source_incremental(self.karkidi, max_pages)
+
+    def scrape_source_incremental(self, source: JobSource, max_pages: int = None) -> pd.DataFrame:
+        """
+        Scrape the newest-first listing only as deep as needed: stop after the
+        first page made up entirely of known jobs, or that reaches the stored
+        watermark (the newest posting of the previous run, by fingerprint or
+        posted_on), or at the first 404 past the end of the listing. Pages are
+        fetched in growing windows (1, 2, 4, ... up to `concurrency`) and
+        processed in order, so a quiet refresh costs one request. Every page is
+        revalidated with the site, whatever the HTTP cache's TTL: the listing
+        changes whenever a job is posted. Returns every job on the visited
+        pages, with db_id and is_new.
+        """
+        max_pages = max_pages or DEFAULT_MAX_PAGES
+        watermark = get_scrape_watermark(source.name) or {}
+        mark_fingerprint = watermark.get("newest_fingerprint")
+        mark_date = parse_posted_on(watermark.get("newest_posted_on"))
+
+        print(f" Incremental scrape of up to {max_pages} pages from {source.describe()}")
+        page_jobs = []
+        visited = 0
+        stopped = None
+
+        start, window = 0, 1
+        while start < max_pages and stopped is None:
+            count = min(window, max_pages - start)
+            for offset, result in enumerate(source.fetch_pages(count, first_page=start + 1, revalidate=True)):
+                page = start + offset + 1
+                if result.status == 404:
+                    stopped = f"page {page}: not found (end of listing)"
+                    break
+                cached_jobs = self._check_result(page, result)
+                if cached_jobs is False:
+                    continue
+                visited = page
+
+                if cached_jobs is not None:
+                    jobs = cached_jobs
+                else:
+                    jobs = self._stamp(source.finalize(page, source.parser(result.content)), source)
+                    self._store_pages(source, [(result.url, jobs, False)])
+                page_jobs.append(jobs)
+
+                reason = self._incremental_stop_reason(jobs, mark_fingerprint, mark_date)
+                if reason:
+                    stopped = f"page {page}: {reason}"
+                    break
+            start += count
+            window = min(window * 2, self.fetcher.concurrency)
+
+        jobs_list = [job for jobs in page_jobs for job in jobs]
+        new_count = sum(1 for job in jobs_list if job.get("is_new"))
+        if jobs_list:
+            dates = [d for d in (parse_posted_on(job.get("posted_on")) for job in jobs_list) if d]
+            newest_date = max(dates + ([mark_date] if mark_date else []), default=None)
+            set_scrape_watermark(
+                source.name,
+                job_fingerprint(jobs_list[0]),
+                newest_date.isoformat() if newest_date else None,
+                visited,
+            )
+        print(f" Incremental scrape: {visited} pages visited, {new_count} new of {len(jobs_list)} jobs "
+              f"(stopped at {stopped or f'max_pages={max_pages}'})")
+        return pd.DataFrame(jobs_list)
+
+    @staticmethod
+    def _incremental_stop_reason(jobs, mark_fingerprint, mark_date) -> Optional[str]:
+        if not jobs:
+            return "no jobs (end of listing)"
+        if not any(job.get("is_new") for job in jobs):
+            return "all jobs already stored"
+        if mark_fingerprint and any(job_fingerprint(job) == mark_fingerprint for job in jobs):
+            return "reached the watermark posting"
+        if mark_date:
+            dates = [parse_posted_on(job.get("posted_on")) for job in jobs]
+            # Strictly older: postings from the watermark day may still be new
+            if all(d is not None and d < mark_date for d in dates):
+                return f"all postings older than {mark_date}"
+        return None
+
+    # ---------------------------------------------------
+    # HELPERS
+    # ---------------------------------------------------
+    def _check_result(self, page: int, result):
+        """
+        False for a failed fetch, the cached jobs (with DB ids) for an
+        unchanged page, or None when the page has to be parsed.
+        """
+        if result.error:
+            print(f" Error fetching page {page}: {result.error}")
+            return False
+        if not result.ok:
+            print(f"Failed to fetch page {page}: {result.status}")
+            return False
+        # An unchanged page reuses the jobs (and DB ids) from its last parse
+        return self._cached_page_jobs(result.url) if result.unchanged else None
+
+    def _store_pages(self, source: JobSource, page_jobs, notify: bool = True) -> List[Dict[str, Any]]:
+        """Save jobs of freshly parsed pages to DB and set their db_id."""
+        new_jobs = [job for _, jobs, stored in page_jobs if not stored for job in jobs]
+        if new_jobs:
+            # Postings already in the DB (by content fingerprint) keep their id
+            inserted_ids, is_new = bulk_upsert_scraped_jobs(new_jobs, notify=notify)
+            for job, db_id, new in zip(new_jobs, inserted_ids, is_new):
+                job["db_id"] = db_id
+                job["is_new"] = new
+            print(f" Assigned DB IDs to scraped jobs ({len(inserted_ids)} rows, "
+                  f"{sum(is_new)} new, {len(is_new) - sum(is_new)} already stored)")
+        # Only fetched pages live in the HTTP cache
+        if self.cache and isinstance(source, KarkidiSource):
+            for url, jobs, stored in page_jobs:
+                if not stored:
+                    self.cache.set_parsed(url, jobs)
+        return new_jobs
+
+    def _cached_page_jobs(self, url: str):
+        """Jobs parsed from the cached copy of `url`, if their DB rows still exist."""
+        jobs = self.cache.get_parsed(url)
+        if jobs is None:
+            return None
+        ids = [job["db_id"] for job in jobs if "db_id" in job]
+        if len(ids) != len(jobs) or len(get_scraped_jobs_by_ids(ids)) != len(ids):
+            return None
+        self.cache.count("parse_skips")
+        for job in jobs:
+            job["is_new"] = False
+        return jobs
@@ -10,7 +10,6 @@ from reportlab.lib.enums import TA_CENTER
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, HRFlowable
 from reportlab.lib import colors
 from dotenv import load_dotenv
-import google.generativeai as genai
 from smart_applier.utils.path_utils import get_data_dirs
 
 
@@ -34,6 +33,8 @@ class ResumeBuilderAgent:
         self.model = None
         if api_key:
             try:
+                # Imported lazily: only needed when a Gemini key is configured
+                import google.generativeai as genai
                 genai.configure(api_key=api_key)
                 self.model = genai.GenerativeModel("models/gemini-2.0-flash-lite")
             except Exception as e:
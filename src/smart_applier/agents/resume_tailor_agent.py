@@ -2,10 +2,12 @@
 import os
 import re
 import json
+import weakref
 from pathlib import Path
-from sentence_transformers import SentenceTransformer, util
 from dotenv import load_dotenv
 import google.generativeai as genai
+from smart_applier.embeddings.model_registry import acquire_model, release_model, embedding_key
+from smart_applier.embeddings.skill_vocabulary import get_skill_vocabulary, cosine_matrix
 from smart_applier.utils.path_utils import get_data_dirs
 from smart_applier.agents.resume_builder_agent import ResumeBuilderAgent
 from smart_applier.utils.db_utils import insert_resume, get_all_scraped_jobs
@@ -19,7 +21,10 @@ class ResumeTailorAgent:
         genai.configure(api_key=api_key)
 
         self.gemini_model = genai.GenerativeModel("models/gemini-2.0-flash-lite")
-        self.model = SentenceTransformer(model_name)
+        self.model_name = model_name
+        self.embedding_key = embedding_key(model_name)
+        self.model = acquire_model(model_name)
+        weakref.finalize(self, release_model, model_name)
 
     def clean_job_description(self, job_description: str):
         prompt = f"""
@@ -39,13 +44,15 @@ class ResumeTailorAgent:
         if not jd_keywords or not user_skills:
             return []
 
-        jd_vecs = self.model.encode(jd_keywords, convert_to_tensor=True)
-        user_vecs = self.model.encode(user_skills, convert_to_tensor=True)
-        cosine = util.cos_sim(jd_vecs, user_vecs)
+        # Short skill phrases come from the shared vocabulary, not the model
+        vocabulary = get_skill_vocabulary()
+        jd_vecs = vocabulary.lookup(self.model, self.embedding_key, jd_keywords)
+        user_vecs = vocabulary.lookup(self.model, self.embedding_key, user_skills)
+        cosine = cosine_matrix(jd_vecs, user_vecs)
 
         matched = set()
         for i, jd_skill in enumerate(jd_keywords):
-            if cosine[i].max().item() >= threshold:
+            if cosine[i].max() >= threshold:
                 matched.add(jd_skill.lower())
 
         return list(matched)
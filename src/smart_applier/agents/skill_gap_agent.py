@@ -1,10 +1,11 @@
 # smart_applier/agents/skill_gap_agent.py
 import os
+import weakref
+import numpy as np
 import pandas as pd
-from collections import defaultdict
-from sentence_transformers import SentenceTransformer, util
 from dotenv import load_dotenv
-import google.generativeai as genai
+from smart_applier.embeddings.model_registry import acquire_model, release_model, embedding_key
+from smart_applier.embeddings.skill_vocabulary import get_skill_vocabulary, cosine_matrix
 from smart_applier.utils.path_utils import get_data_dirs, ensure_database_exists
 
 
@@ -24,6 +25,8 @@ class SkillGapAgent:
 
         if self.use_gemini:
             try:
+                # Imported lazily: only needed when a Gemini key is configured
+                import google.generativeai as genai
                 genai.configure(api_key=self.api_key)
                 self.model_name = "gemini-2.0-flash-lite"
             except Exception as e:
@@ -59,61 +62,80 @@ class SkillGapAgent:
         # -------------------------
         # Initialize semantic model
         # -------------------------
-        print("Loading 'paraphrase-mpnet-base-v2' for semantic analysis...")
-        self.model = SentenceTransformer("paraphrase-mpnet-base-v2")
-        self.user_embeddings = self.model.encode(self.user_skills, convert_to_tensor=True)
+        self.embedding_model_name = "paraphrase-mpnet-base-v2"
+        self.model = acquire_model(self.embedding_model_name)
+        weakref.finalize(self, release_model, self.embedding_model_name)
+        self.vocabulary = get_skill_vocabulary()
+        self.user_embeddings = self.embed_skills(self.user_skills)
 
     # -------------------------
     # Skill gap detection
     # -------------------------
+    def embed_skills(self, skills) -> np.ndarray:
+        """Skill phrase embeddings, served from the shared skill vocabulary."""
+        return self.vocabulary.lookup(self.model, embedding_key(self.embedding_model_name), skills)
+
     def find_missing_skills(self, job_skills, threshold=0.5):
         """Find job skills not semantically covered by user skills."""
         if not job_skills:
             return []
-        job_embeddings = self.model.encode(job_skills, convert_to_tensor=True)
-        cosine_scores = util.cos_sim(job_embeddings, self.user_embeddings)
+        job_embeddings = self.embed_skills(job_skills)
+        cosine_scores = cosine_matrix(job_embeddings, self.user_embeddings)
         missing = []
         for i, job_skill in enumerate(job_skills):
-            similarity = cosine_scores[i].max().item()
+            similarity = float(cosine_scores[i].max())
             if similarity < threshold:
                 missing.append((job_skill, round(similarity, 3)))
         return missing
 
-    def get_top_missing_skills(self, top_n=5):
-        """Collect and rank missing skills across all provided jobs."""
-        all_missing_skills = defaultdict(list)
+    def get_top_missing_skills(self, top_n=5, threshold=0.5):
+        """
+        Collect and rank missing skills across all provided jobs.
+
+        Every job's skill tokens are deduplicated and encoded in one call, and
+        a single similarity matrix against the user skills drives the per-skill
+        count/mean aggregation. Ranking is by (-count, mean similarity), ties
+        keep first-seen order.
+        """
         valid_columns = [col for col in self.jobs_df.columns if "skill" in col.lower()]
         if not valid_columns:
             raise ValueError(" No skill-related column found in job data.")
         skill_col = valid_columns[0]
 
-        for _, job in self.jobs_df.iterrows():
-            job_skills_text = str(job.get(skill_col, "")).strip()
-            if not job_skills_text:
-                continue
-
-            job_skills = [
+        # 1. Collect every job's skill tokens (job order preserved)
+        tokens = []
+        for value in self.jobs_df[skill_col].tolist():
+            job_skills_text = str(value).strip()
+            tokens.extend(
                 s.lower().strip()
                 for s in job_skills_text.split(",")
                 if s.strip()
-            ]
-            if not job_skills:
-                continue
+            )
+        if not tokens:
+            return []
+
+        # 2. Deduplicate; `codes` maps each occurrence to its unique skill
+        unique_skills, codes = np.unique(np.array(tokens, dtype=object), return_inverse=True)
+        codes = codes.ravel()
 
-            missing_with_conf = self.find_missing_skills(job_skills)
-            for skill, score in missing_with_conf:
-                all_missing_skills[skill].append(score)
+        # 3 + 4. One vocabulary lookup (at most one encode call), one similarity matrix
+        job_embeddings = self.embed_skills(list(unique_skills))
+        best = cosine_matrix(job_embeddings, self.user_embeddings).max(axis=1)
+        rounded = np.array([round(float(x), 3) for x in best])
 
-        if not all_missing_skills:
+        missing_codes = codes[best[codes] < threshold]
+        if missing_codes.size == 0:
             return []
 
-        skill_scores = {
-            skill: (len(scores), sum(scores) / len(scores))
-            for skill, scores in all_missing_skills.items()
-        }
-        ranked = sorted(skill_scores.items(), key=lambda x: (-x[1][0], x[1][1]))[:top_n]
-        top_missing = [skill for skill, _ in ranked]
-        return top_missing
+        # 5. Group by skill: occurrence count and mean rounded similarity
+        counts = np.bincount(missing_codes, minlength=len(unique_skills))
+        sums = np.bincount(missing_codes, weights=rounded[missing_codes], minlength=len(unique_skills))
+
+        skills, first_seen = np.unique(missing_codes, return_index=True)
+        means = sums[skills] / counts[skills]
+        order = np.lexsort((first_seen, means, -counts[skills]))[:top_n]
+
+        return [str(unique_skills[skills[i]]) for i in order]
 
     # -------------------------
     # Learning Recommendations
@@ -131,6 +153,7 @@ class SkillGapAgent:
                 f"List {n_resources} free, credible online learning resources "
                 f"for the skill '{skill}'. Include URLs if available."
             )
+            import google.generativeai as genai
             model = genai.GenerativeModel(self.model_name)
             response = model.generate_content(prompt)
             text = getattr(response, "text", str(response)).strip()
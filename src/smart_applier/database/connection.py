@@ -0,0 +1,185 @@
+# src/smart_applier/database/connection.py
+import os
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Iterator, Tuple
+
+from smart_applier.utils.path_utils import get_data_dirs
+
+# ---------------------------------------------------
+# CONFIG
+# ---------------------------------------------------
+MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", str(64 * 1024)))
+BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+# All threads of the process share one named in-memory DB (USE_IN_MEMORY_DB=1)
+IN_MEMORY_URI = "file:smart_applier_memdb?mode=memory&cache=shared"
+
+
+def dict_factory(cursor, row):
+    return {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
+
+
+class PooledConnection(sqlite3.Connection):
+    """
+    A connection owned by the pool: close() is a no-op so code written for
+    open/close-per-call keeps working; the pool closes it for real.
+    """
+
+    def close(self):
+        pass
+
+    def _close(self):
+        super().close()
+
+
+class ConnectionManager:
+    """
+    Thread-local SQLite connections, opened once per thread and database and
+    kept alive. File databases run in WAL mode with synchronous=NORMAL, so
+    readers never block the (single) writer; mmap and page cache sizes come
+    from SQLITE_MMAP_SIZE / SQLITE_CACHE_SIZE_KB.
+
+    Connections are in autocommit mode: writes go through `transaction()`,
+    which also makes in-memory mode safe by serializing writers (shared-cache
+    databases report table locks instead of waiting on busy_timeout).
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._initialized = set()
+        self._all: "weakref.WeakSet[PooledConnection]" = weakref.WeakSet()
+        self._targets: Dict[Tuple[str, str], Tuple[str, bool]] = {}
+        self._memory_anchor = None
+        self._memory_write_lock = threading.RLock()
+
+    # ---------------------------------------------------
+    # TARGET RESOLUTION
+    # ---------------------------------------------------
+    def target(self, in_memory: bool = None) -> Tuple[str, bool]:
+        """(database, is_memory), resolved once per data-dir configuration."""
+        key = (os.getenv("SMART_APPLIER_DATA_DIR", ""), os.getenv("USE_IN_MEMORY_DB", ""))
+        if key not in self._targets:
+            paths = get_data_dirs()
+            if paths["use_in_memory_db"]:
+                self._targets[key] = (IN_MEMORY_URI, True)
+            else:
+                self._targets[key] = (str(paths["db_path"]), False)
+        if in_memory:
+            return IN_MEMORY_URI, True
+        return self._targets[key]
+
+    # ---------------------------------------------------
+    # CONNECTIONS
+    # ---------------------------------------------------
+    def _open(self, database: str, is_memory: bool) -> PooledConnection:
+        conn = sqlite3.connect(database, uri=is_memory, timeout=BUSY_TIMEOUT_MS / 1000,
+                               isolation_level=None, check_same_thread=False,
+                               factory=PooledConnection)
+        conn.row_factory = dict_factory
+        conn.is_memory = is_memory
+        conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        conn.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KB}")
+        if is_memory:
+            # Readers see committed-or-not rows instead of failing on table locks
+            conn.execute("PRAGMA read_uncommitted=1")
+        else:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        self._all.add(conn)
+        return conn
+
+    def get_connection(self, in_memory: bool = None) -> PooledConnection:
+        database, is_memory = self.target(in_memory)
+        conns = getattr(self._local, "conns", None)
+        if conns is None:
+            conns = self._local.conns = {}
+        conn = conns.get(database)
+        if conn is None:
+            conn = conns[database] = self._open(database, is_memory)
+            self._ensure_schema(conn, database, is_memory)
+        return conn
+
+    def _ensure_schema(self, conn: PooledConnection, database: str, is_memory: bool):
+        if database in self._initialized:
+            return
+        from smart_applier.database.db_setup import initialize_database
+
+        with self._lock:
+            if database in self._initialized:
+                return
+            if is_memory and self._memory_anchor is None:
+                # The shared in-memory DB lives as long as one connection to it does
+                self._memory_anchor = self._open(database, True)
+            # create_tables is idempotent and also upgrades older DB files
+            with self.transaction(conn):
+                initialize_database(conn)
+            self._initialized.add(database)
+
+    # ---------------------------------------------------
+    # TRANSACTIONS
+    # ---------------------------------------------------
+    @contextmanager
+    def transaction(self, conn: PooledConnection = None) -> Iterator[PooledConnection]:
+        """
+        BEGIN IMMEDIATE ... COMMIT on this thread's connection, ROLLBACK on
+        error. Nested calls join the outer transaction.
+        """
+        conn = conn or self.get_connection()
+        if conn.in_transaction:
+            yield conn
+            return
+
+        is_memory = conn.is_memory
+        if is_memory:
+            self._memory_write_lock.acquire()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+            if conn.in_transaction:
+                conn.commit()
+        finally:
+            if is_memory:
+                self._memory_write_lock.release()
+
+    def close_thread_connections(self):
+        for conn in (getattr(self._local, "conns", None) or {}).values():
+            conn._close()
+        self._local.conns = {}
+
+    def close_all(self):
+        """Close every pooled connection (threads reopen on next use)."""
+        with self._lock:
+            for conn in list(self._all):
+                conn._close()
+            self._all = weakref.WeakSet()
+            self._local = threading.local()
+            self._initialized.clear()
+            self._targets.clear()
+            self._memory_anchor = None
+
+
+_manager = ConnectionManager()
+
+
+def get_connection_manager() -> ConnectionManager:
+    return _manager
+
+
+def get_connection(in_memory: bool = None) -> PooledConnection:
+    """This thread's pooled connection (closing it is a no-op)."""
+    return _manager.get_connection(in_memory)
+
+
+def transaction(conn: PooledConnection = None):
+    return _manager.transaction(conn)
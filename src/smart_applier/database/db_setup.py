@@ -2,6 +2,7 @@
 import sqlite3
 from pathlib import Path
 from smart_applier.utils.path_utils import get_data_dirs
+from smart_applier.utils.job_fingerprint import job_fingerprint
 
 def get_db_path() -> Path:
     paths = get_data_dirs()
@@ -13,7 +14,8 @@ def get_db_path() -> Path:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     return db_path
 
-def create_tables(conn: sqlite3.Connection):
+def create_tables(conn: sqlite3.Connection, commit: bool = True):
+    """Schema version 1 (see migrations.py); later changes are migrations."""
     cur = conn.cursor()
 
     # Profiles - store full profile JSON
@@ -43,7 +45,20 @@ def create_tables(conn: sqlite3.Connection):
         skills TEXT,
         summary TEXT,
         posted_on TEXT,
-        scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        fingerprint TEXT
+    )
+    """)
+    add_scraped_jobs_fingerprint(cur)
+
+    # Incremental scraping: newest posting seen per source
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS scrape_watermarks (
+        source TEXT PRIMARY KEY,
+        newest_fingerprint TEXT,
+        newest_posted_on TEXT,
+        pages_scraped INTEGER,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     )
     """)
 
@@ -70,20 +85,55 @@ def create_tables(conn: sqlite3.Connection):
     )
     """)
 
-    conn.commit()
+    if commit:
+        conn.commit()
+
+def add_scraped_jobs_fingerprint(cur: sqlite3.Cursor):
+    """
+    Add the dedup fingerprint column + unique index to databases created before
+    it existed. Only the oldest row of each existing duplicate group gets the
+    fingerprint (the rest stay NULL) so the unique index can be built.
+    """
+    # Plain tuples even on connections that use dict_factory
+    cur = cur.connection.cursor()
+    cur.row_factory = None
+    columns = {row[1] for row in cur.execute("PRAGMA table_info(scraped_jobs)").fetchall()}
+    if "fingerprint" not in columns:
+        cur.execute("ALTER TABLE scraped_jobs ADD COLUMN fingerprint TEXT")
+        rows = cur.execute(
+            "SELECT id, title, company, location, skills, summary FROM scraped_jobs ORDER BY id"
+        ).fetchall()
+        seen = set()
+        updates = []
+        for job_id, title, company, location, skills, summary in rows:
+            fp = job_fingerprint({"title": title, "company": company, "location": location,
+                                  "skills": skills, "summary": summary})
+            if fp not in seen:
+                seen.add(fp)
+                updates.append((fp, job_id))
+        cur.executemany("UPDATE scraped_jobs SET fingerprint=? WHERE id=?", updates)
+        print(f" Fingerprinted {len(updates)} scraped jobs ({len(rows) - len(updates)} duplicates left unkeyed)")
+
+    cur.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_scraped_jobs_fingerprint ON scraped_jobs(fingerprint)"
+    )
 
 def initialize_database(conn: sqlite3.Connection = None):
     """
     Initialize DB. If `conn` is provided, create tables there (useful for in-memory).
     Otherwise create/open file-backed DB and initialize tables.
+    Tables and indexes are brought to the latest schema version by the
+    migration runner.
     """
+    from smart_applier.database.migrations import run_migrations
+
     created_here = False
     if conn is None:
         db_path = get_db_path()
         conn = sqlite3.connect(db_path)
         created_here = True
 
-    create_tables(conn)
+    run_migrations(conn)
 
     if created_here:
         conn.close()
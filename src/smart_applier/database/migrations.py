@@ -0,0 +1,228 @@
+# src/smart_applier/database/migrations.py
+import re
+import sys
+import sqlite3
+from typing import Callable, List, Tuple
+
+# ---------------------------------------------------
+# MIGRATIONS
+# ---------------------------------------------------
+# Applied in order, each in its own transaction; the schema version is kept
+# in PRAGMA user_version. Never edit a released migration, add a new one.
+
+
+def _baseline(cur: sqlite3.Cursor):
+    # Version 1 is the schema create_tables built before versioning existed.
+    # It is idempotent, so unversioned databases of any age upgrade cleanly.
+    from smart_applier.database.db_setup import create_tables
+    create_tables(cur.connection, commit=False)
+
+
+def _query_indexes(cur: sqlite3.Cursor):
+    # Latest matches per user, and the scraped_jobs → top_matched_jobs join
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_top_matched_user_created "
+                "ON top_matched_jobs(user_id, created_at)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_top_matched_job ON top_matched_jobs(job_id)")
+    # A user's resumes of one type, newest first
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_resumes_user_type_created "
+                "ON resumes(user_id, resume_type, created_at)")
+
+
+def _resume_pdfs_to_files(cur: sqlite3.Cursor):
+    # PDFs move to the content-addressed store (data/resumes/store); the row
+    # keeps the hash. pdf_blob stays as an always-NULL legacy column.
+    from smart_applier.utils.content_store import get_resume_store
+
+    cur = cur.connection.cursor()
+    cur.row_factory = None
+    columns = {row[1] for row in cur.execute("PRAGMA table_info(resumes)").fetchall()}
+    if "pdf_sha256" not in columns:
+        cur.execute("ALTER TABLE resumes ADD COLUMN pdf_sha256 TEXT")
+    if "pdf_size" not in columns:
+        cur.execute("ALTER TABLE resumes ADD COLUMN pdf_size INTEGER")
+
+    store = get_resume_store()
+    ids = [row[0] for row in cur.execute("SELECT id FROM resumes WHERE pdf_blob IS NOT NULL").fetchall()]
+    for resume_id in ids:
+        # One BLOB in memory at a time
+        blob = cur.execute("SELECT pdf_blob FROM resumes WHERE id=?", (resume_id,)).fetchone()[0]
+        digest = store.put(bytes(blob))
+        cur.execute("UPDATE resumes SET pdf_sha256=?, pdf_size=?, pdf_blob=NULL WHERE id=?",
+                    (digest, len(blob), resume_id))
+    if ids:
+        print(f" Moved {len(ids)} resume PDFs to {store.root}; run "
+              f"'python -m smart_applier.database.migrations vacuum' to reclaim the space")
+
+
+def _stats_indexes(cur: sqlite3.Cursor):
+    # Per-day windows of the dashboard stats (database/stats.py)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_scraped_jobs_scraped_at ON scraped_jobs(scraped_at)")
+
+
+def _pagination_indexes(cur: sqlite3.Cursor):
+    # Keyset pages (db_utils.page_*): an index on the filter column is ordered
+    # by rowid within each value, so "filter AND id < ? ORDER BY id DESC" is a
+    # seek. The created_at indexes turn date windows into id ranges.
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_scraped_jobs_company ON scraped_jobs(company)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_top_matched_user ON top_matched_jobs(user_id)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_top_matched_created ON top_matched_jobs(created_at)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_resumes_user ON resumes(user_id)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_resumes_created ON resumes(created_at)")
+
+
+def _fulltext_index(cur: sqlite3.Cursor):
+    # FTS5 index over scraped_jobs text, kept in sync by triggers
+    # (search/fulltext.py). Without FTS5 the app still runs, minus keyword
+    # search; `python -m smart_applier.search.fulltext rebuild` adds it later.
+    from smart_applier.search.fulltext import create_fulltext_index
+    try:
+        create_fulltext_index(cur)
+    except sqlite3.OperationalError as e:
+        if "fts5" not in str(e):
+            raise
+        print(f" SQLite has no FTS5, keyword search disabled: {e}")
+
+
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Cursor], None]]] = [
+    (1, "baseline tables", _baseline),
+    (2, "query indexes on top_matched_jobs and resumes", _query_indexes),
+    (3, "resume PDFs in the content-addressed file store", _resume_pdfs_to_files),
+    (4, "scraped_at index for per-day stats", _stats_indexes),
+    (5, "indexes for keyset pagination", _pagination_indexes),
+    (6, "FTS5 full-text index over scraped_jobs", _fulltext_index),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    # Plain tuples even on connections that use dict_factory
+    cur = conn.cursor()
+    cur.row_factory = None
+    return cur.execute("PRAGMA user_version").fetchone()[0]
+
+
+def run_migrations(conn: sqlite3.Connection) -> List[int]:
+    """Apply pending migrations. Returns the versions applied."""
+    applied = []
+    version = get_schema_version(conn)
+    for target, description, migrate in MIGRATIONS:
+        if target <= version:
+            continue
+        # Joins the caller's transaction if there is one, else one per step
+        own_transaction = not conn.in_transaction
+        if own_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        try:
+            migrate(conn.cursor())
+            conn.execute(f"PRAGMA user_version = {int(target)}")
+            if own_transaction:
+                conn.commit()
+        except Exception:
+            if own_transaction and conn.in_transaction:
+                conn.rollback()
+            raise
+        applied.append(target)
+        print(f" Schema migrated to version {target}: {description}")
+    return applied
+
+
+# ---------------------------------------------------
+# QUERY PLAN CHECKS
+# ---------------------------------------------------
+# The filtering/joining queries of db_utils with representative parameters.
+# None of them may read a whole table.
+QUERY_PLAN_CHECKS: List[Tuple[str, str, tuple]] = [
+    ("get_profile",
+     "SELECT data_json FROM profiles WHERE user_id=?", ("u",)),
+    ("scraped_jobs by fingerprint",
+     "SELECT id, fingerprint FROM scraped_jobs WHERE fingerprint IN (?, ?)", ("a", "b")),
+    ("get_scraped_jobs_by_ids",
+     "SELECT * FROM scraped_jobs WHERE id IN (?, ?)", (1, 2)),
+    ("get_latest_top_matched (user)",
+     """SELECT t.id, t.score, s.title FROM top_matched_jobs t
+        LEFT JOIN scraped_jobs s ON s.id = t.job_id
+        WHERE t.user_id = ? ORDER BY t.created_at DESC, t.id DESC LIMIT ?""", ("u", 10)),
+    ("top matches of a job",
+     "SELECT user_id, score FROM top_matched_jobs WHERE job_id = ?", (1,)),
+    ("list_resumes (user)",
+     """SELECT id, user_id, resume_type, file_name, created_at FROM resumes
+        WHERE user_id = ? ORDER BY created_at DESC, id DESC LIMIT ?""", ("u", 10)),
+    ("list_resumes (user, type)",
+     """SELECT id, user_id, resume_type, file_name, created_at FROM resumes
+        WHERE user_id = ? AND resume_type = ? ORDER BY created_at DESC, id DESC LIMIT ?""",
+     ("u", "generated", 10)),
+    ("jobs per day",
+     """SELECT date(scraped_at) AS day, COUNT(*) FROM scraped_jobs
+        WHERE scraped_at >= datetime('now', ?) GROUP BY day ORDER BY day""", ("-30 days",)),
+    ("page_scraped_jobs (company)",
+     "SELECT s.* FROM scraped_jobs s WHERE s.company = ? AND s.id < ? ORDER BY s.id DESC LIMIT ?",
+     ("Acme", 1000, 50)),
+    ("page_scraped_jobs (date window)",
+     """SELECT s.* FROM scraped_jobs s WHERE s.id < ? AND s.id >= ? AND s.id <= ?
+        AND s.scraped_at >= ? AND s.scraped_at < ? ORDER BY s.id DESC LIMIT ?""",
+     (1000, 10, 900, "2024-01-01", "2024-02-01", 50)),
+    ("page date window → id range",
+     "SELECT id FROM top_matched_jobs WHERE created_at >= ? ORDER BY created_at, id LIMIT 1",
+     ("2024-01-01",)),
+    ("page_top_matched (user)",
+     """SELECT t.id AS match_id, s.title FROM top_matched_jobs t
+        LEFT JOIN scraped_jobs s ON s.id = t.job_id
+        WHERE t.user_id = ? AND t.id < ? ORDER BY t.id DESC LIMIT ?""", ("u", 1000, 50)),
+    ("page_resumes (user)",
+     """SELECT r.id, r.file_name FROM resumes r
+        WHERE r.user_id = ? AND r.id < ? ORDER BY r.id DESC LIMIT ?""", ("u", 1000, 50)),
+    ("search_jobs",
+     """SELECT rowid AS id, -rank AS score FROM scraped_jobs_fts
+        WHERE scraped_jobs_fts MATCH ? ORDER BY rank LIMIT ?""", ('"kubernetes"', 50)),
+    ("scrape watermark",
+     "SELECT * FROM scrape_watermarks WHERE source=?", ("karkidi",)),
+]
+
+# "SCAN t" reads every row and "SCAN t USING [COVERING] INDEX i" a whole
+# index; lookups show up as "SEARCH t ...". A virtual table "scan" hands the
+# constraints to the module (FTS5 MATCH), so it doesn't count.
+_FULL_SCAN = re.compile(r"\bSCAN \w+\b(?! VIRTUAL TABLE)")
+
+
+def explain(conn: sqlite3.Connection, sql: str, params: tuple = ()) -> List[str]:
+    cur = conn.cursor()
+    cur.row_factory = None
+    return [row[3] for row in cur.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()]
+
+
+def check_query_plans(conn: sqlite3.Connection) -> List[Tuple[str, List[str]]]:
+    """(query name, plan) of every checked query that falls back to a full scan."""
+    failures = []
+    for name, sql, params in QUERY_PLAN_CHECKS:
+        plan = explain(conn, sql, params)
+        if any(_FULL_SCAN.search(line) for line in plan):
+            failures.append((name, plan))
+    return failures
+
+
+# ---------------------------------------------------
+# CLI: python -m smart_applier.database.migrations [status|migrate|check|vacuum]
+# ---------------------------------------------------
+if __name__ == "__main__":
+    from smart_applier.database.connection import get_connection
+
+    command = sys.argv[1] if len(sys.argv) > 1 else "status"
+    # Opening the pooled connection applies pending migrations
+    conn = get_connection()
+
+    if command in ("status", "migrate"):
+        print(f" Schema version {get_schema_version(conn)} (latest {LATEST_VERSION})")
+    elif command == "check":
+        failures = check_query_plans(conn)
+        for name, sql, params in QUERY_PLAN_CHECKS:
+            print(f" {name}: {' | '.join(explain(conn, sql, params))}")
+        for name, plan in failures:
+            print(f" FULL SCAN in '{name}': {plan}")
+        sys.exit(1 if failures else 0)
+    elif command == "vacuum":
+        conn.execute("VACUUM")
+        print(" Database vacuumed")
+    else:
+        print("Usage: python -m smart_applier.database.migrations [status|migrate|check|vacuum]")
+        sys.exit(2)
@@ -0,0 +1,115 @@
+# src/smart_applier/database/stats.py
+import os
+import time
+import threading
+from functools import wraps
+from typing import Any, Dict, List
+
+from smart_applier.database.connection import get_connection
+
+# ---------------------------------------------------
+# CONFIG
+# ---------------------------------------------------
+# Dashboard renders within the TTL reuse the last result instead of
+# re-running the aggregates
+DEFAULT_TTL_SECONDS = float(os.getenv("STATS_CACHE_TTL_SECONDS", "30"))
+
+_cache: Dict[tuple, tuple] = {}
+_cache_lock = threading.Lock()
+# Bumped by invalidate_stats(): a result computed under an older generation
+# may predate the write that invalidated it, so it is returned but not cached
+_generation = 0
+
+
+def ttl_cached(fn):
+    """Cache fn(*args, **kwargs) for STATS_CACHE_TTL_SECONDS, per data dir."""
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = (fn.__name__, os.getenv("SMART_APPLIER_DATA_DIR", ""), args, frozenset(kwargs.items()))
+        now = time.monotonic()
+        with _cache_lock:
+            hit = _cache.get(key)
+            if hit is not None and now - hit[0] < DEFAULT_TTL_SECONDS:
+                return hit[1]
+            generation = _generation
+        value = fn(*args, **kwargs)
+        with _cache_lock:
+            if generation == _generation:
+                _cache[key] = (now, value)
+        return value
+
+    return wrapper
+
+
+def invalidate_stats():
+    global _generation
+    with _cache_lock:
+        _generation += 1
+        _cache.clear()
+
+
+# ---------------------------------------------------
+# AGGREGATES
+# ---------------------------------------------------
+@ttl_cached
+def get_table_counts() -> Dict[str, int]:
+    conn = get_connection()
+    row = conn.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM scraped_jobs) AS scraped_jobs,
+            (SELECT COUNT(*) FROM top_matched_jobs) AS top_matched_jobs,
+            (SELECT COUNT(*) FROM profiles) AS profiles,
+            (SELECT COUNT(*) FROM resumes) AS resumes
+    """).fetchone()
+    return dict(row)
+
+
+@ttl_cached
+def get_jobs_per_day(days: int = 30) -> List[Dict[str, Any]]:
+    """Scraped jobs per day over the last `days` days, oldest first."""
+    conn = get_connection()
+    return conn.execute("""
+        SELECT date(scraped_at) AS day, COUNT(*) AS jobs
+        FROM scraped_jobs
+        WHERE scraped_at >= datetime('now', ?)
+        GROUP BY day
+        ORDER BY day
+    """, (f"-{int(days)} days",)).fetchall()
+
+
+@ttl_cached
+def get_matches_per_user() -> Dict[str, int]:
+    conn = get_connection()
+    rows = conn.execute("""
+        SELECT user_id, COUNT(*) AS matches
+        FROM top_matched_jobs
+        GROUP BY user_id
+        ORDER BY matches DESC
+    """).fetchall()
+    return {row["user_id"]: row["matches"] for row in rows}
+
+
+@ttl_cached
+def get_resume_counts_by_type(user_id: str = None) -> Dict[str, int]:
+    conn = get_connection()
+    if user_id is None:
+        rows = conn.execute(
+            "SELECT resume_type, COUNT(*) AS resumes FROM resumes GROUP BY resume_type"
+        ).fetchall()
+    else:
+        rows = conn.execute(
+            "SELECT resume_type, COUNT(*) AS resumes FROM resumes WHERE user_id = ? GROUP BY resume_type",
+            (user_id,),
+        ).fetchall()
+    return {row["resume_type"]: row["resumes"] for row in rows}
+
+
+def get_dashboard_stats(days: int = 30) -> Dict[str, Any]:
+    """Everything the dashboard shows, each part cached for the TTL."""
+    return {
+        "counts": get_table_counts(),
+        "jobs_per_day": get_jobs_per_day(days),
+        "matches_per_user": get_matches_per_user(),
+        "resumes_by_type": get_resume_counts_by_type(),
+    }
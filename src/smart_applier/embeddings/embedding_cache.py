@@ -0,0 +1,181 @@
+# src/smart_applier/embeddings/embedding_cache.py
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import List, Dict, Optional
+
+import numpy as np
+
+from smart_applier.utils.path_utils import get_data_dirs
+
+
+# ---------------------------------------------------
+# CONFIG
+# ---------------------------------------------------
+DEFAULT_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "200000"))
+
+# Keep IN (...) lists well below SQLite's host parameter limit
+_LOOKUP_CHUNK = 500
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    On-disk, content-addressed cache of float32 embeddings.
+
+    Entries are keyed by (model name, sha256 of the preprocessed text), so the
+    same posting scraped on different runs is only ever encoded once per model.
+    When the cache grows past `max_entries` the least recently used rows are
+    evicted.
+    """
+
+    def __init__(self, db_path: Path = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        if db_path is None:
+            db_path = get_data_dirs()["cache"] / "embeddings.db"
+        self.db_path = db_path
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+        CREATE TABLE IF NOT EXISTS embeddings (
+            model TEXT NOT NULL,
+            text_hash TEXT NOT NULL,
+            dim INTEGER NOT NULL,
+            vector BLOB NOT NULL,
+            last_access REAL NOT NULL,
+            PRIMARY KEY (model, text_hash)
+        )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embeddings_last_access ON embeddings(last_access)"
+        )
+        self._conn.commit()
+
+    # ---------------------------------------------------
+    # LOW-LEVEL GET / PUT
+    # ---------------------------------------------------
+    def get_many(self, model_name: str, hashes: List[str]) -> Dict[str, np.ndarray]:
+        found = {}
+        with self._lock:
+            for start in range(0, len(hashes), _LOOKUP_CHUNK):
+                chunk = hashes[start:start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, dim, vector FROM embeddings "
+                    f"WHERE model=? AND text_hash IN ({placeholders})",
+                    [model_name, *chunk],
+                ).fetchall()
+                for h, dim, blob in rows:
+                    found[h] = np.frombuffer(blob, dtype="float32", count=dim)
+
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_access=? WHERE model=? AND text_hash=?",
+                    [(now, model_name, h) for h in found],
+                )
+                self._conn.commit()
+        return found
+
+    def put_many(self, model_name: str, hashes: List[str], vectors: np.ndarray):
+        vectors = np.ascontiguousarray(vectors, dtype="float32")
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, dim, vector, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (model_name, h, int(vec.shape[0]), vec.tobytes(), now)
+                    for h, vec in zip(hashes, vectors)
+                ],
+            )
+            self._conn.commit()
+            self._evict_locked()
+
+    def _evict_locked(self):
+        count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        excess = count - self.max_entries
+        if excess <= 0:
+            return
+        # Trim 10% below the bound so eviction doesn't run on every insert
+        excess += self.max_entries // 10
+        self._conn.execute("""
+            DELETE FROM embeddings WHERE rowid IN (
+                SELECT rowid FROM embeddings ORDER BY last_access ASC LIMIT ?
+            )
+        """, (excess,))
+        self._conn.commit()
+        self.evictions += excess
+
+    # ---------------------------------------------------
+    # CACHED ENCODE
+    # ---------------------------------------------------
+    def encode(self, model, model_name: str, texts: List[str]) -> np.ndarray:
+        """
+        Encode `texts` with `model`, serving cached vectors where possible.
+        All cache misses are sent to `model.encode` in a single batched call.
+        """
+        if not texts:
+            return np.asarray(model.encode([], convert_to_numpy=True), dtype="float32")
+
+        hashes = [text_hash(t) for t in texts]
+        unique_hashes = list(dict.fromkeys(hashes))
+        found = self.get_many(model_name, unique_hashes)
+
+        missing = [h for h in unique_hashes if h not in found]
+        self.hits += len(found)
+        self.misses += len(missing)
+
+        if missing:
+            first_text = {}
+            for h, t in zip(hashes, texts):
+                first_text.setdefault(h, t)
+            new_vecs = np.asarray(
+                model.encode([first_text[h] for h in missing], convert_to_numpy=True),
+                dtype="float32",
+            )
+            self.put_many(model_name, missing, new_vecs)
+            found.update(zip(missing, new_vecs))
+
+        return np.stack([found[h] for h in hashes]).astype("float32")
+
+    # ---------------------------------------------------
+    # REPORTING
+    # ---------------------------------------------------
+    def stats(self) -> Dict[str, Optional[int]]:
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": size,
+            "max_entries": self.max_entries,
+        }
+
+
+# ---------------------------------------------------
+# PROCESS-WIDE INSTANCE
+# ---------------------------------------------------
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = EmbeddingCache()
+        return _cache
@@ -0,0 +1,200 @@
+# src/smart_applier/embeddings/model_registry.py
+import os
+import threading
+import time
+from typing import Callable, Dict, Any, Optional, List
+
+
+# ---------------------------------------------------
+# CONFIG
+# ---------------------------------------------------
+# Seconds an unused model (refcount == 0) stays resident before it is evicted.
+DEFAULT_IDLE_TTL = float(os.getenv("MODEL_IDLE_TTL_SECONDS", "900"))
+
+
+def get_embedding_backend() -> str:
+    """'torch' (SentenceTransformer, default) or 'onnx' (int8 ONNX Runtime)."""
+    backend = os.getenv("EMBEDDING_BACKEND", "torch").lower()
+    if backend not in ("torch", "onnx"):
+        raise ValueError(f"Unknown EMBEDDING_BACKEND: {backend}")
+    return backend
+
+
+def embedding_key(model_name: str) -> str:
+    """
+    Name under which a model's vectors are cached/indexed. Quantized vectors
+    differ slightly from the PyTorch ones, so each backend gets its own key.
+    """
+    if get_embedding_backend() == "onnx":
+        return f"{model_name}@onnx-int8"
+    return model_name
+
+
+def _current_rss_bytes() -> Optional[int]:
+    """Resident set size of this process (Linux /proc), or None if unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _parameter_bytes(model) -> Optional[int]:
+    """Size of the model weights/buffers, for torch-backed models."""
+    try:
+        total = sum(p.numel() * p.element_size() for p in model.parameters())
+        total += sum(b.numel() * b.element_size() for b in model.buffers())
+        return int(total)
+    except Exception:
+        return None
+
+
+def _load_sentence_transformer(model_name: str):
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_name)
+
+
+def _load_model(model_name: str):
+    if get_embedding_backend() == "onnx":
+        from smart_applier.embeddings.onnx_backend import load_onnx_encoder
+        return load_onnx_encoder(model_name)
+    return _load_sentence_transformer(model_name)
+
+
+class _ModelEntry:
+    def __init__(self):
+        self.model = None
+        self.refcount = 0
+        self.last_used = time.monotonic()
+        self.load_seconds = 0.0
+        self.param_bytes = None
+        self.rss_delta_bytes = None
+        self.load_lock = threading.Lock()
+
+
+class ModelRegistry:
+    """
+    Process-wide cache of embedding models keyed by model name.
+
+    Models are loaded lazily on first `acquire`, shared by every caller and
+    reference counted. Once a model has no holders it is kept for `idle_ttl`
+    seconds so back-to-back workflow nodes reuse it, then evicted.
+    """
+
+    def __init__(self, idle_ttl: float = DEFAULT_IDLE_TTL,
+                 loader: Callable[[str], Any] = _load_model):
+        self.idle_ttl = idle_ttl
+        self.loader = loader
+        self._entries: Dict[str, _ModelEntry] = {}
+        self._lock = threading.Lock()
+
+    # ---------------------------------------------------
+    # ACQUIRE / RELEASE
+    # ---------------------------------------------------
+    def acquire(self, model_name: str):
+        with self._lock:
+            self._evict_idle_locked()
+            entry = self._entries.setdefault(model_name, _ModelEntry())
+            entry.refcount += 1
+            entry.last_used = time.monotonic()
+
+        # Load outside the registry lock so different models load in parallel;
+        # the per-entry lock makes concurrent callers of the same model wait
+        # for a single load.
+        try:
+            with entry.load_lock:
+                if entry.model is None:
+                    self._load(model_name, entry)
+        except Exception:
+            self.release(model_name)
+            raise
+
+        return entry.model
+
+    def release(self, model_name: str):
+        with self._lock:
+            entry = self._entries.get(model_name)
+            if entry is None:
+                return
+            entry.refcount = max(0, entry.refcount - 1)
+            entry.last_used = time.monotonic()
+            self._evict_idle_locked()
+
+    def _load(self, model_name: str, entry: _ModelEntry):
+        print(f" Loading embedding model '{model_name}'...")
+        rss_before = _current_rss_bytes()
+        start = time.perf_counter()
+
+        model = self.loader(model_name)
+
+        entry.load_seconds = time.perf_counter() - start
+        rss_after = _current_rss_bytes()
+        if rss_before is not None and rss_after is not None:
+            entry.rss_delta_bytes = max(0, rss_after - rss_before)
+        entry.param_bytes = _parameter_bytes(model)
+        entry.model = model
+
+        size = entry.param_bytes or entry.rss_delta_bytes
+        size_text = f" (~{size / 1e6:.1f} MB)" if size else ""
+        print(f" Loaded '{model_name}' in {entry.load_seconds:.2f}s{size_text}")
+
+    # ---------------------------------------------------
+    # EVICTION
+    # ---------------------------------------------------
+    def _evict_idle_locked(self, now: float = None) -> List[str]:
+        now = time.monotonic() if now is None else now
+        evicted = []
+        for name, entry in list(self._entries.items()):
+            if entry.refcount == 0 and now - entry.last_used >= self.idle_ttl:
+                del self._entries[name]
+                evicted.append(name)
+        for name in evicted:
+            print(f" Evicted idle embedding model '{name}'")
+        return evicted
+
+    def evict_idle(self) -> List[str]:
+        """Drop every unreferenced model idle for longer than `idle_ttl`."""
+        with self._lock:
+            return self._evict_idle_locked()
+
+    def clear(self):
+        """Drop all models regardless of reference count."""
+        with self._lock:
+            self._entries.clear()
+
+    # ---------------------------------------------------
+    # REPORTING
+    # ---------------------------------------------------
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                name: {
+                    "loaded": entry.model is not None,
+                    "refcount": entry.refcount,
+                    "idle_seconds": round(now - entry.last_used, 1),
+                    "load_seconds": round(entry.load_seconds, 3),
+                    "param_bytes": entry.param_bytes,
+                    "rss_delta_bytes": entry.rss_delta_bytes,
+                }
+                for name, entry in self._entries.items()
+            }
+
+
+# ---------------------------------------------------
+# PROCESS-WIDE INSTANCE
+# ---------------------------------------------------
+_registry = ModelRegistry()
+
+
+def get_model_registry() -> ModelRegistry:
+    return _registry
+
+
+def acquire_model(model_name: str):
+    return _registry.acquire(model_name)
+
+
+def release_model(model_name: str):
+    _registry.release(model_name)
@@ -0,0 +1,174 @@
+# src/smart_applier/embeddings/onnx_backend.py
+# Optional int8-quantized ONNX Runtime backend for sentence embeddings.
+#
+# Select it with EMBEDDING_BACKEND=onnx. The first load of a model exports it
+# from sentence-transformers to ONNX, quantizes the weights to int8 and stores
+# the result under data/cache/onnx/<model>; later loads only need onnxruntime
+# and tokenizers (no torch).
+#
+# Requires: pip install onnxruntime onnx
+import json
+import os
+from pathlib import Path
+from typing import List, Union
+
+import numpy as np
+
+from smart_applier.utils.path_utils import get_data_dirs
+
+CONFIG_FILE = "encoder_config.json"
+QUANTIZED_FILE = "model.int8.onnx"
+
+
+def default_onnx_dir(model_name: str) -> Path:
+    root = Path(os.getenv("ONNX_MODEL_DIR", get_data_dirs()["cache"] / "onnx"))
+    return root / model_name.replace("/", "__")
+
+
+# ---------------------------------------------------
+# EXPORT + QUANTIZE (needs torch / sentence-transformers)
+# ---------------------------------------------------
+def export_quantized_onnx(model_name: str, output_dir: Path = None) -> Path:
+    import torch
+    from sentence_transformers import SentenceTransformer
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    output_dir = Path(output_dir or default_onnx_dir(model_name))
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    st_model = SentenceTransformer(model_name, device="cpu")
+    transformer = st_model[0].auto_model.eval()
+    tokenizer = st_model.tokenizer
+
+    pooling = "mean"
+    normalize = False
+    for module in st_model:
+        if hasattr(module, "get_pooling_mode_str"):
+            pooling = module.get_pooling_mode_str()
+        if type(module).__name__ == "Normalize":
+            normalize = True
+    if pooling not in ("mean", "cls"):
+        raise ValueError(f"Unsupported pooling mode for ONNX export: {pooling}")
+
+    class _Encoder(torch.nn.Module):
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+
+        def forward(self, input_ids, attention_mask):
+            return self.model(input_ids=input_ids, attention_mask=attention_mask)[0]
+
+    sample = tokenizer(["export sample"], return_tensors="pt")
+    fp32_path = output_dir / "model.onnx"
+    torch.onnx.export(
+        _Encoder(transformer),
+        (sample["input_ids"], sample["attention_mask"]),
+        str(fp32_path),
+        input_names=["input_ids", "attention_mask"],
+        output_names=["last_hidden_state"],
+        dynamic_axes={
+            "input_ids": {0: "batch", 1: "sequence"},
+            "attention_mask": {0: "batch", 1: "sequence"},
+            "last_hidden_state": {0: "batch", 1: "sequence"},
+        },
+        opset_version=14,
+    )
+
+    quantize_dynamic(str(fp32_path), str(output_dir / QUANTIZED_FILE), weight_type=QuantType.QInt8)
+    fp32_path.unlink()
+
+    tokenizer.save_pretrained(str(output_dir))
+    with open(output_dir / CONFIG_FILE, "w") as f:
+        json.dump({
+            "model_name": model_name,
+            "pooling": pooling,
+            "normalize": normalize,
+            "max_seq_length": st_model.max_seq_length,
+            "dimension": st_model.get_sentence_embedding_dimension(),
+        }, f, indent=2)
+
+    print(f" Exported int8 ONNX model for '{model_name}' to {output_dir}")
+    return output_dir
+
+
+# ---------------------------------------------------
+# RUNTIME ENCODER
+# ---------------------------------------------------
+class OnnxSentenceEncoder:
+    """
+    Drop-in subset of SentenceTransformer used by the agents:
+    `encode(...)` returning NumPy arrays, and `get_sentence_embedding_dimension()`.
+    """
+
+    def __init__(self, model_dir: Path, intra_op_threads: int = None):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        self.model_dir = Path(model_dir)
+        with open(self.model_dir / CONFIG_FILE) as f:
+            self.config = json.load(f)
+
+        self.tokenizer = Tokenizer.from_file(str(self.model_dir / "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=self.config["max_seq_length"])
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+        self.session = ort.InferenceSession(
+            str(self.model_dir / QUANTIZED_FILE),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.config["dimension"]
+
+    def _encode_batch(self, sentences: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(sentences)
+        max_len = max(len(e.ids) for e in encodings)
+        input_ids = np.zeros((len(encodings), max_len), dtype="int64")
+        attention_mask = np.zeros((len(encodings), max_len), dtype="int64")
+        for row, enc in enumerate(encodings):
+            input_ids[row, :len(enc.ids)] = enc.ids
+            attention_mask[row, :len(enc.attention_mask)] = enc.attention_mask
+
+        hidden = self.session.run(
+            ["last_hidden_state"],
+            {"input_ids": input_ids, "attention_mask": attention_mask},
+        )[0]
+
+        if self.config["pooling"] == "cls":
+            pooled = hidden[:, 0]
+        else:
+            mask = attention_mask[:, :, None].astype("float32")
+            pooled = (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+        return pooled.astype("float32")
+
+    def encode(self, sentences: Union[str, List[str]], batch_size: int = 32,
+               normalize_embeddings: bool = False, **kwargs) -> np.ndarray:
+        # convert_to_numpy / convert_to_tensor / show_progress_bar are accepted
+        # for signature compatibility; output is always NumPy.
+        single = isinstance(sentences, str)
+        sentences = [sentences] if single else list(sentences)
+        if not sentences:
+            return np.zeros((0, self.get_sentence_embedding_dimension()), dtype="float32")
+
+        # Sort by length so each batch pads to a similar size
+        order = np.argsort([-len(s) for s in sentences], kind="stable")
+        output = np.empty((len(sentences), self.get_sentence_embedding_dimension()), dtype="float32")
+        for start in range(0, len(sentences), batch_size):
+            idx = order[start:start + batch_size]
+            output[idx] = self._encode_batch([sentences[i] for i in idx])
+
+        if self.config["normalize"] or normalize_embeddings:
+            output /= np.maximum(np.linalg.norm(output, axis=1, keepdims=True), 1e-12)
+
+        return output[0] if single else output
+
+
+def load_onnx_encoder(model_name: str) -> OnnxSentenceEncoder:
+    model_dir = default_onnx_dir(model_name)
+    if not (model_dir / QUANTIZED_FILE).exists():
+        export_quantized_onnx(model_name, model_dir)
+    return OnnxSentenceEncoder(model_dir)
@@ -0,0 +1,150 @@
+# src/smart_applier/embeddings/skill_vocabulary.py
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Dict
+
+import numpy as np
+
+from smart_applier.utils.path_utils import get_data_dirs
+
+
+def normalize_skill(phrase) -> str:
+    """'  Power   BI ' -> 'power bi'"""
+    return " ".join(str(phrase).lower().split())
+
+
+def cosine_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pairwise cosine similarity between the rows of `a` and `b`."""
+    a = np.asarray(a, dtype="float32")
+    b = np.asarray(b, dtype="float32")
+    a = a / np.maximum(np.linalg.norm(a, axis=1, keepdims=True), 1e-12)
+    b = b / np.maximum(np.linalg.norm(b, axis=1, keepdims=True), 1e-12)
+    return a @ b.T
+
+
+class _ModelVocabulary:
+    """In-memory view of one model's vocabulary: phrase -> row of `matrix`."""
+
+    def __init__(self):
+        self.rows: Dict[str, int] = {}
+        self.matrix = None
+
+    def extend(self, phrases: List[str], vectors: np.ndarray):
+        vectors = np.asarray(vectors, dtype="float32")
+        start = 0 if self.matrix is None else self.matrix.shape[0]
+        for offset, phrase in enumerate(phrases):
+            self.rows[phrase] = start + offset
+        self.matrix = vectors if self.matrix is None else np.concatenate([self.matrix, vectors])
+
+
+class SkillVocabulary:
+    """
+    Persistent store of skill-phrase embeddings, one vocabulary per model.
+
+    Phrases are normalized before lookup, so "Python", " python " and "PYTHON"
+    share one vector. Unknown phrases are encoded in a single batch and
+    persisted, so repeated skill comparisons need almost no model inference.
+    """
+
+    def __init__(self, db_path: Path = None):
+        if db_path is None:
+            db_path = get_data_dirs()["cache"] / "skill_vocabulary.db"
+        self.db_path = db_path
+
+        self.hits = 0
+        self.misses = 0
+
+        self._models: Dict[str, _ModelVocabulary] = {}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("""
+        CREATE TABLE IF NOT EXISTS skill_vocabulary (
+            model TEXT NOT NULL,
+            phrase TEXT NOT NULL,
+            dim INTEGER NOT NULL,
+            vector BLOB NOT NULL,
+            PRIMARY KEY (model, phrase)
+        )
+        """)
+        self._conn.commit()
+
+    def _vocabulary_locked(self, model_name: str) -> _ModelVocabulary:
+        vocab = self._models.get(model_name)
+        if vocab is None:
+            vocab = _ModelVocabulary()
+            rows = self._conn.execute(
+                "SELECT phrase, dim, vector FROM skill_vocabulary WHERE model=?",
+                (model_name,),
+            ).fetchall()
+            if rows:
+                vocab.extend(
+                    [phrase for phrase, _, _ in rows],
+                    np.stack([np.frombuffer(blob, dtype="float32", count=dim) for _, dim, blob in rows]),
+                )
+            self._models[model_name] = vocab
+        return vocab
+
+    # ---------------------------------------------------
+    # BULK LOOKUP
+    # ---------------------------------------------------
+    def lookup(self, model, model_name: str, phrases: List[str]) -> np.ndarray:
+        """
+        Return a contiguous float32 matrix with one row per phrase.
+        Phrases not in the vocabulary yet are encoded with `model` in one call.
+        """
+        normalized = [normalize_skill(p) for p in phrases]
+
+        with self._lock:
+            vocab = self._vocabulary_locked(model_name)
+            unknown = [p for p in dict.fromkeys(normalized) if p not in vocab.rows]
+            self.misses += len(unknown)
+            self.hits += len(set(normalized)) - len(unknown)
+
+        if unknown:
+            vectors = np.asarray(model.encode(unknown, convert_to_numpy=True), dtype="float32")
+            with self._lock:
+                # Another thread may have added some of these meanwhile
+                fresh = [i for i, p in enumerate(unknown) if p not in vocab.rows]
+                if fresh:
+                    fresh_phrases = [unknown[i] for i in fresh]
+                    fresh_vectors = vectors[fresh]
+                    vocab.extend(fresh_phrases, fresh_vectors)
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO skill_vocabulary (model, phrase, dim, vector) VALUES (?, ?, ?, ?)",
+                        [
+                            (model_name, p, int(v.shape[0]), np.ascontiguousarray(v).tobytes())
+                            for p, v in zip(fresh_phrases, fresh_vectors)
+                        ],
+                    )
+                    self._conn.commit()
+
+        with self._lock:
+            if not normalized:
+                dim = 0 if vocab.matrix is None else vocab.matrix.shape[1]
+                return np.zeros((0, dim), dtype="float32")
+            rows = np.fromiter((vocab.rows[p] for p in normalized), dtype="int64", count=len(normalized))
+            return np.ascontiguousarray(vocab.matrix[rows])
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "phrases": sum(len(v.rows) for v in self._models.values()),
+            }
+
+
+# ---------------------------------------------------
+# PROCESS-WIDE INSTANCE
+# ---------------------------------------------------
+_vocabulary = None
+_vocabulary_lock = threading.Lock()
+
+
+def get_skill_vocabulary() -> SkillVocabulary:
+    global _vocabulary
+    with _vocabulary_lock:
+        if _vocabulary is None:
+            _vocabulary = SkillVocabulary()
+        return _vocabulary
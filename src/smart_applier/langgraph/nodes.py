@@ -1,13 +1,11 @@
+import os
 from typing import Dict, Any, List
 import pandas as pd
 import numpy as np
 
-from smart_applier.agents.profile_agent import UserProfileAgent
-from smart_applier.agents.job_scraper_agent import JobScraperAgent
-from smart_applier.agents.job_matching_agent import JobMatchingAgent
-from smart_applier.agents.skill_gap_agent import SkillGapAgent
-from smart_applier.agents.resume_tailor_agent import ResumeTailorAgent
-from smart_applier.agents.resume_builder_agent import ResumeBuilderAgent
+# Agents are imported inside each node: they pull in sentence_transformers,
+# torch, faiss, google.generativeai and reportlab, and a workflow should only
+# pay for the ones its nodes actually use.
 
 
 # ======================================================
@@ -15,18 +13,77 @@ from smart_applier.agents.resume_builder_agent import ResumeBuilderAgent
 # ======================================================
 
 def load_profile_node(state):
+    from smart_applier.agents.profile_agent import UserProfileAgent
     agent = UserProfileAgent()
     profile = agent.load_profile(state["user_id"])
     return {"profile": profile}
 
 
 def scrape_jobs_node(state):
+    from smart_applier.agents.job_scraper_agent import JobScraperAgent
+    import smart_applier.search.job_index  # registers the index append hook for inserted jobs
     scraper = JobScraperAgent()
-    df = scraper.scrape_karkidi(pages=2)
+    df = scraper.scrape(pages=2)
     return {"scraped_jobs": df.to_dict(orient="records")}
 
 
+def scrape_new_jobs_node(state):
+    """Incremental scrape: only as many pages as it takes to reach known jobs."""
+    from smart_applier.agents.job_scraper_agent import JobScraperAgent
+    import smart_applier.search.job_index  # registers the index append hook for inserted jobs
+    scraper = JobScraperAgent()
+    df = scraper.scrape_incremental()
+    return {"scraped_jobs": df.to_dict(orient="records")}
+
+
+def load_corpus_node(state):
+    """
+    Jobs from the corpus kept fresh by the background refresh worker
+    (smart_applier/workers/corpus_refresh.py), newest first. A corpus not
+    refreshed within CORPUS_REFRESH_INTERVAL_SECONDS is served as it is while
+    a background refresh is requested; only an empty corpus falls back to an
+    inline scrape. With a `job_query`, the jobs are the full-text hits for it
+    from the whole corpus instead.
+    """
+    from smart_applier.utils.db_utils import get_all_scraped_jobs, get_scraped_jobs_by_ids
+    from smart_applier.workers.corpus_refresh import corpus_is_stale, request_refresh
+    limit = int(os.getenv("CORPUS_MATCH_LIMIT", "500"))
+    jobs = []
+    if state.get("job_query"):
+        from smart_applier.search.fulltext import FullTextUnavailable, candidate_ids
+        try:
+            ids = candidate_ids(state["job_query"], limit=limit + 1)
+            if len(ids) > limit:
+                print(f" More than {limit} jobs match '{state['job_query']}', matching the {limit} best "
+                      f"keyword hits (raise CORPUS_MATCH_LIMIT to consider more)")
+            jobs = get_scraped_jobs_by_ids(ids[:limit])
+        except FullTextUnavailable as e:
+            print(f" Keyword search unavailable: {e}")
+        if not jobs:
+            print(f" No stored jobs match '{state['job_query']}', loading the newest jobs")
+    if not jobs:
+        jobs = get_all_scraped_jobs(limit=limit)
+    if not jobs:
+        print(" Job corpus is empty, scraping inline")
+        return scrape_jobs_node(state)
+    if corpus_is_stale():
+        # Never blocks: the next run sees the refreshed corpus
+        print(" WARNING: job corpus is due for a refresh, serving it as is and refreshing in the background")
+        request_refresh()
+    for job in jobs:
+        job["db_id"] = job["id"]
+    return {"scraped_jobs": jobs}
+
+
+def get_jobs_node():
+    """load_corpus_node, or scrape_jobs_node with JOB_CORPUS_MODE=inline."""
+    if os.getenv("JOB_CORPUS_MODE", "corpus").lower() == "inline":
+        return scrape_jobs_node
+    return load_corpus_node
+
+
 def embed_profile_node(state):
+    from smart_applier.agents.job_matching_agent import JobMatchingAgent
     matcher = JobMatchingAgent()
     vec = matcher.embed_user_profile(state["profile"])
     vec = np.array(vec, dtype="float32")
@@ -34,6 +91,7 @@ def embed_profile_node(state):
 
 
 def embed_jobs_node(state):
+    from smart_applier.agents.job_matching_agent import JobMatchingAgent
     matcher = JobMatchingAgent()
     df = pd.DataFrame(state["scraped_jobs"])
     vecs = matcher.embed_jobs(df)
@@ -42,6 +100,7 @@ def embed_jobs_node(state):
 
 
 def match_jobs_node(state):
+    from smart_applier.agents.job_matching_agent import JobMatchingAgent
     matcher = JobMatchingAgent()
     df = pd.DataFrame(state["scraped_jobs"])
 
@@ -56,13 +115,51 @@ def match_jobs_node(state):
         df,
         job_vecs,
         top_k=10,
-        user_id=state["user_id"]
+        user_id=state["user_id"],
+        keyword_query=state.get("job_query"),
     )
 
     return {"matched_jobs": matched_df.to_dict(orient="records")}
 
 
+def stream_scrape_match_node(state):
+    """Scrape, embed, index and match in one overlapped pass (see search/streaming.py)."""
+    from smart_applier.search.streaming import stream_scrape_and_match
+    result = stream_scrape_and_match(
+        pages=2,
+        profile_vector=np.array(state["profile_vector"], dtype="float32"),
+        top_k=10,
+        user_id=state["user_id"],
+    )
+    if result.matched_df is None:
+        raise ValueError(" No jobs scraped — cannot match jobs.")
+    return {
+        "scraped_jobs": result.jobs_df.to_dict(orient="records"),
+        "job_embeddings": result.embeddings,
+        "matched_jobs": result.matched_df.to_dict(orient="records"),
+    }
+
+
+def match_all_profiles_node(state):
+    """Refresh top matches for every stored profile in one batched search."""
+    from smart_applier.agents.job_matching_agent import JobMatchingAgent
+    matcher = JobMatchingAgent()
+
+    # Same candidate set as the per-user flow: the jobs from this scrape
+    restrict_ids = [
+        int(job["db_id"]) for job in state.get("scraped_jobs") or [] if job.get("db_id") is not None
+    ] or None
+
+    results = matcher.match_all_stored_profiles(top_k=10, restrict_ids=restrict_ids)
+    return {
+        "batch_matches": {
+            user_id: df.to_dict(orient="records") for user_id, df in results.items()
+        }
+    }
+
+
 def skill_gap_node(state):
+    from smart_applier.agents.skill_gap_agent import SkillGapAgent
     df = pd.DataFrame(state["scraped_jobs"])
     agent = SkillGapAgent(state["profile"], df)
     recs = agent.get_recommendations()
@@ -70,12 +167,14 @@ def skill_gap_node(state):
 
 
 def resume_builder_node(state):
+    from smart_applier.agents.resume_builder_agent import ResumeBuilderAgent
     builder = ResumeBuilderAgent(state["profile"])
     buffer = builder.build_resume()
     return {"resume_pdf_bytes": buffer.getvalue()}
 
 
 def tailor_resume_node(state):
+    from smart_applier.agents.resume_tailor_agent import ResumeTailorAgent
     agent = ResumeTailorAgent()
 
     if not state["matched_jobs"]:
@@ -97,6 +196,7 @@ def tailor_resume_node(state):
 # ======================================================
 
 def clean_jd_node(state):
+    from smart_applier.agents.resume_tailor_agent import ResumeTailorAgent
     jd_text = state["jd_text"]
     tailorer = ResumeTailorAgent()
 
@@ -110,6 +210,7 @@ def clean_jd_node(state):
 
 
 def tailor_resume_from_jd_node(state):
+    from smart_applier.agents.resume_tailor_agent import ResumeTailorAgent
     agent = ResumeTailorAgent()
     jd_keywords = state["jd_keywords"]
     profile = state["profile"]
@@ -137,6 +238,8 @@ def tailor_resume_from_jd_node(state):
 # ======================================================
 
 def jd_skill_gap_node(state):
+    from smart_applier.agents.skill_gap_agent import SkillGapAgent
+    from smart_applier.agents.resume_tailor_agent import ResumeTailorAgent
     jd_text = state["jd_text"]
     profile = state["profile"]
     tailorer = ResumeTailorAgent()
@@ -5,8 +5,11 @@ from smart_applier.langgraph.nodes import (
     load_profile_node,
     resume_builder_node,
     tailor_resume_node,
-    scrape_jobs_node,
+    get_jobs_node,
+    scrape_new_jobs_node,
     match_jobs_node,
+    match_all_profiles_node,
+    stream_scrape_match_node,
     skill_gap_node,
     embed_profile_node,
     embed_jobs_node,
@@ -21,8 +24,10 @@ class State(TypedDict, total=False):
     profile: dict
     jd_text: str
     jd_keywords: List[str]
+    job_query: str
     scraped_jobs: List[dict]
     matched_jobs: List[dict]
+    batch_matches: Dict[str, List[dict]]
     profile_vector: List[float]
     job_embeddings: List[List[float]]
     skill_gap_recommendations: Dict[str, List[str]]
@@ -52,7 +57,7 @@ def build_skillgap_workflow():
     graph = StateGraph(State)
 
     graph.add_node("load_profile", load_profile_node)
-    graph.add_node("scrape_jobs", scrape_jobs_node)
+    graph.add_node("scrape_jobs", get_jobs_node())
     graph.add_node("skill_gap", skill_gap_node)
 
     graph.add_edge("load_profile", "scrape_jobs")
@@ -86,7 +91,7 @@ def build_job_scraper_workflow():
     graph = StateGraph(State)
 
     graph.add_node("load_profile", load_profile_node)
-    graph.add_node("scrape_jobs", scrape_jobs_node)
+    graph.add_node("scrape_jobs", get_jobs_node())
     graph.add_node("embed_profile", embed_profile_node)
     graph.add_node("embed_jobs", embed_jobs_node)
     graph.add_node("match_jobs", match_jobs_node)
@@ -103,13 +108,34 @@ def build_job_scraper_workflow():
     graph.set_entry_point("load_profile")
     return graph.compile()
 # ------------------------------
+# Streaming Scraper + Matching Workflow
+# ------------------------------
+def build_streaming_job_scraper_workflow():
+    # Same result as build_job_scraper_workflow, but embedding and indexing
+    # overlap with page downloads instead of waiting for the whole scrape.
+    graph = StateGraph(State)
+
+    graph.add_node("load_profile", load_profile_node)
+    graph.add_node("embed_profile", embed_profile_node)
+    graph.add_node("stream_scrape_match", stream_scrape_match_node)
+    graph.add_node("skill_gap", skill_gap_node)
+    graph.add_node("tailor_resume", tailor_resume_node)
+    graph.add_edge("load_profile", "embed_profile")
+    graph.add_edge("embed_profile", "stream_scrape_match")
+    graph.add_edge("stream_scrape_match", "skill_gap")
+    graph.add_edge("skill_gap", "tailor_resume")
+    graph.add_edge("tailor_resume", END)
+
+    graph.set_entry_point("load_profile")
+    return graph.compile()
+# ------------------------------
 # Tailor Resume From Matched Job Workflow
 # ------------------------------
 def build_tailor_from_matched_workflow():
     graph = StateGraph(State)
 
     graph.add_node("load_profile", load_profile_node)
-    graph.add_node("scrape_jobs", scrape_jobs_node)
+    graph.add_node("scrape_jobs", get_jobs_node())
     graph.add_node("embed_profile", embed_profile_node)
     graph.add_node("embed_jobs", embed_jobs_node)
     graph.add_node("match_jobs", match_jobs_node)
@@ -125,13 +151,27 @@ def build_tailor_from_matched_workflow():
     graph.set_entry_point("load_profile")
     return graph.compile()
 # ------------------------------
+# Scrape → Refresh Matches For All Profiles
+# ------------------------------
+def build_refresh_all_matches_workflow():
+    graph = StateGraph(State)
+
+    graph.add_node("scrape_jobs", scrape_new_jobs_node)
+    graph.add_node("match_all_profiles", match_all_profiles_node)
+
+    graph.add_edge("scrape_jobs", "match_all_profiles")
+    graph.add_edge("match_all_profiles", END)
+
+    graph.set_entry_point("scrape_jobs")
+    return graph.compile()
+# ------------------------------
 # Skill Gap Workflow Graph
 # ------------------------------
 def build_skill_gap_graph():
     graph = StateGraph(State)
 
     graph.add_node("load_profile", load_profile_node)
-    graph.add_node("scrape_jobs", scrape_jobs_node)
+    graph.add_node("scrape_jobs", get_jobs_node())
     graph.add_node("skill_gap", skill_gap_node)
 
     graph.add_edge("load_profile", "scrape_jobs")
@@ -4,7 +4,7 @@ import pandas as pd
 
 from smart_applier.langgraph.nodes import (
     load_profile_node,
-    scrape_jobs_node,
+    get_jobs_node,
     embed_profile_node,
     embed_jobs_node,
     match_jobs_node,
@@ -21,6 +21,7 @@ class State(TypedDict, total=False):
     user_id: str
     profile: dict
 
+    job_query: str
     scraped_jobs: List[dict]
     profile_vector: List[float]
     job_embeddings: List[List[float]]
@@ -39,7 +40,7 @@ def build_master_workflow():
     graph = StateGraph(State)
 
     graph.add_node("load_profile", load_profile_node)
-    graph.add_node("scrape_jobs", scrape_jobs_node)
+    graph.add_node("scrape_jobs", get_jobs_node())
     graph.add_node("embed_profile", embed_profile_node)
     graph.add_node("embed_jobs", embed_jobs_node)
     graph.add_node("match_jobs", match_jobs_node)
@@ -0,0 +1,130 @@
+# src/smart_applier/scraping/fetcher.py
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from smart_applier.scraping.rate_limit import HostRateLimiter
+from smart_applier.scraping.http_cache import ResponseCache
+
+# Defaults keep the old politeness (~1 request/second per host) while letting
+# slow round trips overlap. Raise SCRAPER_RATE_PER_SEC to scale throughput.
+DEFAULT_CONCURRENCY = int(os.getenv("SCRAPER_CONCURRENCY", "4"))
+DEFAULT_RATE_PER_SEC = float(os.getenv("SCRAPER_RATE_PER_SEC", "1.0"))
+DEFAULT_BURST = int(os.getenv("SCRAPER_BURST", "1"))
+
+
+@dataclass
+class FetchResult:
+    url: str
+    status: Optional[int] = None
+    content: bytes = b""
+    error: Optional[str] = None
+    seconds: float = 0.0
+    waited: float = 0.0
+    from_cache: bool = False   # content came from the response cache
+    unchanged: bool = False    # same content as the cached copy (fresh, 304 or identical 200)
+
+    @property
+    def ok(self) -> bool:
+        return self.status in (200, 304) and self.error is None
+
+
+# ---------------------------------------------------
+# CONCURRENT PAGE FETCHER
+# ---------------------------------------------------
+class PageFetcher:
+    """
+    Fetches URLs on a bounded thread pool. Every request first takes a token
+    from its host's bucket, so throughput follows the allowed request rate
+    (up to `concurrency` requests in flight) instead of one page at a time.
+
+    Requests share one keep-alive Session whose pool holds a connection per
+    worker. With a `cache`, pages are revalidated with conditional headers
+    (pages within the cache's TTL, if one is set, are served without a request
+    unless `revalidate` is passed).
+    """
+
+    def __init__(
+        self,
+        headers: Dict[str, str] = None,
+        concurrency: int = None,
+        rate_per_sec: float = None,
+        burst: int = None,
+        timeout: float = 10,
+        cache: ResponseCache = None,
+    ):
+        self.headers = headers or {}
+        self.concurrency = max(1, concurrency or DEFAULT_CONCURRENCY)
+        self.limiter = HostRateLimiter(rate_per_sec or DEFAULT_RATE_PER_SEC, burst or DEFAULT_BURST)
+        self.timeout = timeout
+        self.cache = cache
+
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=self.concurrency, pool_maxsize=self.concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def fetch(self, url: str, revalidate: bool = False) -> FetchResult:
+        entry = self.cache.lookup(url) if self.cache else None
+        if entry and not revalidate and self.cache.is_fresh(entry):
+            self.cache.count("fresh_hits")
+            return FetchResult(url, 200, entry["body"], from_cache=True, unchanged=True)
+
+        waited = self.limiter.acquire(url)
+        start = time.perf_counter()
+        try:
+            response = self.session.get(
+                url, headers=ResponseCache.conditional_headers(entry), timeout=self.timeout
+            )
+        except Exception as e:
+            return FetchResult(url, error=str(e), seconds=time.perf_counter() - start, waited=waited)
+        seconds = time.perf_counter() - start
+
+        if response.status_code == 304 and entry:
+            self.cache.touch(url)
+            self.cache.count("revalidated")
+            return FetchResult(url, 304, entry["body"], seconds=seconds, waited=waited,
+                               from_cache=True, unchanged=True)
+
+        unchanged = False
+        if self.cache and response.status_code == 200:
+            changed = self.cache.store(
+                url, response.content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+            unchanged = not changed
+            self.cache.count("unchanged" if unchanged else "misses")
+        return FetchResult(url, response.status_code, response.content,
+                           seconds=seconds, waited=waited, unchanged=unchanged)
+
+    def fetch_all(self, urls: List[str], revalidate: bool = False) -> List[FetchResult]:
+        """Fetch every URL; results come back in the order of `urls`."""
+        if len(urls) <= 1 or self.concurrency == 1:
+            return [self.fetch(url, revalidate) for url in urls]
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(urls))) as pool:
+            return list(pool.map(lambda url: self.fetch(url, revalidate), urls))
+
+    def iter_fetch(self, urls: List[str], revalidate: bool = False) -> Iterator[Tuple[int, FetchResult]]:
+        """Yield (position in `urls`, result) as soon as each fetch completes."""
+        if len(urls) <= 1 or self.concurrency == 1:
+            for position, url in enumerate(urls):
+                yield position, self.fetch(url, revalidate)
+            return
+        pool = ThreadPoolExecutor(max_workers=min(self.concurrency, len(urls)))
+        try:
+            futures = {pool.submit(self.fetch, url, revalidate): position for position, url in enumerate(urls)}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # A consumer that stops early shouldn't wait for pages it won't read
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def close(self):
+        self.session.close()
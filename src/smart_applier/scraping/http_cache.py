@@ -0,0 +1,185 @@
+# src/smart_applier/scraping/http_cache.py
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+from smart_applier.utils.path_utils import get_data_dirs
+
+
+# ---------------------------------------------------
+# CONFIG
+# ---------------------------------------------------
+# Every fetch revalidates its page with If-None-Match / If-Modified-Since:
+# newest-first listings change whenever a job is posted. A TTL > 0 opts in
+# to serving younger cached pages without any request (e.g. for replays).
+DEFAULT_TTL_SECONDS = float(os.getenv("SCRAPER_CACHE_TTL_SECONDS", "0"))
+
+
+def body_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+class ResponseCache:
+    """
+    On-disk cache of fetched pages keyed by URL, with their validators
+    (ETag / Last-Modified) and the jobs parsed from them. A page that comes
+    back 304 (or byte-identical) can reuse those jobs instead of being parsed.
+    """
+
+    def __init__(self, db_path: Path = None, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        if db_path is None:
+            db_path = get_data_dirs()["cache"] / "http_cache.db"
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+
+        self.fresh_hits = 0      # served within TTL, no request made
+        self.revalidated = 0     # 304 Not Modified
+        self.unchanged = 0       # 200 with a byte-identical body
+        self.misses = 0          # new or changed page
+        self.parse_skips = 0     # pages whose cached jobs were reused
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+        CREATE TABLE IF NOT EXISTS http_responses (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            body_hash TEXT NOT NULL,
+            body BLOB NOT NULL,
+            parsed_json TEXT,
+            fetched_at REAL NOT NULL,
+            validated_at REAL NOT NULL
+        )
+        """)
+        self._conn.commit()
+
+    # ---------------------------------------------------
+    # LOOKUP
+    # ---------------------------------------------------
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body_hash, body, validated_at "
+                "FROM http_responses WHERE url=?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, digest, body, validated_at = row
+        return {"etag": etag, "last_modified": last_modified, "body_hash": digest,
+                "body": bytes(body), "validated_at": validated_at}
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry["validated_at"] < self.ttl_seconds
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        headers = {}
+        if entry:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    # ---------------------------------------------------
+    # UPDATE
+    # ---------------------------------------------------
+    def touch(self, url: str):
+        """Mark a cached page as revalidated now (after a 304)."""
+        with self._lock:
+            self._conn.execute("UPDATE http_responses SET validated_at=? WHERE url=?", (time.time(), url))
+            self._conn.commit()
+
+    def store(self, url: str, content: bytes, etag: str = None, last_modified: str = None) -> bool:
+        """
+        Save a 200 response. Returns False when the body is identical to the
+        cached one (its parsed jobs stay valid), True when it is new or changed.
+        """
+        digest = body_hash(content)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT body_hash FROM http_responses WHERE url=?", (url,)).fetchone()
+            changed = row is None or row[0] != digest
+            if changed:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO http_responses "
+                    "(url, etag, last_modified, body_hash, body, parsed_json, fetched_at, validated_at) "
+                    "VALUES (?, ?, ?, ?, ?, NULL, ?, ?)",
+                    (url, etag, last_modified, digest, content, now, now),
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE http_responses SET etag=?, last_modified=?, validated_at=? WHERE url=?",
+                    (etag, last_modified, now, url),
+                )
+            self._conn.commit()
+        return changed
+
+    def get_parsed(self, url: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            row = self._conn.execute("SELECT parsed_json FROM http_responses WHERE url=?", (url,)).fetchone()
+        return json.loads(row[0]) if row and row[0] is not None else None
+
+    def set_parsed(self, url: str, jobs: List[Dict[str, Any]]):
+        with self._lock:
+            self._conn.execute("UPDATE http_responses SET parsed_json=? WHERE url=?", (json.dumps(jobs), url))
+            self._conn.commit()
+
+    def clear_parsed(self):
+        """Forget every page's parsed jobs (their DB rows are gone); bodies and validators stay."""
+        with self._lock:
+            self._conn.execute("UPDATE http_responses SET parsed_json=NULL")
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM http_responses")
+            self._conn.commit()
+
+    # ---------------------------------------------------
+    # REPORTING
+    # ---------------------------------------------------
+    def count(self, event: str):
+        """Bump a hit/miss counter; fetches run on several threads."""
+        with self._lock:
+            setattr(self, event, getattr(self, event) + 1)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM http_responses").fetchone()[0]
+        requests_saved = self.fresh_hits
+        served = self.fresh_hits + self.revalidated + self.unchanged
+        total = served + self.misses
+        return {
+            "fresh_hits": self.fresh_hits,
+            "revalidated_304": self.revalidated,
+            "unchanged_200": self.unchanged,
+            "misses": self.misses,
+            "parse_skips": self.parse_skips,
+            "requests_saved": requests_saved,
+            "hit_rate": round(served / total, 3) if total else None,
+            "entries": size,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+# ---------------------------------------------------
+# PROCESS-WIDE INSTANCE
+# ---------------------------------------------------
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
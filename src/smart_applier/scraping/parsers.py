@@ -0,0 +1,200 @@
+# src/smart_applier/scraping/parsers.py
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Any
+
+from bs4 import BeautifulSoup
+
+JOB_FIELDS = ("title", "company", "location", "experience", "skills", "summary", "posted_on")
+
+Parser = Callable[[bytes], List[Dict[str, Any]]]
+
+
+# ---------------------------------------------------
+# BEAUTIFULSOUP (reference implementation)
+# ---------------------------------------------------
+def parse_jobs_bs4(content: bytes) -> List[Dict[str, Any]]:
+    jobs_list: List[Dict[str, Any]] = []
+    soup = BeautifulSoup(content, "html.parser")
+    job_blocks = soup.find_all("div", class_="ads-details")
+
+    for job in job_blocks:
+        try:
+            title = job.find("h4").get_text(strip=True) if job.find("h4") else ""
+            company_tag = job.find("a", href=lambda x: x and "Employer-Profile" in x)
+            company = company_tag.get_text(strip=True) if company_tag else "Unknown Company"
+            location = job.find("p").get_text(strip=True) if job.find("p") else ""
+            experience_tag = job.find("p", class_="emp-exp")
+            experience = experience_tag.get_text(strip=True) if experience_tag else ""
+            key_skills_tag = job.find("span", string="Key Skills")
+            skills = key_skills_tag.find_next("p").get_text(strip=True) if key_skills_tag else ""
+            summary_tag = job.find("span", string="Summary")
+            summary = summary_tag.find_next("p").get_text(strip=True) if summary_tag else ""
+            posted_tag = job.find("span", string="Posted On")
+            posted_date = posted_tag.find_next("p").get_text(strip=True) if posted_tag else ""
+
+            jobs_list.append({
+                "title": title,
+                "company": company,
+                "location": location,
+                "experience": experience,
+                "skills": skills,
+                "summary": summary,
+                "posted_on": posted_date,
+            })
+        except Exception as e:
+            print(f" Error parsing job block: {e}")
+            continue
+
+    return jobs_list
+
+
+# ---------------------------------------------------
+# LXML + XPATH
+# ---------------------------------------------------
+# Same lookups as the BeautifulSoup parser, compiled once:
+#  - class tests match one token of a multi-valued class attribute (like class_=)
+#  - "(descendant::p | following::p)[1]" is find_next("p"): the first <p> after
+#    the label in document order, even outside the job block
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+_XPATHS = None
+
+
+def _xpaths():
+    global _XPATHS
+    if _XPATHS is None:
+        from lxml import etree
+
+        _XPATHS = {
+            "blocks": etree.XPath(f"//div[{_has_class('ads-details')}]"),
+            "title": etree.XPath("(.//h4)[1]"),
+            "company": etree.XPath("(.//a[contains(@href, 'Employer-Profile')])[1]"),
+            "location": etree.XPath("(.//p)[1]"),
+            "experience": etree.XPath(f"(.//p[{_has_class('emp-exp')}])[1]"),
+            "label": {
+                label: etree.XPath(f'.//span[. = "{label}"]')
+                for label in ("Key Skills", "Summary", "Posted On")
+            },
+            "next_p": etree.XPath("(descendant::p | following::p)[1]"),
+            "text": etree.XPath(".//text()"),
+        }
+    return _XPATHS
+
+
+def _text(xp, element) -> str:
+    # get_text(strip=True): strip each text node and concatenate
+    return "".join(t.strip() for t in xp["text"](element))
+
+
+def _first_text(xp, query, element, default: str = "") -> str:
+    found = query(element)
+    return _text(xp, found[0]) if found else default
+
+
+def _single_string(element):
+    """BeautifulSoup's Tag.string: the text of a tag with exactly one child, recursively."""
+    while len(element):
+        if len(element) > 1 or element.text or element[0].tail:
+            return None
+        element = element[0]
+    return element.text
+
+
+def _label_text(xp, label: str, element) -> str:
+    # The XPath match is on full text content; string= additionally needs the
+    # label to be the span's only string
+    for span in xp["label"][label](element):
+        if _single_string(span) == label:
+            value = xp["next_p"](span)
+            return _text(xp, value[0]) if value else ""
+    return ""
+
+
+def _decode_root(content: bytes):
+    from lxml import html
+
+    try:
+        content.decode("utf-8")
+        parser = html.HTMLParser(encoding="utf-8")
+    except UnicodeDecodeError:
+        # Let libxml2 use the page's declared charset
+        parser = html.HTMLParser()
+    return html.document_fromstring(content, parser=parser)
+
+
+def parse_jobs_lxml(content: bytes) -> List[Dict[str, Any]]:
+    xp = _xpaths()
+    jobs_list: List[Dict[str, Any]] = []
+    if not content or not content.strip():
+        return jobs_list
+    root = _decode_root(content)
+
+    for job in xp["blocks"](root):
+        try:
+            jobs_list.append({
+                "title": _first_text(xp, xp["title"], job),
+                "company": _first_text(xp, xp["company"], job, "Unknown Company"),
+                "location": _first_text(xp, xp["location"], job),
+                "experience": _first_text(xp, xp["experience"], job),
+                "skills": _label_text(xp, "Key Skills", job),
+                "summary": _label_text(xp, "Summary", job),
+                "posted_on": _label_text(xp, "Posted On", job),
+            })
+        except Exception as e:
+            print(f" Error parsing job block: {e}")
+            continue
+
+    return jobs_list
+
+
+# ---------------------------------------------------
+# REGISTRY
+# ---------------------------------------------------
+PARSERS: Dict[str, Parser] = {
+    "bs4": parse_jobs_bs4,
+    "lxml": parse_jobs_lxml,
+}
+
+
+def lxml_available() -> bool:
+    try:
+        import lxml.html  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def get_parser(name: str = None) -> Parser:
+    """
+    Parser by name (SCRAPER_PARSER: lxml, bs4). Defaults to lxml when it is
+    installed and falls back to BeautifulSoup otherwise.
+    """
+    name = (name or os.getenv("SCRAPER_PARSER") or ("lxml" if lxml_available() else "bs4")).lower()
+    if name not in PARSERS:
+        raise ValueError(f"Unknown parser '{name}'. Choose from {tuple(PARSERS)}.")
+    if name == "lxml" and not lxml_available():
+        print(" lxml is not installed, falling back to the BeautifulSoup parser")
+        name = "bs4"
+    return PARSERS[name]
+
+
+def parse_pages(contents: List[bytes], parser: Parser = None, processes: int = None) -> List[List[Dict[str, Any]]]:
+    """
+    Parse several pages, one job list per page in input order. With
+    `processes` > 1 (SCRAPER_PARSE_PROCESSES) pages are parsed in a process
+    pool, which only pays off for many or very large pages.
+    """
+    parser = parser or get_parser()
+    if processes is None:
+        processes = int(os.getenv("SCRAPER_PARSE_PROCESSES", "0"))
+    if processes <= 1 or len(contents) <= 1:
+        return [parser(content) for content in contents]
+
+    workers = min(processes, len(contents))
+    # A few chunks per worker keeps pickling round trips low without idling workers
+    chunksize = max(1, len(contents) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(parser, contents, chunksize=chunksize))
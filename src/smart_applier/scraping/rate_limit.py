@@ -0,0 +1,67 @@
+# src/smart_applier/scraping/rate_limit.py
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlsplit
+
+
+# ---------------------------------------------------
+# TOKEN BUCKET
+# ---------------------------------------------------
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens per second refill up to `burst`.
+    acquire() blocks until a token is available.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be > 0 requests/second")
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping as needed. Returns the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            # Sleep outside the lock so other threads can refill/check
+            time.sleep(delay)
+            waited += delay
+
+
+# ---------------------------------------------------
+# PER-HOST LIMITER
+# ---------------------------------------------------
+class HostRateLimiter:
+    """One TokenBucket per host, so a slow site never throttles another."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        return self.bucket_for(url).acquire()
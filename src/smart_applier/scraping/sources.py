@@ -0,0 +1,193 @@
+# src/smart_applier/scraping/sources.py
+import os
+import json
+import time
+from abc import ABC, abstractmethod
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterator, List, Any, Tuple
+
+from smart_applier.scraping.fetcher import PageFetcher, FetchResult
+from smart_applier.scraping.parsers import Parser, get_parser
+from smart_applier.scraping.rate_limit import TokenBucket
+
+
+# ---------------------------------------------------
+# INTERFACE
+# ---------------------------------------------------
+class JobSource(ABC):
+    """
+    A paginated listing of jobs. Sources only fetch and parse; de-duplication,
+    storage, caching of parsed pages and watermarks are handled by
+    JobScraperAgent for every source alike.
+
+    `name` keys the source's incremental-scrape watermark. `revalidate`
+    asks sources with a response cache to check every page with the site
+    rather than serve pages still within the cache's TTL.
+    """
+
+    name = "source"
+
+    def __init__(self, parser: Parser = None):
+        # Must be picklable (a module-level function or a partial of one) so
+        # pages can be parsed in a process pool
+        self.parser = parser or get_parser()
+
+    def fetch_pages(self, pages: int, first_page: int = 1, revalidate: bool = False) -> List[FetchResult]:
+        """Pages first_page .. first_page+pages-1, in page order."""
+        return [result for _, result in sorted(self.iter_pages(pages, first_page, revalidate), key=lambda r: r[0])]
+
+    @abstractmethod
+    def iter_pages(self, pages: int, first_page: int = 1,
+                   revalidate: bool = False) -> Iterator[Tuple[int, FetchResult]]:
+        """Yield (page, result), in whatever order pages become available."""
+
+    def finalize(self, page: int, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Per-page hook applied after parsing."""
+        return jobs
+
+    def describe(self) -> str:
+        return self.name
+
+
+# ---------------------------------------------------
+# KARKIDI (live site)
+# ---------------------------------------------------
+class KarkidiSource(JobSource):
+    name = "karkidi"
+
+    def __init__(self, fetcher: PageFetcher, parser: Parser = None, base_url: str = None):
+        super().__init__(parser)
+        self.fetcher = fetcher
+        # KARKIDI_BASE_URL points the scraper at a local stand-in (see benchmarks/karkidi_stub.py)
+        base_url = base_url or os.getenv("KARKIDI_BASE_URL", "https://www.karkidi.com")
+        self.url_template = base_url.rstrip("/") + "/Find-Jobs/{page}/all/India"
+
+    def page_urls(self, pages: int, first_page: int = 1) -> List[str]:
+        return [self.url_template.format(page=page) for page in range(first_page, first_page + pages)]
+
+    def fetch_pages(self, pages: int, first_page: int = 1, revalidate: bool = False) -> List[FetchResult]:
+        return self.fetcher.fetch_all(self.page_urls(pages, first_page), revalidate)
+
+    def iter_pages(self, pages: int, first_page: int = 1,
+                   revalidate: bool = False) -> Iterator[Tuple[int, FetchResult]]:
+        for position, result in self.fetcher.iter_fetch(self.page_urls(pages, first_page), revalidate):
+            yield first_page + position, result
+
+    def describe(self) -> str:
+        return (f"{self.name} (concurrency={self.fetcher.concurrency}, "
+                f"rate={self.fetcher.limiter.rate}/s per host)")
+
+
+# ---------------------------------------------------
+# REPLAY (offline fixtures, for load tests)
+# ---------------------------------------------------
+def parse_fixture(content: bytes, html_parser: Parser = None) -> List[Dict[str, Any]]:
+    """
+    A JSON fixture is a list of job dicts (or {"jobs": [...]}); anything else
+    is parsed as a Karkidi HTML page.
+    """
+    if content.lstrip()[:1] in (b"[", b"{"):
+        data = json.loads(content)
+        jobs = data.get("jobs", []) if isinstance(data, dict) else data
+        return [dict(job) for job in jobs]
+    return (html_parser or get_parser())(content)
+
+
+class ReplaySource(JobSource):
+    """
+    Serves recorded pages from `fixtures_dir` (*.html in Karkidi markup and/or
+    *.json job lists) instead of the network. Pages cycle through the
+    fixtures, so any page count (and job volume) can be replayed.
+
+    `rate_per_sec` throttles pages like a real site would (None = unthrottled).
+    With `unique`, every replay cycle gets distinct postings, so 100k replayed
+    jobs are 100k rows rather than collapsing onto the fixtures' fingerprints.
+    """
+
+    name = "replay"
+
+    def __init__(self, fixtures_dir, rate_per_sec: float = None, unique: bool = True,
+                 parser: Parser = None, name: str = None):
+        super().__init__(partial(parse_fixture, html_parser=parser or get_parser()))
+        self.fixtures_dir = Path(fixtures_dir)
+        self.fixtures = sorted(
+            p for p in self.fixtures_dir.iterdir() if p.suffix.lower() in (".html", ".htm", ".json")
+        )
+        if not self.fixtures:
+            raise ValueError(f"No .html/.json fixtures found in {self.fixtures_dir}")
+        self._content = {path: path.read_bytes() for path in self.fixtures}
+        self.bucket = TokenBucket(rate_per_sec) if rate_per_sec else None
+        self.unique = unique
+        if name:
+            self.name = name
+
+    def fixture_for(self, page: int) -> Path:
+        return self.fixtures[(page - 1) % len(self.fixtures)]
+
+    def iter_pages(self, pages: int, first_page: int = 1,
+                   revalidate: bool = False) -> Iterator[Tuple[int, FetchResult]]:
+        for page in range(first_page, first_page + pages):
+            waited = self.bucket.acquire() if self.bucket else 0.0
+            path = self.fixture_for(page)
+            yield page, FetchResult(f"replay://{self.name}/{page}/{path.name}", 200,
+                                    self._content[path], waited=waited)
+
+    def finalize(self, page: int, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if self.unique:
+            cycle = (page - 1) // len(self.fixtures)
+            if cycle:
+                for job in jobs:
+                    job["summary"] = f"{job.get('summary') or ''} [replay {cycle}]".strip()
+        return jobs
+
+    def describe(self) -> str:
+        rate = f"{self.bucket.rate}/s" if self.bucket else "unthrottled"
+        return f"{self.name} ({len(self.fixtures)} fixtures from {self.fixtures_dir}, {rate})"
+
+
+# ---------------------------------------------------
+# CONFIG
+# ---------------------------------------------------
+def build_sources(spec: str, fetcher: PageFetcher, parser: Parser = None) -> List[JobSource]:
+    """
+    Sources from a JOB_SOURCES-style spec: comma separated "karkidi" and
+    "replay:<fixtures dir>[@<pages per second>]" entries.
+    """
+    sources: List[JobSource] = []
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        kind, _, arg = entry.partition(":")
+        if kind == "karkidi":
+            sources.append(KarkidiSource(fetcher, parser))
+        elif kind == "replay" and arg:
+            path, _, rate = arg.partition("@")
+            sources.append(ReplaySource(path, rate_per_sec=float(rate) if rate else None, parser=parser,
+                                        name=f"replay:{Path(path).name}"))
+        else:
+            raise ValueError(f"Unknown job source '{entry}'. Use 'karkidi' or 'replay:<dir>[@rate]'.")
+    return sources
+
+
+# ---------------------------------------------------
+# CLI: record live pages as replay fixtures
+#   python -m smart_applier.scraping.sources record <out dir> [pages]
+# ---------------------------------------------------
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 3 or sys.argv[1] != "record":
+        print("Usage: python -m smart_applier.scraping.sources record <out dir> [pages]")
+        sys.exit(2)
+
+    out_dir = Path(sys.argv[2])
+    out_dir.mkdir(parents=True, exist_ok=True)
+    source = KarkidiSource(PageFetcher({"User-Agent": "Mozilla/5.0"}))
+    n_pages = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    start = time.perf_counter()
+    for page, result in enumerate(source.fetch_pages(n_pages), start=1):
+        if result.ok:
+            (out_dir / f"page_{page}.html").write_bytes(result.content)
+            print(f" Recorded page {page} ({len(result.content)} bytes)")
+        else:
+            print(f" Skipped page {page}: {result.error or result.status}")
+    print(f" Done in {time.perf_counter() - start:.1f}s")
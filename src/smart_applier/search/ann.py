@@ -0,0 +1,138 @@
+# src/smart_applier/search/ann.py
+import os
+import json
+from typing import Dict, Any
+
+import faiss
+
+# ---------------------------------------------------
+# INDEX TYPES + DEFAULT PARAMETERS
+# ---------------------------------------------------
+# All indexes use inner product on L2-normalized vectors (= cosine).
+DEFAULT_PARAMS: Dict[str, Dict[str, Any]] = {
+    "flat": {},
+    "ivf_flat": {"nlist": 1024, "nprobe": 16},
+    "ivf_pq": {"nlist": 1024, "nprobe": 16, "m": 48, "nbits": 8},
+    "hnsw": {"M": 32, "ef_construction": 200, "ef_search": 64},
+}
+INDEX_TYPES = tuple(DEFAULT_PARAMS)
+
+# FAISS wants ~39 training points per IVF centroid
+_MIN_POINTS_PER_CENTROID = 39
+
+
+def get_index_config() -> Dict[str, Any]:
+    """
+    Index type from JOB_INDEX_TYPE (flat, ivf_flat, ivf_pq, hnsw) and optional
+    overrides from JOB_INDEX_PARAMS, e.g. '{"nlist": 4096, "nprobe": 32}'.
+    """
+    index_type = os.getenv("JOB_INDEX_TYPE", "flat").lower()
+    overrides = json.loads(os.getenv("JOB_INDEX_PARAMS", "") or "{}")
+    return {"index_type": index_type, "params": resolve_params(index_type, overrides)}
+
+
+def resolve_params(index_type: str, overrides: Dict[str, Any] = None) -> Dict[str, Any]:
+    if index_type not in DEFAULT_PARAMS:
+        raise ValueError(f"Unknown index type '{index_type}'. Choose from {INDEX_TYPES}.")
+    return {**DEFAULT_PARAMS[index_type], **(overrides or {})}
+
+
+def needs_training(index_type: str) -> bool:
+    return index_type in ("ivf_flat", "ivf_pq")
+
+
+def supports_removal(index_type: str) -> bool:
+    return index_type != "hnsw"
+
+
+def min_training_points(index_type: str, params: Dict[str, Any]) -> int:
+    """Vectors needed to train the index at its configured size (0 if untrained)."""
+    if not needs_training(index_type):
+        return 0
+    params = resolve_params(index_type, params)
+    points = _MIN_POINTS_PER_CENTROID * params["nlist"]
+    if index_type == "ivf_pq":
+        # Each PQ sub-quantizer has 2**nbits centroids to train as well
+        points = max(points, _MIN_POINTS_PER_CENTROID * 2 ** params["nbits"])
+    return points
+
+
+def effective_nlist(nlist: int, n_train: int) -> int:
+    """Shrink nlist when there are too few training vectors for it."""
+    return max(1, min(nlist, n_train // _MIN_POINTS_PER_CENTROID))
+
+
+# ---------------------------------------------------
+# CONSTRUCTION
+# ---------------------------------------------------
+def build_index(index_type: str, dim: int, params: Dict[str, Any], n_train: int = None):
+    """
+    Create an empty (possibly untrained) inner-product index.
+    `n_train` caps nlist for IVF indexes trained on small corpora.
+    """
+    params = resolve_params(index_type, params)
+
+    if index_type == "flat":
+        return faiss.IndexFlatIP(dim)
+
+    if index_type == "hnsw":
+        index = faiss.IndexHNSWFlat(dim, params["M"], faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = params["ef_construction"]
+        index.hnsw.efSearch = params["ef_search"]
+        return index
+
+    nlist = params["nlist"] if n_train is None else effective_nlist(params["nlist"], n_train)
+    quantizer = faiss.IndexFlatIP(dim)
+    if index_type == "ivf_flat":
+        index = faiss.IndexIVFFlat(quantizer, dim, nlist, faiss.METRIC_INNER_PRODUCT)
+    else:
+        if dim % params["m"] != 0:
+            raise ValueError(f"ivf_pq: m={params['m']} must divide the embedding dim {dim}")
+        nbits = params["nbits"]
+        # Each PQ sub-quantizer has 2**nbits centroids to train as well
+        while n_train is not None and nbits > 4 and n_train < _MIN_POINTS_PER_CENTROID * 2 ** nbits:
+            nbits -= 1
+        index = faiss.IndexIVFPQ(quantizer, dim, nlist, params["m"], nbits,
+                                 faiss.METRIC_INNER_PRODUCT)
+    # faiss' Python wrapper keeps `quantizer` alive via the index's references
+    index.nprobe = min(params["nprobe"], nlist)
+    return index
+
+
+# ---------------------------------------------------
+# SEARCH-TIME PARAMETERS
+# ---------------------------------------------------
+def apply_search_params(index, index_type: str, params: Dict[str, Any]):
+    """Set nprobe / efSearch on a (possibly IDMap-wrapped) index after loading."""
+    params = resolve_params(index_type, params)
+    if needs_training(index_type):
+        ivf = faiss.extract_index_ivf(index)
+        ivf.nprobe = min(params["nprobe"], ivf.nlist)
+    elif index_type == "hnsw":
+        base = faiss.downcast_index(index.index if hasattr(index, "id_map") else index)
+        base.hnsw.efSearch = params["ef_search"]
+
+
+def search_parameters(index, index_type: str, params: Dict[str, Any], selector=None):
+    """
+    SearchParameters for a filtered search. Passing params replaces the index's
+    own nprobe/efSearch, so they are carried over explicitly.
+    """
+    params = resolve_params(index_type, params)
+    if needs_training(index_type):
+        ivf = faiss.extract_index_ivf(index)
+        search_params = faiss.SearchParametersIVF()
+        search_params.nprobe = min(params["nprobe"], ivf.nlist)
+    elif index_type == "hnsw":
+        search_params = faiss.SearchParametersHNSW()
+        search_params.efSearch = params["ef_search"]
+    else:
+        search_params = faiss.SearchParameters()
+    if selector is not None:
+        search_params.sel = selector
+    return search_params
+
+
+def index_memory_bytes(index) -> int:
+    """Serialized size — a close proxy for the resident size of the index."""
+    return int(faiss.serialize_index(index).nbytes)
@@ -0,0 +1,174 @@
+# src/smart_applier/search/fulltext.py
+import os
+import re
+import sys
+import sqlite3
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from smart_applier.database.connection import get_connection, transaction
+
+# ---------------------------------------------------
+# CONFIG
+# ---------------------------------------------------
+# Default number of best BM25 hits search_jobs / candidate_ids return;
+# keyword matching (lexical_scores) always scores every hit
+CANDIDATE_LIMIT = int(os.getenv("FTS_CANDIDATE_LIMIT", "500"))
+# Share of BM25 in the hybrid score; the rest is the FAISS cosine score
+LEXICAL_WEIGHT = float(os.getenv("HYBRID_LEXICAL_WEIGHT", "0.3"))
+
+FTS_TABLE = "scraped_jobs_fts"
+FTS_COLUMNS = ("title", "skills", "summary", "location")
+# BM25 column weights, in FTS_COLUMNS order
+FTS_WEIGHTS = (4.0, 3.0, 1.0, 2.0)
+
+
+class FullTextUnavailable(RuntimeError):
+    """The SQLite build has no FTS5, or the index was never created."""
+
+
+# ---------------------------------------------------
+# INDEX (created by schema migration 6)
+# ---------------------------------------------------
+def create_fulltext_index(cur: sqlite3.Cursor):
+    """
+    External-content FTS5 table over scraped_jobs: the text is stored once (in
+    scraped_jobs), the FTS table only holds the inverted index. Triggers keep
+    it in sync with every insert, delete and text update, and existing rows
+    are indexed by the 'rebuild' command.
+    """
+    columns = ", ".join(FTS_COLUMNS)
+    new_values = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+    old_values = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+    cur.execute(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+            {columns},
+            content='scraped_jobs', content_rowid='id',
+            tokenize='porter unicode61 remove_diacritics 2'
+        )
+    """)
+    cur.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_insert AFTER INSERT ON scraped_jobs BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (new.id, {new_values});
+        END
+    """)
+    cur.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_delete AFTER DELETE ON scraped_jobs BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+        END
+    """)
+    # Refreshing experience/posted_on on duplicates doesn't touch the index
+    cur.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_update AFTER UPDATE OF {columns} ON scraped_jobs BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+            INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (new.id, {new_values});
+        END
+    """)
+    # ORDER BY rank then sorts by the weighted BM25
+    weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+    cur.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank) VALUES ('rank', 'bm25({weights})')")
+    cur.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def fulltext_available(conn: sqlite3.Connection = None) -> bool:
+    conn = conn or get_connection()
+    row = conn.execute("SELECT 1 AS found FROM sqlite_master WHERE type='table' AND name=?",
+                       (FTS_TABLE,)).fetchone()
+    return row is not None
+
+
+# ---------------------------------------------------
+# QUERIES
+# ---------------------------------------------------
+def _phrase(text: str) -> str:
+    # A quoted FTS5 string is tokenized like the indexed text, so "node.js"
+    # becomes the phrase "node js" and query syntax in user input is inert
+    return '"' + text.replace('"', '""') + '"'
+
+
+def to_match_query(query: str, location: str = None) -> Optional[str]:
+    """
+    Free text to an FTS5 expression: every word must appear (in any indexed
+    column); `location` must appear as a phrase in the location column.
+    None if nothing searchable is left.
+    """
+    terms = [_phrase(word) for word in (query or "").split() if re.search(r"\w", word)]
+    if location and re.search(r"\w", location):
+        terms.append(f"location : {_phrase(location)}")
+    return " AND ".join(terms) or None
+
+
+def search_jobs(query: str, location: str = None,
+                limit: Optional[int] = CANDIDATE_LIMIT) -> List[Tuple[int, float]]:
+    """
+    (scraped_jobs.id, BM25 score) of the best matching jobs, best first
+    (every matching job with limit=None). Scores are positive, higher is better.
+    """
+    match = to_match_query(query, location)
+    if match is None:
+        return []
+    conn = get_connection()
+    try:
+        rows = conn.execute(f"""
+            SELECT rowid AS id, -rank AS score FROM {FTS_TABLE}
+            WHERE {FTS_TABLE} MATCH ? ORDER BY rank LIMIT ?
+        """, (match, -1 if limit is None else int(limit))).fetchall()
+    except sqlite3.OperationalError as e:
+        if not fulltext_available(conn):
+            raise FullTextUnavailable(f"Full-text index {FTS_TABLE} does not exist") from e
+        raise
+    return [(row["id"], row["score"]) for row in rows]
+
+
+def candidate_ids(query: str, location: str = None, limit: Optional[int] = CANDIDATE_LIMIT) -> List[int]:
+    """Job ids for `restrict_ids` of JobIndex.search / JobMatchingAgent.match_jobs_batch."""
+    return [job_id for job_id, _ in search_jobs(query, location, limit)]
+
+
+# ---------------------------------------------------
+# HYBRID SCORING
+# ---------------------------------------------------
+def fuse_scores(semantic: Sequence[float], lexical: Sequence[float],
+                lexical_weight: float = LEXICAL_WEIGHT) -> np.ndarray:
+    """
+    (1 - w) * cosine + w * BM25, with BM25 scaled to [0, 1] by the best score
+    of the batch (BM25 is unbounded, cosine is not).
+    """
+    semantic = np.asarray(semantic, dtype="float32")
+    lexical = np.asarray(lexical, dtype="float32")
+    best = float(lexical.max()) if lexical.size else 0.0
+    scaled = lexical / best if best > 0 else np.zeros_like(lexical)
+    return (1.0 - lexical_weight) * semantic + lexical_weight * scaled
+
+
+def lexical_scores(query: str, location: str = None, limit: Optional[int] = None) -> Dict[int, float]:
+    """{job id: BM25 score} of every matching job (a candidate filter must not drop lower-ranked hits)."""
+    return dict(search_jobs(query, location, limit))
+
+
+# ---------------------------------------------------
+# CLI: python -m smart_applier.search.fulltext [search <query> [location]|rebuild]
+# ---------------------------------------------------
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    conn = get_connection()
+
+    if command == "search" and len(sys.argv) > 2:
+        hits = search_jobs(sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else None, limit=20)
+        jobs = {row["id"]: row for row in conn.execute(
+            f"SELECT id, title, company, location FROM scraped_jobs WHERE id IN ({','.join('?' * len(hits))})",
+            [job_id for job_id, _ in hits])} if hits else {}
+        for job_id, score in hits:
+            job = jobs[job_id]
+            print(f" {score:7.3f}  #{job_id}  {job['title']} @ {job['company']} ({job['location']})")
+        print(f" {len(hits)} hits")
+    elif command == "rebuild":
+        # Also creates the index if FTS5 was missing when migration 6 ran
+        with transaction() as tx:
+            create_fulltext_index(tx.cursor())
+        count = conn.execute("SELECT COUNT(*) AS n FROM scraped_jobs").fetchone()["n"]
+        print(f" Full-text index rebuilt over {count} jobs")
+    else:
+        print("Usage: python -m smart_applier.search.fulltext [search <query> [location]|rebuild]")
+        sys.exit(2)
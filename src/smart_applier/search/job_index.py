@@ -0,0 +1,444 @@
+# src/smart_applier/search/job_index.py
+import os
+import sys
+import json
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+import pandas as pd
+import faiss
+
+from smart_applier.embeddings.model_registry import embedding_key
+from smart_applier.search.ann import (
+    get_index_config,
+    build_index,
+    needs_training,
+    min_training_points,
+    supports_removal,
+    apply_search_params,
+    search_parameters,
+)
+from smart_applier.utils.path_utils import get_data_dirs
+from smart_applier.utils.db_utils import (
+    get_all_scraped_job_ids,
+    get_scraped_jobs_by_ids,
+    register_scraped_jobs_cleared_listener,
+    register_scraped_jobs_listener,
+)
+
+DEFAULT_MODEL_NAME = "all-MiniLM-L6-v2"
+
+# Append freshly inserted scraped_jobs rows to the on-disk index
+AUTO_APPEND = os.getenv("JOB_INDEX_AUTO_APPEND", "1").lower() in ("1", "true", "yes")
+# Retrain IVF centroids once the index holds this many times the vectors
+# they were trained on
+RETRAIN_GROWTH = float(os.getenv("JOB_INDEX_RETRAIN_GROWTH", "4"))
+
+
+def _index_path(model_name: str) -> Path:
+    index_dir = get_data_dirs()["cache"] / "index"
+    index_dir.mkdir(parents=True, exist_ok=True)
+    safe_name = embedding_key(model_name).replace("/", "__")
+    return index_dir / f"jobs_{safe_name}.faiss"
+
+
+def _embed_job_rows(model_name: str, jobs: List[Dict[str, Any]]) -> np.ndarray:
+    # Imported here: the matching agent itself imports this module
+    from smart_applier.agents.job_matching_agent import JobMatchingAgent
+    matcher = JobMatchingAgent(model_name=model_name)
+    return matcher.embed_jobs(pd.DataFrame(jobs))
+
+
+class JobIndex:
+    """
+    Persistent inner-product FAISS index over the scraped_jobs corpus.
+
+    Vectors are stored under their `scraped_jobs.id` (IndexIDMap2), so search
+    results are DB ids. The index lives in data/cache/index and is appended to
+    as new jobs are inserted.
+
+    The index type (flat, ivf_flat, ivf_pq, hnsw) comes from JOB_INDEX_TYPE /
+    JOB_INDEX_PARAMS and is saved next to the index; an existing index keeps
+    its saved type until `rebuild()` switches it to the configured one.
+
+    IVF types need enough vectors to train their centroids (ann.min_training_points).
+    Until the corpus has them, a flat index stands in and is swapped for the
+    trained one as soon as it does; the centroids are retrained when the
+    corpus outgrows the training set RETRAIN_GROWTH times over.
+    """
+
+    def __init__(self, model_name: str = DEFAULT_MODEL_NAME, path: Path = None,
+                 index_type: str = None, params: Dict[str, Any] = None):
+        config = get_index_config()
+        self.model_name = model_name
+        self.path = path or _index_path(model_name)
+        self.requested_type = index_type or config["index_type"]
+        self.requested_params = params if params is not None else (
+            config["params"] if self.requested_type == config["index_type"] else {}
+        )
+        # target_*: what the index should be; index_type/params: what it is
+        # now (flat while an IVF target is waiting for training vectors)
+        self.target_type = self.requested_type
+        self.target_params = dict(self.requested_params)
+        self.index_type = self.requested_type
+        self.params = dict(self.requested_params)
+        self.trained_on = 0
+        self.index = None
+        self._ids = set()
+        self._lock = threading.RLock()
+        self.load()
+
+    @property
+    def config_path(self) -> Path:
+        return self.path.with_suffix(".json")
+
+    # ---------------------------------------------------
+    # PERSISTENCE
+    # ---------------------------------------------------
+    def load(self):
+        with self._lock:
+            if not self.path.exists():
+                self.index, self._ids = None, set()
+                return
+            if self.config_path.exists():
+                with open(self.config_path) as f:
+                    saved = json.load(f)
+                self.index_type, self.params = saved["index_type"], saved["params"]
+                self.target_type = saved.get("target_type", self.index_type)
+                self.target_params = saved.get("target_params", self.params)
+                self.trained_on = saved.get("trained_on", 0)
+            self.index = faiss.read_index(str(self.path))
+            apply_search_params(self.index, self.index_type, self.params)
+            self._ids = set(faiss.vector_to_array(self.index.id_map).tolist())
+            if needs_training(self.index_type) and not self.trained_on:
+                self.trained_on = self.index.ntotal
+            print(f" Loaded {self.index_type} job index ({self.index.ntotal} vectors) from {self.path}")
+            if self.target_type != self.requested_type:
+                print(f" Note: JOB_INDEX_TYPE={self.requested_type}; run a rebuild to switch.")
+
+    def save(self):
+        with self._lock:
+            if self.index is None:
+                # Emptied by a rebuild over an empty corpus
+                for path in (self.path, self.config_path):
+                    path.unlink(missing_ok=True)
+                return
+            tmp_path = self.path.with_suffix(".tmp")
+            faiss.write_index(self.index, str(tmp_path))
+            os.replace(tmp_path, self.path)
+            with open(self.config_path, "w") as f:
+                json.dump({
+                    "index_type": self.index_type, "params": self.params,
+                    "target_type": self.target_type, "target_params": self.target_params,
+                    "trained_on": self.trained_on,
+                }, f, indent=2)
+
+    def _new_index(self, vectors: np.ndarray):
+        """
+        Empty IDMap-wrapped index of the target type, trained on `vectors`
+        (normalized) if needed, or a flat stand-in if they are too few to train.
+        """
+        dim = vectors.shape[1]
+        if len(vectors) < min_training_points(self.target_type, self.target_params):
+            self.index_type, self.params, self.trained_on = "flat", {}, 0
+            return faiss.IndexIDMap2(build_index("flat", dim, {}))
+        self.index_type, self.params = self.target_type, dict(self.target_params)
+        base = build_index(self.index_type, dim, self.params)
+        if needs_training(self.index_type):
+            base.train(vectors)
+            self.trained_on = len(vectors)
+        return faiss.IndexIDMap2(base)
+
+    def _train_if_due(self, save: bool = True):
+        """Swap a flat stand-in for the trained target, or retrain a grown one."""
+        if not needs_training(self.target_type):
+            return
+        if self.index_type == "flat":
+            if self.ntotal < min_training_points(self.target_type, self.target_params):
+                return
+            # The stand-in keeps exact vectors: train from them, no re-embedding
+            ids = faiss.vector_to_array(self.index.id_map)
+            vecs = self.index.index.reconstruct_n(0, self.ntotal)
+            self.index = self._new_index(vecs)
+            self.index.add_with_ids(vecs, ids)
+            print(f" Job index: trained {self.index_type} on {self.ntotal} vectors")
+        elif self.ntotal >= RETRAIN_GROWTH * max(1, self.trained_on):
+            print(f" Job index: {self.ntotal} vectors vs {self.trained_on} trained on, retraining")
+            try:
+                self.rebuild(index_type=self.target_type, params=self.target_params, save=save)
+            except Exception as e:
+                # Search still works with the old centroids; retried on the next add
+                print(f" Job index retraining failed: {e}")
+
+    # ---------------------------------------------------
+    # UPDATES
+    # ---------------------------------------------------
+    @property
+    def ntotal(self) -> int:
+        return 0 if self.index is None else self.index.ntotal
+
+    def contains(self, job_id: int) -> bool:
+        return int(job_id) in self._ids
+
+    def add(self, ids: List[int], embeddings: np.ndarray, save: bool = True) -> int:
+        """Add vectors for ids not yet indexed. Returns the number added."""
+        embeddings = np.array(embeddings, dtype="float32").reshape(len(ids), -1)
+        with self._lock:
+            keep, seen = [], set()
+            for i, job_id in enumerate(ids):
+                job_id = int(job_id)
+                if job_id in self._ids or job_id in seen:
+                    continue
+                seen.add(job_id)
+                keep.append(i)
+            if not keep:
+                return 0
+
+            new_ids = np.array([int(ids[i]) for i in keep], dtype="int64")
+            new_vecs = np.ascontiguousarray(embeddings[keep])
+            faiss.normalize_L2(new_vecs)
+
+            if self.index is None:
+                self.index = self._new_index(new_vecs)
+            self.index.add_with_ids(new_vecs, new_ids)
+            self._ids.update(new_ids.tolist())
+            self._train_if_due(save)
+
+            if save:
+                self.save()
+            return len(keep)
+
+    def remove(self, ids: List[int], save: bool = True) -> int:
+        """
+        Drop the vectors of `ids`. Returns the number removed. HNSW graphs
+        can't drop nodes, so there every call rebuilds the graph from the
+        remaining stored vectors: remove ids in batches (as sync() does).
+        """
+        with self._lock:
+            if self.index is None or not ids:
+                return 0
+            if not supports_removal(self.index_type):
+                drop = {int(i) for i in ids} & self._ids
+                if not drop:
+                    return 0
+                # The stored vectors are exact (and normalized): no re-embedding
+                all_ids = faiss.vector_to_array(self.index.id_map)
+                keep = np.flatnonzero([int(job_id) not in drop for job_id in all_ids])
+                vecs = self.index.index.reconstruct_n(0, self.ntotal)[keep]
+                index = faiss.IndexIDMap2(build_index(self.index_type, self.index.d, self.params))
+                index.add_with_ids(np.ascontiguousarray(vecs), all_ids[keep])
+                self.index = index
+                self._ids.difference_update(drop)
+                print(f" Job index: rebuilt {self.index_type} graph without {len(drop)} vectors")
+                if save:
+                    self.save()
+                return len(drop)
+            removed = self.index.remove_ids(np.array(list(ids), dtype="int64"))
+            self._ids.difference_update(int(i) for i in ids)
+            if save:
+                self.save()
+            return int(removed)
+
+    # ---------------------------------------------------
+    # SEARCH
+    # ---------------------------------------------------
+    def search(self, query_vectors: np.ndarray, top_k: int = 10,
+               restrict_ids: Optional[List[int]] = None):
+        """
+        Search with (already float32) query vectors; returns (scores, db_ids).
+        `restrict_ids` limits the search to a subset of the corpus.
+        Slots with no result have id -1.
+        """
+        if self.index is None:
+            n = np.asarray(query_vectors).reshape(-1, np.asarray(query_vectors).shape[-1]).shape[0]
+            return np.zeros((n, top_k), dtype="float32"), np.full((n, top_k), -1, dtype="int64")
+
+        queries = np.array(query_vectors, dtype="float32").reshape(-1, self.index.d)
+        faiss.normalize_L2(queries)
+
+        with self._lock:
+            if restrict_ids is None:
+                return self.index.search(queries, top_k)
+            selector = faiss.IDSelectorBatch(np.array(list(restrict_ids), dtype="int64"))
+            params = search_parameters(self.index, self.index_type, self.params, selector)
+            return self.index.search(queries, top_k, params=params)
+
+    # ---------------------------------------------------
+    # MAINTENANCE
+    # ---------------------------------------------------
+    def check_consistency(self) -> Dict[str, List[int]]:
+        """Compare indexed ids with scraped_jobs ids."""
+        db_ids = set(get_all_scraped_job_ids())
+        return {
+            "missing": sorted(db_ids - self._ids),
+            "stale": sorted(self._ids - db_ids),
+        }
+
+    def sync(self) -> Dict[str, int]:
+        """Index DB rows that are missing and drop vectors for deleted rows."""
+        report = self.check_consistency()
+        added = 0
+        if report["missing"]:
+            jobs = get_scraped_jobs_by_ids(report["missing"])
+            vecs = _embed_job_rows(self.model_name, jobs)
+            added = self.add([job["id"] for job in jobs], vecs, save=False)
+        removed = self.remove(report["stale"], save=False)
+        self.save()
+        return {"added": added, "removed": removed}
+
+    def rebuild(self, index_type: str = None, params: Dict[str, Any] = None, save: bool = True) -> int:
+        """
+        Re-embed the whole corpus into a fresh, compact index (retraining IVF
+        centroids). Switches to the configured index type unless one is given.
+        With save=False persisting it is left to the caller's save().
+        """
+        db_ids = get_all_scraped_job_ids()
+        with self._lock:
+            self.target_type = index_type or self.requested_type
+            self.target_params = dict(params if params is not None else self.requested_params)
+            self.index, self._ids, self.trained_on = None, set(), 0
+            if db_ids:
+                jobs = get_scraped_jobs_by_ids(db_ids)
+                vecs = _embed_job_rows(self.model_name, jobs)
+                self.add([job["id"] for job in jobs], vecs, save=False)
+            if save:
+                self.save()
+            return self.ntotal
+
+
+# ---------------------------------------------------
+# PROCESS-WIDE INSTANCES
+# ---------------------------------------------------
+_indexes: Dict[str, JobIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_job_index(model_name: str = DEFAULT_MODEL_NAME) -> JobIndex:
+    with _indexes_lock:
+        if model_name not in _indexes:
+            _indexes[model_name] = JobIndex(model_name)
+        return _indexes[model_name]
+
+
+def open_model_names() -> List[str]:
+    """Models with an index open in this process (the default model if none)."""
+    with _indexes_lock:
+        return list(_indexes) or [DEFAULT_MODEL_NAME]
+
+
+# ---------------------------------------------------
+# BACKGROUND APPEND
+# ---------------------------------------------------
+class IndexAppendQueue:
+    """
+    Freshly inserted scraped_jobs waiting to be embedded and appended, per
+    model. A daemon thread drains it, so an insert (and the scraper calling
+    it) never waits for a model load or an encode; flush() drains it on the
+    caller's thread instead.
+    """
+
+    def __init__(self):
+        self._pending: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        self._cond = threading.Condition()
+        self._drain_lock = threading.Lock()
+        self._thread = None
+
+    def put(self, model_names: List[str], ids: List[int], jobs: List[Dict[str, Any]]):
+        with self._cond:
+            for model_name in model_names:
+                pending = self._pending.setdefault(model_name, {})
+                pending.update((int(job_id), job) for job_id, job in zip(ids, jobs))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="job-index-append", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def pending(self) -> int:
+        with self._cond:
+            return sum(len(jobs) for jobs in self._pending.values())
+
+    def discard(self) -> int:
+        """Drop everything queued, after any running flush. Returns how many jobs were dropped."""
+        with self._drain_lock:
+            with self._cond:
+                dropped = sum(len(jobs) for jobs in self._pending.values())
+                self._pending = {}
+            return dropped
+
+    def flush(self) -> Dict[str, int]:
+        """Embed and append everything queued so far. Returns {model: added}."""
+        with self._drain_lock:
+            with self._cond:
+                batches, self._pending = self._pending, {}
+            added = {}
+            for model_name, jobs in batches.items():
+                try:
+                    added[model_name] = self._append(model_name, jobs)
+                except Exception as e:
+                    # The next refresh's sync() indexes whatever is missing
+                    print(f" Job index append failed for {model_name}: {e}")
+            return added
+
+    @staticmethod
+    def _append(model_name: str, jobs: Dict[int, Dict[str, Any]]) -> int:
+        index = get_job_index(model_name)
+        new = [(job_id, job) for job_id, job in jobs.items() if not index.contains(job_id)]
+        if not new:
+            return 0
+        vecs = _embed_job_rows(model_name, [job for _, job in new])
+        added = index.add([job_id for job_id, _ in new], vecs)
+        print(f" Job index ({model_name}): appended {added} vectors ({index.ntotal} total)")
+        return added
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+            self.flush()
+
+
+_append_queue = IndexAppendQueue()
+
+
+def get_append_queue() -> IndexAppendQueue:
+    return _append_queue
+
+
+def _on_scraped_jobs_inserted(ids: List[int], jobs: List[Dict[str, Any]]):
+    if AUTO_APPEND:
+        _append_queue.put(open_model_names(), ids, jobs)
+
+
+def _on_scraped_jobs_cleared():
+    # Queued jobs are gone from the DB, and rebuilding over an empty table
+    # deletes the index files
+    _append_queue.discard()
+    for model_name in open_model_names():
+        get_job_index(model_name).rebuild()
+
+
+register_scraped_jobs_listener(_on_scraped_jobs_inserted)
+register_scraped_jobs_cleared_listener(_on_scraped_jobs_cleared)
+
+
+# ---------------------------------------------------
+# CLI: python -m smart_applier.search.job_index [check|sync|rebuild]
+# ---------------------------------------------------
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "check"
+    index = get_job_index(sys.argv[2] if len(sys.argv) > 2 else DEFAULT_MODEL_NAME)
+
+    if command == "check":
+        report = index.check_consistency()
+        print(f" Indexed: {index.ntotal} | missing: {len(report['missing'])} | stale: {len(report['stale'])}")
+        sys.exit(1 if report["missing"] or report["stale"] else 0)
+    elif command == "sync":
+        print(f" Sync: {index.sync()}")
+    elif command == "rebuild":
+        print(f" Rebuilt {index.requested_type} index with {index.rebuild()} vectors")
+    else:
+        print("Usage: python -m smart_applier.search.job_index [check|sync|rebuild] [model_name]")
+        sys.exit(2)
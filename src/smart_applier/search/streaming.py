@@ -0,0 +1,156 @@
+# src/smart_applier/search/streaming.py
+import os
+import time
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Any, Optional
+
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------------------
+# CONFIG
+# ---------------------------------------------------
+# Jobs are embedded as soon as a batch fills up, or when no new page arrived
+# for STREAM_MAX_WAIT_SECONDS, whichever comes first.
+DEFAULT_BATCH_SIZE = int(os.getenv("STREAM_EMBED_BATCH_SIZE", "64"))
+DEFAULT_MAX_WAIT_SECONDS = float(os.getenv("STREAM_MAX_WAIT_SECONDS", "0.25"))
+
+_DONE = object()
+
+
+@dataclass
+class StreamResult:
+    jobs_df: pd.DataFrame
+    embeddings: np.ndarray
+    matched_df: Optional[pd.DataFrame] = None
+    batches: int = 0
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+def _running_top_k(jobs: List[Dict[str, Any]], scores: np.ndarray, top_k: int) -> pd.DataFrame:
+    order = np.argsort(-scores)[:top_k]
+    matched = pd.DataFrame([jobs[i] for i in order])
+    matched["match_score"] = scores[order].round(4)
+    return matched
+
+
+def stream_scrape_and_match(
+    pages: int = 2,
+    profile_vector: np.ndarray = None,
+    top_k: int = 10,
+    user_id: str = None,
+    scraper=None,
+    matcher=None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_wait: float = DEFAULT_MAX_WAIT_SECONDS,
+    on_matches: Callable[[pd.DataFrame], None] = None,
+) -> StreamResult:
+    """
+    Scrape, embed, index and (optionally) match in one overlapped pass.
+
+    A producer thread runs JobScraperAgent.iter_scrape and queues jobs
+    page by page; this thread micro-batches them into the encoder and the
+    persistent job index while later pages are still downloading. With a
+    `profile_vector`, provisional top-k matches are passed to `on_matches`
+    after every batch, and the final matches come from match_jobs (which also
+    saves them) once the scrape is complete.
+    """
+    from smart_applier.agents.job_scraper_agent import JobScraperAgent
+    from smart_applier.agents.job_matching_agent import JobMatchingAgent
+    from smart_applier.search.job_index import get_job_index
+
+    scraper = scraper or JobScraperAgent()
+    matcher = matcher or JobMatchingAgent()
+    job_index = get_job_index(matcher.model_name)
+
+    start = time.perf_counter()
+    timings: Dict[str, float] = {}
+    jobs_queue: "queue.Queue" = queue.Queue()
+    errors: List[Exception] = []
+
+    def produce():
+        try:
+            # notify=False: this pipeline embeds and indexes the new rows itself
+            for _, jobs in scraper.iter_scrape(pages, notify=False):
+                timings.setdefault("first_page_seconds", time.perf_counter() - start)
+                for job in jobs:
+                    jobs_queue.put(job)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            timings["scrape_seconds"] = time.perf_counter() - start
+            jobs_queue.put(_DONE)
+
+    producer = threading.Thread(target=produce, name="stream-scraper", daemon=True)
+    producer.start()
+
+    profile = None
+    if profile_vector is not None:
+        profile = np.array(profile_vector, dtype="float32").reshape(-1)
+        profile /= max(float(np.linalg.norm(profile)), 1e-12)
+
+    all_jobs: List[Dict[str, Any]] = []
+    all_vecs: List[np.ndarray] = []
+    all_scores: List[np.ndarray] = []
+    batches = 0
+    added = 0
+    embed_seconds = 0.0
+
+    def process(batch: List[Dict[str, Any]]):
+        nonlocal batches, added, embed_seconds
+        t0 = time.perf_counter()
+        vecs = np.asarray(matcher.embed_jobs(pd.DataFrame(batch)), dtype="float32")
+        added += job_index.add([job["db_id"] for job in batch], vecs, save=False)
+        embed_seconds += time.perf_counter() - t0
+
+        all_jobs.extend(batch)
+        all_vecs.append(vecs)
+        batches += 1
+        timings.setdefault("first_batch_indexed_seconds", time.perf_counter() - start)
+
+        if profile is not None:
+            normed = vecs / np.maximum(np.linalg.norm(vecs, axis=1, keepdims=True), 1e-12)
+            all_scores.append(normed @ profile)
+            if on_matches is not None:
+                on_matches(_running_top_k(all_jobs, np.concatenate(all_scores), top_k))
+            timings.setdefault("first_matches_seconds", time.perf_counter() - start)
+
+    batch: List[Dict[str, Any]] = []
+    done = False
+    while not done:
+        try:
+            item = jobs_queue.get(timeout=max_wait if batch else None)
+        except queue.Empty:
+            item = None
+        if item is _DONE:
+            done = True
+        elif item is not None:
+            batch.append(item)
+            if len(batch) < batch_size:
+                continue
+        if batch:
+            process(batch)
+            batch = []
+
+    producer.join()
+    if errors:
+        raise errors[0]
+    if added:
+        job_index.save()
+
+    jobs_df = pd.DataFrame(all_jobs)
+    embeddings = np.vstack(all_vecs) if all_vecs else np.zeros((0, 0), dtype="float32")
+
+    matched_df = None
+    if profile is not None and len(jobs_df):
+        # Authoritative result through the regular path (restricted index search + DB save)
+        matched_df = matcher.match_jobs(profile.copy(), jobs_df, embeddings, top_k=top_k, user_id=user_id)
+
+    timings["embed_index_seconds"] = embed_seconds
+    timings["total_seconds"] = time.perf_counter() - start
+    print(f" Streaming pipeline: {len(jobs_df)} jobs in {batches} batches, {added} newly indexed, "
+          f"{timings['total_seconds']:.2f}s total (scrape {timings['scrape_seconds']:.2f}s, "
+          f"embed+index {embed_seconds:.2f}s)")
+    return StreamResult(jobs_df, embeddings, matched_df, batches, {k: round(v, 4) for k, v in timings.items()})
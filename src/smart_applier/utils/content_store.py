@@ -0,0 +1,168 @@
+# src/smart_applier/utils/content_store.py
+import os
+import re
+import sys
+import mmap
+import time
+import hashlib
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Set
+
+from smart_applier.utils.path_utils import get_data_dirs
+
+_HASH = re.compile(r"^[0-9a-f]{64}$")
+CHUNK_SIZE = 64 * 1024
+# Files are written before the row that references them; gc leaves younger
+# files alone so it can't delete one whose row is about to be inserted
+GC_GRACE_SECONDS = float(os.getenv("RESUME_GC_GRACE_SECONDS", "300"))
+
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class ContentStore:
+    """
+    Files stored once under their SHA-256: <root>/ab/cd/abcd...<suffix>.
+    Writes go to a temp file that is renamed into place, so a file at its
+    final path is always complete and identical content is never duplicated.
+    """
+
+    def __init__(self, root: Path, suffix: str = ""):
+        self.root = Path(root)
+        self.suffix = suffix
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path(self, digest: str) -> Path:
+        if not _HASH.match(digest or ""):
+            raise ValueError(f"Not a SHA-256 hex digest: {digest!r}")
+        return self.root / digest[:2] / digest[2:4] / f"{digest}{self.suffix}"
+
+    def exists(self, digest: str) -> bool:
+        return self.path(digest).exists()
+
+    def put(self, data: bytes) -> str:
+        """Store `data` (if not stored yet) and return its digest."""
+        digest = sha256_hex(data)
+        path = self.path(digest)
+        if path.exists():
+            try:
+                # Reused by a new row: restart its gc grace period
+                os.utime(path)
+                return digest
+            except FileNotFoundError:
+                pass  # collected in between, write it again
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        return digest
+
+    # ---------------------------------------------------
+    # READS
+    # ---------------------------------------------------
+    def open(self, digest: str):
+        """Binary file object, for streaming to a response or download."""
+        return open(self.path(digest), "rb")
+
+    def iter_chunks(self, digest: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        with self.open(digest) as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    @contextmanager
+    def mapped(self, digest: str):
+        """Read-only memory map of the file: a bytes-like view without a copy."""
+        with self.open(digest) as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield b""
+                return
+            view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield view
+            finally:
+                view.close()
+
+    def read_bytes(self, digest: str) -> bytes:
+        return self.path(digest).read_bytes()
+
+    # ---------------------------------------------------
+    # MAINTENANCE
+    # ---------------------------------------------------
+    def digests(self) -> Iterator[str]:
+        for path in self.root.glob(f"??/??/*{self.suffix}"):
+            digest = path.name[:len(path.name) - len(self.suffix)] if self.suffix else path.name
+            if _HASH.match(digest):
+                yield digest
+
+    def garbage_collect(self, referenced: Iterable[str], min_age_seconds: float = None) -> int:
+        """
+        Delete files no longer referenced and not written (or reused) within
+        `min_age_seconds` (RESUME_GC_GRACE_SECONDS). Returns how many were removed.
+        """
+        min_age_seconds = GC_GRACE_SECONDS if min_age_seconds is None else min_age_seconds
+        keep: Set[str] = set(referenced)
+        cutoff = time.time() - min_age_seconds
+        removed = 0
+        for digest in list(self.digests()):
+            if digest in keep:
+                continue
+            path = self.path(digest)
+            try:
+                if path.stat().st_mtime > cutoff:
+                    continue
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            removed += 1
+        return removed
+
+
+# ---------------------------------------------------
+# RESUME PDFS
+# ---------------------------------------------------
+_resume_store: Optional[ContentStore] = None
+_resume_store_lock = threading.Lock()
+
+
+def get_resume_store() -> ContentStore:
+    """Resume PDFs under data/resumes/store (the resumes table keeps the hash)."""
+    global _resume_store
+    with _resume_store_lock:
+        root = get_data_dirs()["resumes"] / "store"
+        if _resume_store is None or _resume_store.root != root:
+            _resume_store = ContentStore(root, suffix=".pdf")
+        return _resume_store
+
+
+# ---------------------------------------------------
+# CLI: python -m smart_applier.utils.content_store [stats|gc]
+# ---------------------------------------------------
+if __name__ == "__main__":
+    from smart_applier.utils.db_utils import get_referenced_resume_hashes
+
+    store = get_resume_store()
+    command = sys.argv[1] if len(sys.argv) > 1 else "stats"
+    if command == "stats":
+        files = list(store.digests())
+        size = sum(store.path(d).stat().st_size for d in files)
+        print(f" {len(files)} stored PDFs, {size / 1e6:.2f} MB in {store.root}")
+    elif command == "gc":
+        print(f" Removed {store.garbage_collect(get_referenced_resume_hashes())} unreferenced PDFs")
+    else:
+        print("Usage: python -m smart_applier.utils.content_store [stats|gc]")
+        sys.exit(2)
@@ -2,71 +2,47 @@
 import os
 import json
 import sqlite3
-from typing import List, Dict, Any, Optional
-from smart_applier.utils.path_utils import get_data_dirs
-from smart_applier.database.db_setup import initialize_database
-
-# -----------------------------
-# Row factory → return dicts
-# -----------------------------
-def dict_factory(cursor, row):
-    return {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
+from datetime import datetime, time, timezone
+from pathlib import Path
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from smart_applier.database.connection import dict_factory, get_connection, transaction  # noqa: F401
+from smart_applier.database.stats import invalidate_stats
+from smart_applier.utils.content_store import get_resume_store
+from smart_applier.utils.job_fingerprint import job_fingerprint
 
 # -----------------------------
 # DB Connection Helper
 # -----------------------------
-def get_connection(in_memory: bool = False) -> sqlite3.Connection:
-    paths = get_data_dirs()
-    db_path = paths["db_path"]
-
-    if in_memory:
-        conn = sqlite3.connect(":memory:")
-        conn.row_factory = dict_factory
-        initialize_database(conn)
-        return conn
-
-    if db_path is None:
-        raise RuntimeError("db_path is not configured (USE_IN_MEMORY_DB=1?)")
-
-    first_time = not db_path.exists()
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = dict_factory
-
-    if first_time:
-        initialize_database(conn)
-
-    return conn
+# Thread-local pooled connections (WAL, tuned pragmas); writes go through
+# transaction(). See smart_applier/database/connection.py.
 
 # -----------------------------
 #  PROFILES
 # -----------------------------
 def insert_or_update_profile(user_id: str, profile_data: dict):
-    conn = get_connection()
-    cur = conn.cursor()
-
-    profile_json = json.dumps(profile_data)
-    name = profile_data.get("personal", {}).get("name", "")
-    email = profile_data.get("personal", {}).get("email", "")
-    phone = profile_data.get("personal", {}).get("phone", "")
-    location = profile_data.get("personal", {}).get("location", "")
-    linkedin = profile_data.get("personal", {}).get("linkedin", "")
-    github = profile_data.get("personal", {}).get("github", "")
-
-    cur.execute("SELECT id FROM profiles WHERE user_id=?", (user_id,))
-    if cur.fetchone():
-        cur.execute("""
-            UPDATE profiles
-            SET name=?, email=?, phone=?, location=?, linkedin=?, github=?, data_json=?
-            WHERE user_id=?
-        """, (name, email, phone, location, linkedin, github, profile_json, user_id))
-    else:
-        cur.execute("""
-            INSERT INTO profiles (user_id, name, email, phone, location, linkedin, github, data_json)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (user_id, name, email, phone, location, linkedin, github, profile_json))
-
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        cur = conn.cursor()
+
+        profile_json = json.dumps(profile_data)
+        name = profile_data.get("personal", {}).get("name", "")
+        email = profile_data.get("personal", {}).get("email", "")
+        phone = profile_data.get("personal", {}).get("phone", "")
+        location = profile_data.get("personal", {}).get("location", "")
+        linkedin = profile_data.get("personal", {}).get("linkedin", "")
+        github = profile_data.get("personal", {}).get("github", "")
+
+        cur.execute("SELECT id FROM profiles WHERE user_id=?", (user_id,))
+        if cur.fetchone():
+            cur.execute("""
+                UPDATE profiles
+                SET name=?, email=?, phone=?, location=?, linkedin=?, github=?, data_json=?
+                WHERE user_id=?
+            """, (name, email, phone, location, linkedin, github, profile_json, user_id))
+        else:
+            cur.execute("""
+                INSERT INTO profiles (user_id, name, email, phone, location, linkedin, github, data_json)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (user_id, name, email, phone, location, linkedin, github, profile_json))
 
 
 def get_profile(user_id: str) -> Optional[dict]:
@@ -74,7 +50,6 @@ def get_profile(user_id: str) -> Optional[dict]:
     cur = conn.cursor()
     cur.execute("SELECT data_json FROM profiles WHERE user_id=?", (user_id,))
     row = cur.fetchone()
-    conn.close()
 
     return json.loads(row["data_json"]) if row else None
 
@@ -84,7 +59,6 @@ def list_profiles():
     cur = conn.cursor()
     cur.execute("SELECT user_id, name, email,data_json, created_at FROM profiles ORDER BY created_at DESC")
     rows = cur.fetchall()
-    conn.close()
     return rows
 
 # Compatibility
@@ -95,39 +69,177 @@ def get_all_profiles():
 # -----------------------------
 # SCRAPED JOBS
 # -----------------------------
+# Callbacks run after new scraped_jobs rows are committed: fn(ids, jobs)
+_scraped_jobs_listeners = []
+
+
+def register_scraped_jobs_listener(callback):
+    if callback not in _scraped_jobs_listeners:
+        _scraped_jobs_listeners.append(callback)
+
+
+# Callbacks run after clear_scraped_jobs() deleted every row: fn()
+_scraped_jobs_cleared_listeners = []
+
+
+def register_scraped_jobs_cleared_listener(callback):
+    if callback not in _scraped_jobs_cleared_listeners:
+        _scraped_jobs_cleared_listeners.append(callback)
+
+
+def _notify_scraped_jobs_inserted(ids: List[int], jobs: List[Dict[str, Any]]):
+    for callback in list(_scraped_jobs_listeners):
+        try:
+            callback(ids, jobs)
+        except Exception as e:
+            print(f" Scraped jobs listener failed: {e}")
+
+
+def bulk_upsert_scraped_jobs(jobs: List[Dict[str, Any]], notify: bool = True) -> Tuple[List[int], List[bool]]:
+    """
+    Insert jobs that are not stored yet, deduplicated by content fingerprint.
+    Returns (ids, is_new) in the SAME ORDER as `jobs`; duplicates get the id
+    of the stored row, whose experience/posted_on are refreshed. Listeners
+    are only notified about genuinely new rows (and not at all with
+    notify=False, for callers that embed/index the rows themselves).
+    """
+    if not jobs:
+        return [], []
+
+    fingerprints = [job_fingerprint(job) for job in jobs]
+    unique = list(dict.fromkeys(fingerprints))
+
+    with transaction() as conn:
+        cur = conn.cursor()
+
+        def lookup(fps):
+            found = {}
+            for start in range(0, len(fps), 500):
+                chunk = fps[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cur.execute(f"SELECT id, fingerprint FROM scraped_jobs WHERE fingerprint IN ({placeholders})", chunk)
+                for row in cur.fetchall():
+                    found[row["fingerprint"]] = row["id"]
+            return found
+
+        existing = lookup(unique)
+        first_job = {}
+        for fp, job in zip(fingerprints, jobs):
+            first_job.setdefault(fp, job)
+
+        def values(job):
+            return (
+                job.get("experience") or job.get("Experience"),
+                job.get("posted_on") or job.get("Posted On"),
+            )
+
+        new_fps = [fp for fp in unique if fp not in existing]
+        # OR IGNORE: belt and braces, the write lock taken by BEGIN IMMEDIATE
+        # already keeps other writers from storing these postings meanwhile
+        cur.executemany("""
+            INSERT OR IGNORE INTO scraped_jobs
+                (title, company, location, experience, skills, summary, posted_on, fingerprint)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (
+                first_job[fp].get("title") or first_job[fp].get("Title"),
+                first_job[fp].get("company") or first_job[fp].get("Company"),
+                first_job[fp].get("location") or first_job[fp].get("Location"),
+                first_job[fp].get("experience") or first_job[fp].get("Experience"),
+                first_job[fp].get("skills") or first_job[fp].get("Skills"),
+                first_job[fp].get("summary") or first_job[fp].get("Summary"),
+                first_job[fp].get("posted_on") or first_job[fp].get("Posted On"),
+                fp,
+            )
+            for fp in new_fps
+        ])
+        inserted = cur.rowcount
+        cur.executemany(
+            "UPDATE scraped_jobs SET experience=COALESCE(?, experience), posted_on=COALESCE(?, posted_on) WHERE id=?",
+            [(*values(first_job[fp]), job_id) for fp, job_id in existing.items()],
+        )
+        cur.execute("SELECT last_insert_rowid() AS last_id")
+        last_id = cur.fetchone()["last_id"]
+        if new_fps and inserted == len(new_fps):
+            # One executemany inside the write transaction: ids are consecutive
+            # and in insertion order, so no second lookup is needed
+            ids_by_fp = dict(zip(new_fps, range(last_id - inserted + 1, last_id + 1)))
+        else:
+            ids_by_fp = lookup(new_fps)
+        ids_by_fp.update(existing)
+
+    if new_fps:
+        invalidate_stats()
+
+    ids = [ids_by_fp[fp] for fp in fingerprints]
+    # Only the first occurrence of a new fingerprint counts as new
+    is_new = []
+    announced = set()
+    for fp in fingerprints:
+        new = fp not in existing and fp not in announced
+        announced.add(fp)
+        is_new.append(new)
+
+    new_ids = [job_id for job_id, new in zip(ids, is_new) if new]
+    if new_ids and notify:
+        _notify_scraped_jobs_inserted(new_ids, [job for job, new in zip(jobs, is_new) if new])
+    return ids, is_new
+
+
 def bulk_insert_scraped_jobs(jobs: List[Dict[str, Any]]) -> List[int]:
     """
     Insert jobs and return DB IDs in the SAME ORDER.
-    This ensures no NaN in db_id.
+    This ensures no NaN in db_id. Already stored postings keep their id.
     """
-    if not jobs:
-        return []
+    ids, _ = bulk_upsert_scraped_jobs(jobs)
+    return ids
+
 
+def get_scrape_watermark(source: str) -> Optional[dict]:
     conn = get_connection()
     cur = conn.cursor()
+    cur.execute("SELECT * FROM scrape_watermarks WHERE source=?", (source,))
+    row = cur.fetchone()
+    return row
 
-    inserted_ids = []
 
-    for job in jobs:
+def set_scrape_watermark(source: str, newest_fingerprint: str, newest_posted_on: str, pages_scraped: int):
+    with transaction() as conn:
+        cur = conn.cursor()
         cur.execute("""
-            INSERT INTO scraped_jobs (title, company, location, experience, skills, summary, posted_on)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            job.get("title") or job.get("Title"),
-            job.get("company") or job.get("Company"),
-            job.get("location") or job.get("Location"),
-            job.get("experience") or job.get("Experience"),
-            job.get("skills") or job.get("Skills"),
-            job.get("summary") or job.get("Summary"),
-            job.get("posted_on") or job.get("Posted On"),
-        ))
-
-        inserted_ids.append(cur.lastrowid)
+            INSERT INTO scrape_watermarks (source, newest_fingerprint, newest_posted_on, pages_scraped, updated_at)
+            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(source) DO UPDATE SET
+                newest_fingerprint=excluded.newest_fingerprint,
+                newest_posted_on=excluded.newest_posted_on,
+                pages_scraped=excluded.pages_scraped,
+                updated_at=CURRENT_TIMESTAMP
+        """, (source, newest_fingerprint, newest_posted_on, pages_scraped))
 
-    conn.commit()
-    conn.close()
 
-    return inserted_ids
+def clear_scraped_jobs():
+    """
+    Delete every scraped job together with the state derived from them: the
+    incremental-scrape watermarks (else the next refresh stops at a posting
+    that is no longer stored), the full-text index, the jobs parsed from
+    cached pages and, through the cleared listeners, the FAISS job indexes.
+    """
+    from smart_applier.scraping.http_cache import get_response_cache
+    from smart_applier.search.fulltext import FTS_TABLE, fulltext_available
+
+    with transaction() as conn:
+        conn.execute("DELETE FROM scraped_jobs")
+        conn.execute("DELETE FROM scrape_watermarks")
+        if fulltext_available(conn):
+            # The delete trigger already emptied it; rebuilding also compacts it
+            conn.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    get_response_cache().clear_parsed()
+    invalidate_stats()
+    for callback in list(_scraped_jobs_cleared_listeners):
+        try:
+            callback()
+        except Exception as e:
+            print(f" Scraped jobs cleared listener failed: {e}")
 
 
 def get_all_scraped_jobs(limit: int = 100):
@@ -135,32 +247,69 @@ def get_all_scraped_jobs(limit: int = 100):
     cur = conn.cursor()
     cur.execute("SELECT * FROM scraped_jobs ORDER BY id DESC LIMIT ?", (limit,))
     rows = cur.fetchall()
-    conn.close()
     return rows
 
 
+def get_scraped_jobs_by_ids(ids: List[int]) -> List[dict]:
+    """Fetch scraped jobs and return them in the SAME ORDER as `ids`."""
+    if not ids:
+        return []
+
+    conn = get_connection()
+    cur = conn.cursor()
+    by_id = {}
+    for start in range(0, len(ids), 500):
+        chunk = list(ids[start:start + 500])
+        placeholders = ",".join("?" * len(chunk))
+        cur.execute(f"SELECT * FROM scraped_jobs WHERE id IN ({placeholders})", chunk)
+        for row in cur.fetchall():
+            by_id[row["id"]] = row
+
+    return [by_id[i] for i in ids if i in by_id]
+
+
+def get_all_scraped_job_ids() -> List[int]:
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("SELECT id FROM scraped_jobs ORDER BY id")
+    ids = [row["id"] for row in cur.fetchall()]
+    return ids
+
+
 # -----------------------------
 #  TOP MATCHED JOBS (SEPARATE TABLE)
 # -----------------------------
 def insert_top_matched(job_id: int, user_id: str, score: float):
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("""
-        INSERT INTO top_matched_jobs (job_id, user_id, score)
-        VALUES (?, ?, ?)
-    """, (job_id, user_id, score))
-    conn.commit()
-    conn.close()
+    insert_top_matched_many([(job_id, user_id, score)])
+
+
+def insert_top_matched_many(rows: List[Tuple[int, str, float]]):
+    """Insert many (job_id, user_id, score) rows in a single transaction."""
+    if not rows:
+        return
+
+    with transaction() as conn:
+        cur = conn.cursor()
+        cur.executemany("""
+            INSERT INTO top_matched_jobs (job_id, user_id, score)
+            VALUES (?, ?, ?)
+        """, rows)
+    invalidate_stats()
 
 
-def get_latest_top_matched(limit: int = 50):
+def get_latest_top_matched(limit: int = 50, user_id: str = None):
     """
     Join top_matched_jobs with scraped_jobs cleanly.
+    With `user_id`, only that user's matches (newest first).
     """
     conn = get_connection()
     cur = conn.cursor()
 
-    cur.execute("""
+    where, order, params = "", "t.id DESC", (limit,)
+    if user_id is not None:
+        where, order, params = "WHERE t.user_id = ?", "t.created_at DESC, t.id DESC", (user_id, limit)
+
+    cur.execute(f"""
         SELECT
             t.id AS match_id,
             t.job_id,
@@ -176,45 +325,221 @@ def get_latest_top_matched(limit: int = 50):
             s.posted_on
         FROM top_matched_jobs t
         LEFT JOIN scraped_jobs s ON s.id = t.job_id
-        ORDER BY t.id DESC
+        {where}
+        ORDER BY {order}
         LIMIT ?
-    """, (limit,))
+    """, params)
 
     rows = cur.fetchall()
-    conn.close()
     return rows
 
 
 # -----------------------------
-#  RESUMES (PDF as BLOB)
+#  RESUMES (PDFs in the content store, metadata + hash here)
 # -----------------------------
 def insert_resume(user_id: str, resume_type: str, file_name: str, pdf_blob: bytes):
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("""
-        INSERT INTO resumes (user_id, resume_type, file_name, pdf_blob)
-        VALUES (?, ?, ?, ?)
-    """, (user_id, resume_type, file_name, sqlite3.Binary(pdf_blob)))
-    conn.commit()
-    conn.close()
+    # Identical PDFs share one file; written before the row that points to it
+    digest = get_resume_store().put(bytes(pdf_blob))
+    with transaction() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            INSERT INTO resumes (user_id, resume_type, file_name, pdf_sha256, pdf_size)
+            VALUES (?, ?, ?, ?, ?)
+        """, (user_id, resume_type, file_name, digest, len(pdf_blob)))
+    invalidate_stats()
+
+
+def clear_resumes():
+    """Delete every resume row, then the PDFs nothing references any more."""
+    with transaction() as conn:
+        conn.execute("DELETE FROM resumes")
+    invalidate_stats()
+    # Keeps PDFs of rows inserted since, and files inside the gc grace period
+    return get_resume_store().garbage_collect(get_referenced_resume_hashes())
 
 
-def list_resumes(limit: int = 100):
+def list_resumes(limit: int = 100, user_id: str = None, resume_type: str = None):
+    """Newest first; filtering by user (and type) uses idx_resumes_user_type_created."""
     conn = get_connection()
     cur = conn.cursor()
-    cur.execute("SELECT id, user_id, resume_type, file_name, created_at FROM resumes ORDER BY id DESC LIMIT ?", (limit,))
+    if user_id is None:
+        cur.execute("SELECT id, user_id, resume_type, file_name, created_at FROM resumes ORDER BY id DESC LIMIT ?", (limit,))
+    elif resume_type is None:
+        cur.execute("""
+            SELECT id, user_id, resume_type, file_name, created_at FROM resumes
+            WHERE user_id = ? ORDER BY created_at DESC, id DESC LIMIT ?
+        """, (user_id, limit))
+    else:
+        cur.execute("""
+            SELECT id, user_id, resume_type, file_name, created_at FROM resumes
+            WHERE user_id = ? AND resume_type = ? ORDER BY created_at DESC, id DESC LIMIT ?
+        """, (user_id, resume_type, limit))
     rows = cur.fetchall()
-    conn.close()
     return rows
 
 
-def get_resume_blob(resume_id: int):
+def get_resume_hash(resume_id: int) -> Optional[str]:
     conn = get_connection()
     cur = conn.cursor()
-    cur.execute("SELECT pdf_blob FROM resumes WHERE id=?", (resume_id,))
+    cur.execute("SELECT pdf_sha256 FROM resumes WHERE id=?", (resume_id,))
     row = cur.fetchone()
-    conn.close()
-    return row["pdf_blob"] if row else None
+    return row["pdf_sha256"] if row else None
+
+
+def get_resume_path(resume_id: int) -> Optional[Path]:
+    """Path of the stored PDF, for streaming or mmap reads (see content_store)."""
+    digest = get_resume_hash(resume_id)
+    return get_resume_store().path(digest) if digest else None
+
+
+def get_resume_blob(resume_id: int):
+    """Whole PDF in memory; prefer get_resume_path / get_resume_store().mapped."""
+    digest = get_resume_hash(resume_id)
+    return get_resume_store().read_bytes(digest) if digest else None
+
+
+def get_referenced_resume_hashes() -> List[str]:
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("SELECT DISTINCT pdf_sha256 FROM resumes WHERE pdf_sha256 IS NOT NULL")
+    return [row["pdf_sha256"] for row in cur.fetchall()]
+
+
+# -----------------------------
+#  KEYSET PAGINATION
+# -----------------------------
+# Pages are "WHERE id < cursor ORDER BY id DESC LIMIT n": each one is an index
+# seek from the cursor, so the 1000th page costs what the first does (OFFSET
+# reads and discards every row before the page). Each function returns
+# (rows, next_cursor); pass next_cursor back as before_id, None means done.
+#
+# Stored timestamps come from CURRENT_TIMESTAMP, i.e. UTC. `since`/`until`
+# datetimes are converted to UTC (naive ones are local time), a date is its
+# local midnight, and strings are compared as they are, so they must be UTC
+# "YYYY-MM-DD HH:MM:SS" text.
+PAGE_SIZE = 50
+
+
+def _timestamp(value) -> Optional[str]:
+    # Same text format as CURRENT_TIMESTAMP, so comparisons are plain string ones
+    if value is None or isinstance(value, str):
+        return value
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time())
+    # astimezone() reads a naive datetime as local time
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _id_range(cur, table: str, column: str, since, until) -> Optional[Tuple[Optional[int], Optional[int]]]:
+    """
+    The ids a [since, until) window of `column` can span, found with two seeks
+    on the column's index, or None if the window is empty. Timestamps default
+    to insert time and ids grow with inserts, so the window is one id range;
+    the timestamp predicate is still applied to the page itself.
+    """
+    low = high = None
+    if since is not None:
+        row = cur.execute(f"SELECT id FROM {table} WHERE {column} >= ? ORDER BY {column}, id LIMIT 1",
+                          (since,)).fetchone()
+        if row is None:
+            return None
+        low = row["id"]
+    if until is not None:
+        row = cur.execute(f"SELECT id FROM {table} WHERE {column} < ? ORDER BY {column} DESC, id DESC LIMIT 1",
+                          (until,)).fetchone()
+        if row is None:
+            return None
+        high = row["id"]
+    return low, high
+
+
+def _keyset_page(select: str, table: str, alias: str, time_column: str, filters: List[Tuple[str, Any]],
+                 before_id: Optional[int], limit: int, since, until, cursor_key: str = "id"):
+    conn = get_connection()
+    cur = conn.cursor()
+    since, until = _timestamp(since), _timestamp(until)
+    id_range = _id_range(cur, table, time_column, since, until)
+    if id_range is None:
+        return [], None
+
+    clauses = [clause for clause, _ in filters]
+    params = [value for _, value in filters]
+    for clause, value in (
+        (f"{alias}.id < ?", before_id),
+        (f"{alias}.id >= ?", id_range[0]),
+        (f"{alias}.id <= ?", id_range[1]),
+        (f"{alias}.{time_column} >= ?", since),
+        (f"{alias}.{time_column} < ?", until),
+    ):
+        if value is not None:
+            clauses.append(clause)
+            params.append(value)
+
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    cur.execute(f"{select} {where} ORDER BY {alias}.id DESC LIMIT ?", (*params, limit))
+    rows = cur.fetchall()
+    next_cursor = rows[-1][cursor_key] if len(rows) == limit else None
+    return rows, next_cursor
+
+
+def page_scraped_jobs(before_id: int = None, limit: int = PAGE_SIZE, company: str = None,
+                      since=None, until=None):
+    """
+    Newest scraped jobs first; `since`/`until` bound scraped_at (UTC) as
+    [since, until). Datetimes and dates are converted to UTC, naive ones are
+    local time; strings must already be UTC.
+    """
+    filters = [("s.company = ?", company)] if company is not None else []
+    return _keyset_page("SELECT s.* FROM scraped_jobs s", "scraped_jobs", "s", "scraped_at",
+                        filters, before_id, limit, since, until)
+
+
+def page_top_matched(before_id: int = None, limit: int = PAGE_SIZE, user_id: str = None,
+                     company: str = None, since=None, until=None):
+    """
+    Newest matches first, joined with their jobs like get_latest_top_matched.
+    `since`/`until` bound matched_at (UTC), converted like page_scraped_jobs.
+    """
+    filters = []
+    if user_id is not None:
+        filters.append(("t.user_id = ?", user_id))
+    if company is not None:
+        filters.append(("s.company = ?", company))
+    return _keyset_page("""
+        SELECT
+            t.id AS match_id, t.job_id, t.user_id, t.score, t.created_at AS matched_at,
+            s.title, s.company, s.location, s.experience, s.skills, s.summary, s.posted_on
+        FROM top_matched_jobs t
+        LEFT JOIN scraped_jobs s ON s.id = t.job_id
+    """, "top_matched_jobs", "t", "created_at", filters, before_id, limit, since, until,
+        cursor_key="match_id")
+
+
+def page_resumes(before_id: int = None, limit: int = PAGE_SIZE, user_id: str = None,
+                 resume_type: str = None, since=None, until=None):
+    """
+    Newest resumes first (metadata only, like list_resumes). `since`/`until`
+    bound created_at (UTC), converted like page_scraped_jobs.
+    """
+    filters = []
+    if user_id is not None:
+        filters.append(("r.user_id = ?", user_id))
+    if resume_type is not None:
+        filters.append(("r.resume_type = ?", resume_type))
+    return _keyset_page("SELECT r.id, r.user_id, r.resume_type, r.file_name, r.created_at FROM resumes r",
+                        "resumes", "r", "created_at", filters, before_id, limit, since, until)
+
+
+def iter_pages(page_fn, **filters) -> Iterator[dict]:
+    """Every row page_fn can return, fetched one page at a time."""
+    before_id = None
+    while True:
+        rows, before_id = page_fn(before_id=before_id, **filters)
+        yield from rows
+        if before_id is None:
+            return
+
+
 # -----------------------------
 # Compatibility exports for UI
 # -----------------------------
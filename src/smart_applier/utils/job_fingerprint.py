@@ -0,0 +1,27 @@
+# src/smart_applier/utils/job_fingerprint.py
+import hashlib
+import unicodedata
+from typing import Dict, Any
+
+# Fields that identify a posting. Skills are included because they are what
+# gets embedded, so a changed skills list must be indexed as a new job.
+FINGERPRINT_FIELDS = ("title", "company", "location", "skills", "summary")
+
+
+def normalize_field(value) -> str:
+    if value is None:
+        return ""
+    # split()/join collapses the same (Unicode) whitespace as re's \s+, faster
+    return " ".join(unicodedata.normalize("NFKC", str(value)).lower().split())
+
+
+def job_fingerprint(job: Dict[str, Any]) -> str:
+    """
+    sha256 of the normalized identifying fields. Accepts scraper dicts and the
+    capitalized keys bulk_insert_scraped_jobs also understands.
+    """
+    parts = [
+        normalize_field(job.get(field) or job.get(field.title()))
+        for field in FINGERPRINT_FIELDS
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
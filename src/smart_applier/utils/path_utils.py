@@ -25,17 +25,20 @@ def get_data_dirs() -> Dict[str, Path]:
     Returns key data subdirectories used across the project.
 
     New keys:
+      - "cache": Directory for on-disk caches (embeddings, indexes, HTTP).
       - "db_path": Path to the sqlite file (unless using in-memory DB).
       - "use_in_memory_db": bool indicating whether to use an in-memory DB.
     """
-    root = get_project_root()
-    data_root = root / "data"
+    # SMART_APPLIER_DATA_DIR relocates all data (e.g. for benchmarks or a shared volume)
+    override = os.getenv("SMART_APPLIER_DATA_DIR")
+    data_root = Path(override) if override else get_project_root() / "data"
     profiles = data_root / "profiles"
     jobs = data_root / "jobs"
     resumes = data_root / "resumes"
+    cache = data_root / "cache"
 
     # Make sure all file-system dirs exist
-    for p in [data_root, profiles, jobs, resumes]:
+    for p in [data_root, profiles, jobs, resumes, cache]:
         p.mkdir(parents=True, exist_ok=True)
 
     # Decide DB mode:
@@ -53,6 +56,7 @@ def get_data_dirs() -> Dict[str, Path]:
         "profiles": profiles,
         "jobs": jobs,
         "resumes": resumes,
+        "cache": cache,
         "db_path": db_path,
         "use_in_memory_db": use_in_memory,
     }
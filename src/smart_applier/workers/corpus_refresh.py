@@ -0,0 +1,244 @@
+# src/smart_applier/workers/corpus_refresh.py
+import os
+import sys
+import json
+import time
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from smart_applier.utils.path_utils import get_data_dirs
+
+try:
+    import fcntl
+except ImportError:  # Windows: runs only exclude each other within one process
+    fcntl = None
+
+# ---------------------------------------------------
+# CONFIG
+# ---------------------------------------------------
+DEFAULT_INTERVAL_SECONDS = float(os.getenv("CORPUS_REFRESH_INTERVAL_SECONDS", "1800"))
+
+_run_lock = threading.Lock()
+
+
+def _status_path() -> Path:
+    return get_data_dirs()["cache"] / "corpus_refresh.json"
+
+
+def get_refresh_status() -> Optional[Dict[str, Any]]:
+    """Summary of the last finished refresh (any process), or None."""
+    path = _status_path()
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def corpus_is_stale(max_age_seconds: float = None) -> bool:
+    """True when no refresh has finished within `max_age_seconds` (the refresh interval)."""
+    max_age_seconds = DEFAULT_INTERVAL_SECONDS if max_age_seconds is None else max_age_seconds
+    finished_at = (get_refresh_status() or {}).get("finished_at")
+    if not finished_at:
+        return True
+    try:
+        age = (datetime.now() - datetime.fromisoformat(finished_at)).total_seconds()
+    except ValueError:
+        return True
+    return age >= max_age_seconds
+
+
+def _write_status(status: Dict[str, Any]):
+    path = _status_path()
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(status, indent=2))
+    tmp.replace(path)
+
+
+class _RefreshLock:
+    """
+    Held for the duration of a refresh: a thread lock for this process and an
+    flock on data/cache/corpus_refresh.lock for other processes (e.g. the
+    Streamlit app and a standalone worker sharing one data dir).
+    """
+
+    def __init__(self):
+        self._file = None
+
+    def acquire(self) -> bool:
+        if not _run_lock.acquire(blocking=False):
+            return False
+        if fcntl is None:
+            return True
+        self._file = open(get_data_dirs()["cache"] / "corpus_refresh.lock", "w")
+        try:
+            fcntl.flock(self._file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            self._file.close()
+            self._file = None
+            _run_lock.release()
+            return False
+        return True
+
+    def release(self):
+        if self._file is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+        _run_lock.release()
+
+
+# ---------------------------------------------------
+# ONE REFRESH
+# ---------------------------------------------------
+def refresh_corpus(max_pages: int = None, scraper=None) -> Optional[Dict[str, Any]]:
+    """
+    Scrape new postings (incremental, de-duplicated on insert), then embed
+    and index every stored job the persistent index is missing.
+    Returns the run summary, or None if another refresh is still running.
+    """
+    lock = _RefreshLock()
+    if not lock.acquire():
+        print(" Corpus refresh already running, skipping this run")
+        return None
+
+    try:
+        from smart_applier.agents.job_scraper_agent import JobScraperAgent
+        from smart_applier.search.job_index import get_append_queue, get_job_index, open_model_names
+
+        started = time.perf_counter()
+        status = {"started_at": datetime.now().isoformat(timespec="seconds")}
+        try:
+            scraper = scraper or JobScraperAgent()
+            df = scraper.scrape_incremental(max_pages)
+            status["scraped"] = len(df)
+            status["new_jobs"] = int(df["is_new"].sum()) if "is_new" in df else 0
+            scrape_seconds = time.perf_counter() - started
+
+            # New rows are queued for the append thread on insert; finish
+            # that here, then sync covers JOB_INDEX_AUTO_APPEND=0 and anything
+            # a crashed run left behind, for every model in use
+            get_append_queue().flush()
+            status["index_sync"] = {}
+            for model_name in open_model_names():
+                status["index_sync"][model_name] = get_job_index(model_name).sync()
+            status["indexed_total"] = max(get_job_index(m).ntotal for m in status["index_sync"])
+            status["scrape_seconds"] = round(scrape_seconds, 3)
+            status["ok"] = True
+        except Exception as e:
+            status["ok"] = False
+            status["error"] = str(e)
+            print(f" Corpus refresh failed: {e}")
+
+        status["seconds"] = round(time.perf_counter() - started, 3)
+        status["finished_at"] = datetime.now().isoformat(timespec="seconds")
+        _write_status(status)
+        print(f" Corpus refresh: {status}")
+        return status
+    finally:
+        lock.release()
+
+
+# ---------------------------------------------------
+# PERIODIC WORKER
+# ---------------------------------------------------
+class CorpusRefreshWorker:
+    """
+    Runs refresh_corpus every `interval` seconds on a daemon thread. The
+    interval is measured from the end of one run to the start of the next,
+    and the refresh lock keeps runs from overlapping across processes too.
+    """
+
+    def __init__(self, interval: float = None, max_pages: int = None):
+        self.interval = interval or DEFAULT_INTERVAL_SECONDS
+        self.max_pages = max_pages
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="corpus-refresh", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = None):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def trigger(self):
+        """Start the next run now instead of waiting out the interval."""
+        self._wake.set()
+
+    def run_forever(self):
+        print(f" Corpus refresh worker started (every {self.interval:g}s)")
+        while not self._stop.is_set():
+            refresh_corpus(self.max_pages)
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+
+_worker: Optional[CorpusRefreshWorker] = None
+_worker_lock = threading.Lock()
+
+
+def start_background_worker(interval: float = None) -> CorpusRefreshWorker:
+    """Process-wide worker, started once (safe to call on every Streamlit rerun)."""
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = CorpusRefreshWorker(interval)
+        return _worker.start()
+
+
+def get_background_worker() -> Optional[CorpusRefreshWorker]:
+    return _worker
+
+
+_oneshot: Optional[threading.Thread] = None
+
+
+def request_refresh() -> threading.Thread:
+    """
+    Refresh soon without waiting for it: wakes this process's worker if one
+    runs, else starts a single refresh on a daemon thread (at most one at a
+    time; the refresh lock also skips it while another process refreshes).
+    """
+    global _oneshot
+    with _worker_lock:
+        if _worker is not None and _worker.running:
+            _worker.trigger()
+            return _worker._thread
+        if _oneshot is None or not _oneshot.is_alive():
+            _oneshot = threading.Thread(target=refresh_corpus, name="corpus-refresh-once", daemon=True)
+            _oneshot.start()
+        return _oneshot
+
+
+# ---------------------------------------------------
+# CLI: python -m smart_applier.workers.corpus_refresh [--once] [interval seconds]
+# ---------------------------------------------------
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    args = sys.argv[1:]
+    if "--once" in args:
+        sys.exit(0 if (refresh_corpus() or {}).get("ok") else 1)
+
+    worker = CorpusRefreshWorker(float(args[0]) if args else None)
+    try:
+        worker.run_forever()
+    except KeyboardInterrupt:
+        print(" Corpus refresh worker stopped")
@@ -1 +1 @@
-from . import page_1_create_profile, page_2_resume_builder, page_3_external_jd, page_4_job_scraper, page_5_skill_gap_analyzer
+# Pages are imported on demand by app.py (see PAGE_MODULES there).
@@ -5,6 +5,7 @@ import pandas as pd
 
 from smart_applier.agents.profile_agent import UserProfileAgent
 from smart_applier.utils.db_utils import insert_resume
+from smart_applier.workers.corpus_refresh import get_refresh_status, get_background_worker
 
 # LangGraph Workflows
 from smart_applier.langgraph.subworkflows import (
@@ -14,7 +15,25 @@ from smart_applier.langgraph.subworkflows import (
 
 def run():
     st.title("Smart Job Scraper & Analyzer")
-    st.caption("Scrape → Match → Skill Gap → Tailor Resume (fully automated pipeline)")
+    st.caption("Job Corpus → Match → Skill Gap → Tailor Resume (fully automated pipeline)")
+
+    # ------------------------------------------------------
+    # Corpus status (kept fresh by the background refresh worker)
+    # ------------------------------------------------------
+    status = get_refresh_status()
+    if status:
+        st.caption(
+            f"Job corpus last refreshed {status.get('finished_at')} — "
+            f"{status.get('new_jobs', 0)} new jobs, {status.get('indexed_total', 0)} indexed"
+            + ("" if status.get("ok") else f" (last run failed: {status.get('error')})")
+        )
+    else:
+        st.caption("Job corpus not refreshed yet — the first run scrapes inline.")
+
+    worker = get_background_worker()
+    if worker and worker.running and st.button("Refresh job corpus now"):
+        worker.trigger()
+        st.info("Corpus refresh started in the background.")
 
     # ------------------------------------------------------
     # Load saved profiles
@@ -29,16 +48,20 @@ def run():
     labels = [f"{p['name']} ({p['user_id']})" for p in profiles_meta]
     selected_label = st.selectbox("Select Profile", labels)
     selected_user_id = profiles_meta[labels.index(selected_label)]["user_id"]
+    job_query = st.text_input("Only jobs mentioning (optional)", placeholder="kubernetes bangalore")
 
     # ----------------------------------------------------------
     #  RUN ENTIRE PIPELINE (NO SECOND BUTTON NEEDED)
     # ----------------------------------------------------------
     if st.button("Start Full Job Analysis + Tailored Resume"):
         try:
-            with st.spinner("Running full AI pipeline… (Scrape → Match → Skills → Resume)"):
+            with st.spinner("Running full AI pipeline… (Corpus → Match → Skills → Resume)"):
 
                 graph = build_job_scraper_workflow()
-                result = graph.invoke({"user_id": selected_user_id})
+                inputs = {"user_id": selected_user_id}
+                if job_query.strip():
+                    inputs["job_query"] = job_query.strip()
+                result = graph.invoke(inputs)
 
             st.success("Pipeline completed successfully!")
 
@@ -1,16 +1,18 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import base64
 
 from smart_applier.utils.db_utils import (
     list_profiles,
     get_profile,
-    get_all_scraped_jobs,
-    get_latest_top_matched,
+    page_top_matched,
     list_resumes,
-    get_resume_blob
+    get_resume_path,
+    clear_scraped_jobs,
+    clear_resumes,
 )
+from smart_applier.utils.content_store import get_resume_store
+from smart_applier.database.stats import get_dashboard_stats
 
 
 def run():
@@ -72,13 +74,12 @@ def run():
     # ======================================================
     st.subheader("Your Resumes")
 
-    resumes = list_resumes()
+    # One indexed (user_id, resume_type) lookup per column
+    basic_resumes = list_resumes(user_id=user_id, resume_type="generated")
+    tailored_matched = list_resumes(user_id=user_id, resume_type="tailored_matched_job")
+    tailored_external = list_resumes(user_id=user_id, resume_type="tailored")
 
-    if resumes:
-
-        basic_resumes = [r for r in resumes if r["resume_type"] == "generated"]
-        tailored_matched = [r for r in resumes if r["resume_type"] == "tailored_matched_job"]
-        tailored_external = [r for r in resumes if r["resume_type"] == "tailored"]
+    if basic_resumes or tailored_matched or tailored_external:
 
         colA, colB, colC = st.columns(3)
 
@@ -88,9 +89,11 @@ def run():
 
             html = ""
             for r in resume_list:
-                blob = get_resume_blob(r["id"])
-                if blob:
-                    b64 = base64.b64encode(blob).decode()
+                path = get_resume_path(r["id"])
+                if path and path.exists():
+                    # Encode straight from the memory-mapped file
+                    with get_resume_store().mapped(path.stem) as pdf:
+                        b64 = base64.b64encode(pdf).decode()
 
                     link = f"""
                         <a href='data:application/pdf;base64,{b64}' 
@@ -122,21 +125,37 @@ def run():
     # ======================================================
     # JOB STATS
     # ======================================================
-    scraped = get_all_scraped_jobs(limit=5000)
-    matched = get_latest_top_matched(limit=5000)
+    # SQL aggregates, cached for STATS_CACHE_TTL_SECONDS
+    stats = get_dashboard_stats()
+    counts = stats["counts"]
+
+    colA, colB, colC = st.columns(3)
+    colA.metric("Total Scraped Jobs", counts["scraped_jobs"])
+    colB.metric("Matched Jobs", counts["top_matched_jobs"])
+    colC.metric("Your Matches", stats["matches_per_user"].get(user_id, 0))
 
-    colA, colB = st.columns(2)
-    colA.metric("Total Scraped Jobs", len(scraped))
-    colB.metric("Matched Jobs", len(matched))
+    if stats["jobs_per_day"]:
+        st.caption("Jobs scraped per day (last 30 days)")
+        st.bar_chart(pd.DataFrame(stats["jobs_per_day"]).set_index("day")["jobs"])
 
     st.divider()
 
     # ======================================================
     # RECENT MATCHED JOBS
     # ======================================================
-    st.subheader("Latest Matched Jobs")
+    st.subheader("Your Matched Jobs")
+    # Keyset pages: the cursors of the pages seen so far, for "Newer"
+    cursors = st.session_state.setdefault(f"match_page_cursors:{user_id}", [None])
+    matched, next_cursor = page_top_matched(before_id=cursors[-1], limit=20, user_id=user_id)
     if matched:
-        st.dataframe(pd.DataFrame(matched).head(3))
+        st.dataframe(pd.DataFrame(matched))
+        colPrev, colNext = st.columns(2)
+        if len(cursors) > 1 and colPrev.button("Newer matches"):
+            cursors.pop()
+            st.rerun()
+        if next_cursor is not None and colNext.button("Older matches"):
+            cursors.append(next_cursor)
+            st.rerun()
     else:
         st.info("No matched jobs yet.")
 
@@ -151,6 +170,7 @@ def run():
     skill_counts = {cat: len(items) for cat, items in skills.items()}
 
     if skill_counts:
+        import plotly.express as px  # heavy; only needed for this chart
         df_sk = pd.DataFrame({"Category": skill_counts.keys(), "Count": skill_counts.values()})
         fig = px.pie(df_sk, names="Category", values="Count")
         st.plotly_chart(fig, use_container_width=True)
@@ -210,18 +230,23 @@ def run():
     st.subheader("🧹 Database Cleanup (Developer Tools)")
     st.caption("Warning: These actions cannot be undone.")
 
-    import sqlite3
-    from smart_applier.utils.path_utils import get_data_dirs
-
-    paths = get_data_dirs()
-    db_path = paths["db_path"]
+    from smart_applier.database.connection import transaction
+    from smart_applier.database.stats import invalidate_stats
 
     def clear_table(table_name):
         try:
-            conn = sqlite3.connect(db_path)
-            conn.execute(f"DELETE FROM {table_name}")
-            conn.commit()
-            conn.close()
+            if table_name == "scraped_jobs":
+                # Also resets the watermarks, full-text index, parsed-page
+                # cache and (via its cleared listener) the FAISS job index
+                import smart_applier.search.job_index  # noqa: F401
+                clear_scraped_jobs()
+            elif table_name == "resumes":
+                # Unreferenced PDFs in the content store go too
+                clear_resumes()
+            else:
+                with transaction() as conn:
+                    conn.execute(f"DELETE FROM {table_name}")
+                invalidate_stats()
             st.success(f"Cleared table: {table_name}")
         except Exception as e:
             st.error(f"Error clearing {table_name}: {e}")
@@ -0,0 +1,10 @@
+# tests/conftest.py
+import pytest
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point SMART_APPLIER_DATA_DIR (DB, caches, content stores) at a fresh temp dir."""
+    monkeypatch.setenv("SMART_APPLIER_DATA_DIR", str(tmp_path))
+    monkeypatch.delenv("USE_IN_MEMORY_DB", raising=False)
+    return tmp_path
@@ -0,0 +1,33 @@
+# tests/test_content_store.py
+import os
+import time
+
+from smart_applier.utils.content_store import ContentStore
+
+
+def age(store, digest, seconds):
+    past = time.time() - seconds
+    os.utime(store.path(digest), (past, past))
+
+
+def test_gc_keeps_referenced_and_recent_files(tmp_path):
+    store = ContentStore(tmp_path, suffix=".pdf")
+    kept, old, fresh = store.put(b"kept"), store.put(b"old"), store.put(b"fresh")
+    for digest in (kept, old):
+        age(store, digest, 3600)
+
+    # `fresh` may belong to a row that isn't inserted yet
+    assert store.garbage_collect([kept], min_age_seconds=60) == 1
+    assert sorted(store.digests()) == sorted([kept, fresh])
+    assert store.garbage_collect([kept], min_age_seconds=0) == 1
+    assert list(store.digests()) == [kept]
+
+
+def test_reused_file_restarts_grace_period(tmp_path):
+    store = ContentStore(tmp_path)
+    digest = store.put(b"same pdf")
+    age(store, digest, 3600)
+    # A new row about to reference an old, currently unreferenced file
+    assert store.put(b"same pdf") == digest
+    assert store.garbage_collect([], min_age_seconds=60) == 0
+    assert store.read_bytes(digest) == b"same pdf"
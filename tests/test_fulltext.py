@@ -0,0 +1,29 @@
+# tests/test_fulltext.py
+from smart_applier.search import fulltext
+from smart_applier.utils.db_utils import bulk_upsert_scraped_jobs
+
+
+def store_jobs(n):
+    jobs = [{"title": f"Kubernetes engineer {i}", "company": f"Co {i}", "location": "Pune",
+             "skills": "kubernetes, docker" + ", kubernetes" * (i % 5), "summary": f"Role {i}"}
+            for i in range(n)]
+    ids, _ = bulk_upsert_scraped_jobs(jobs, notify=False)
+    return ids
+
+
+def test_lexical_scores_cover_every_hit_beyond_the_candidate_limit(data_dir):
+    ids = store_jobs(fulltext.CANDIDATE_LIMIT + 100)
+
+    assert len(fulltext.search_jobs("kubernetes", limit=fulltext.CANDIDATE_LIMIT)) == fulltext.CANDIDATE_LIMIT
+    scores = fulltext.lexical_scores("kubernetes docker")
+    assert sorted(scores) == sorted(ids)
+    assert all(score > 0 for score in scores.values())
+
+
+def test_search_jobs_ranks_best_first(data_dir):
+    store_jobs(20)
+    hits = fulltext.search_jobs("kubernetes", limit=None)
+    assert len(hits) == 20
+    scores = [score for _, score in hits]
+    assert scores == sorted(scores, reverse=True)
+    assert fulltext.search_jobs("kubernetes", location="mumbai") == []
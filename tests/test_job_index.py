@@ -0,0 +1,43 @@
+# tests/test_job_index.py
+import numpy as np
+import pytest
+
+from smart_applier.search.job_index import JobIndex
+
+
+def vectors(n, dim=16, seed=0):
+    return np.random.default_rng(seed).standard_normal((n, dim)).astype("float32")
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw"])
+def test_remove_drops_exactly_the_given_ids(tmp_path, index_type):
+    index = JobIndex(path=tmp_path / "jobs.faiss", index_type=index_type, params={})
+    vecs = vectors(50)
+    ids = list(range(100, 150))
+    assert index.add(ids, vecs) == 50
+
+    assert index.remove([100, 101, 102, 999]) == 3
+    assert index.ntotal == 47
+    assert not index.contains(101) and index.contains(103)
+    assert index.remove([101]) == 0
+
+    # The removed vectors are no longer found, the others still are
+    _, found = index.search(vecs[:5], top_k=1)
+    assert not set(found[:3, 0].tolist()) & {100, 101, 102}
+    assert found[3:, 0].tolist() == [103, 104]
+
+    reloaded = JobIndex(path=tmp_path / "jobs.faiss", index_type=index_type, params={})
+    assert reloaded.ntotal == 47 and not reloaded.contains(100)
+
+
+def test_rebuild_leaves_persisting_to_the_caller_with_save_false(data_dir):
+    path = data_dir / "jobs.faiss"
+    index = JobIndex(path=path, index_type="flat", params={})
+    index.add([1, 2, 3], vectors(3))
+    assert path.exists()
+
+    # No scraped_jobs rows: the rebuilt index is empty
+    assert index.rebuild(save=False) == 0
+    assert path.exists() and JobIndex(path=path).ntotal == 3
+    index.save()
+    assert not path.exists() and not index.config_path.exists()
@@ -0,0 +1,30 @@
+# tests/test_load_corpus.py
+from smart_applier.langgraph import nodes
+from smart_applier.utils.db_utils import bulk_upsert_scraped_jobs
+from smart_applier.workers import corpus_refresh
+
+
+def fail(*args, **kwargs):
+    raise AssertionError("the request must not wait for (or start) a refresh")
+
+
+def test_stale_corpus_is_served_while_refreshing_in_background(data_dir, monkeypatch):
+    bulk_upsert_scraped_jobs([{"title": f"Job {i}", "company": "Acme", "skills": "python"} for i in range(3)],
+                             notify=False)
+    requested = []
+    monkeypatch.setattr(corpus_refresh, "request_refresh", lambda: requested.append(True))
+    monkeypatch.setattr(corpus_refresh, "refresh_corpus", fail)
+    monkeypatch.setattr(nodes, "scrape_jobs_node", fail)
+
+    assert corpus_refresh.corpus_is_stale()
+    jobs = nodes.load_corpus_node({})["scraped_jobs"]
+    assert [job["title"] for job in jobs] == ["Job 2", "Job 1", "Job 0"]
+    assert all(job["db_id"] == job["id"] for job in jobs)
+    assert requested == [True]
+
+
+def test_fresh_corpus_requests_nothing(data_dir, monkeypatch):
+    bulk_upsert_scraped_jobs([{"title": "Job", "company": "Acme"}], notify=False)
+    corpus_refresh._write_status({"finished_at": corpus_refresh.datetime.now().isoformat(timespec="seconds")})
+    monkeypatch.setattr(corpus_refresh, "request_refresh", fail)
+    assert len(nodes.load_corpus_node({})["scraped_jobs"]) == 1
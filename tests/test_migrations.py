@@ -0,0 +1,65 @@
+# tests/test_migrations.py
+import sqlite3
+
+from smart_applier.database.db_setup import create_tables
+from smart_applier.database.migrations import (
+    LATEST_VERSION,
+    check_query_plans,
+    get_schema_version,
+    run_migrations,
+)
+from smart_applier.utils.content_store import get_resume_store, sha256_hex
+
+
+def connect(path):
+    # Autocommit, like the pooled connections: run_migrations opens its own transactions
+    return sqlite3.connect(str(path), isolation_level=None)
+
+
+def test_fresh_database_migrates_to_latest(data_dir):
+    conn = connect(data_dir / "fresh.db")
+    applied = run_migrations(conn)
+    assert applied == list(range(1, LATEST_VERSION + 1))
+    assert get_schema_version(conn) == LATEST_VERSION
+    assert run_migrations(conn) == []
+
+
+def test_migrated_queries_use_indexes(data_dir):
+    conn = connect(data_dir / "fresh.db")
+    run_migrations(conn)
+    assert check_query_plans(conn) == []
+
+
+def test_pooled_connection_is_migrated(data_dir):
+    from smart_applier.database.connection import get_connection
+    conn = get_connection()
+    assert get_schema_version(conn) == LATEST_VERSION
+    assert check_query_plans(conn) == []
+
+
+def test_baseline_resume_blobs_move_to_content_store(data_dir):
+    # A database created before versioning: user_version 0, PDFs in pdf_blob
+    conn = connect(data_dir / "baseline.db")
+    create_tables(conn)
+    pdfs = {"generated": b"%PDF-1.4 first resume\n%%EOF", "tailored": b"%PDF-1.4 second\x00\xff binary\n%%EOF"}
+    for resume_type, blob in pdfs.items():
+        conn.execute("INSERT INTO resumes (user_id, resume_type, file_name, pdf_blob) VALUES (?, ?, ?, ?)",
+                     ("u1", resume_type, f"{resume_type}.pdf", blob))
+    # Same PDF twice is stored once
+    conn.execute("INSERT INTO resumes (user_id, resume_type, file_name, pdf_blob) VALUES (?, ?, ?, ?)",
+                 ("u2", "generated", "copy.pdf", pdfs["generated"]))
+    assert get_schema_version(conn) == 0
+
+    run_migrations(conn)
+
+    assert get_schema_version(conn) == LATEST_VERSION
+    rows = conn.execute("SELECT resume_type, pdf_blob, pdf_sha256, pdf_size FROM resumes ORDER BY id").fetchall()
+    store = get_resume_store()
+    assert store.root == data_dir / "resumes" / "store"
+    for resume_type, pdf_blob, digest, size in rows:
+        original = pdfs[resume_type]
+        assert pdf_blob is None
+        assert digest == sha256_hex(original)
+        assert size == len(original)
+        assert store.read_bytes(digest) == original
+    assert sorted(store.digests()) == sorted(sha256_hex(blob) for blob in pdfs.values())
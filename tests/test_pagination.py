@@ -0,0 +1,138 @@
+# tests/test_pagination.py
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from smart_applier.utils.db_utils import (
+    _timestamp,
+    bulk_upsert_scraped_jobs,
+    insert_resume,
+    insert_top_matched_many,
+    iter_pages,
+    page_resumes,
+    page_scraped_jobs,
+    page_top_matched,
+    transaction,
+)
+
+
+def add_jobs(n):
+    jobs = [{"title": f"Job {i}", "company": f"Company {i % 3}", "location": "Pune", "skills": "python",
+             "summary": f"Posting {i}"} for i in range(n)]
+    ids, _ = bulk_upsert_scraped_jobs(jobs, notify=False)
+    return ids
+
+
+def walk(page_fn, limit, key="id", **filters):
+    """Every page as a list of ids, following next_cursor until it is None."""
+    pages, before_id = [], None
+    while True:
+        rows, before_id = page_fn(before_id=before_id, limit=limit, **filters)
+        pages.append([row[key] for row in rows])
+        if before_id is None:
+            return pages
+
+
+@pytest.fixture
+def local_tz(monkeypatch):
+    # A fixed non-UTC zone, so local-time handling is observable
+    monkeypatch.setenv("TZ", "Asia/Kolkata")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_pages_cover_every_row_once(data_dir):
+    ids = add_jobs(23)
+    pages = walk(page_scraped_jobs, 5)
+    assert [len(page) for page in pages] == [5, 5, 5, 5, 3]
+    assert sum(pages, []) == sorted(ids, reverse=True)
+
+
+def test_cursor_ends_on_the_last_page(data_dir):
+    add_jobs(10)
+    rows, cursor = page_scraped_jobs(limit=20)
+    assert len(rows) == 10 and cursor is None
+
+    # A full last page still hands out a cursor; the page after it is empty
+    pages = walk(page_scraped_jobs, 5)
+    assert [len(page) for page in pages] == [5, 5, 0]
+    assert page_scraped_jobs(before_id=min(pages[1]), limit=5) == ([], None)
+
+
+def test_company_filter(data_dir):
+    ids = add_jobs(12)
+    pages = walk(page_scraped_jobs, 2, company="Company 1")
+    assert sum(pages, []) == sorted(ids[1::3], reverse=True)
+    assert page_scraped_jobs(company="Nobody") == ([], None)
+
+
+def test_top_matched_user_and_company_filters(data_dir):
+    ids = add_jobs(9)
+    insert_top_matched_many([(job_id, f"user-{i % 2}", 0.5) for i, job_id in enumerate(ids)])
+
+    rows = list(iter_pages(page_top_matched, limit=2, user_id="user-0"))
+    assert [row["job_id"] for row in rows] == sorted(ids[0::2], reverse=True)
+    assert {row["user_id"] for row in rows} == {"user-0"}
+
+    rows = list(iter_pages(page_top_matched, limit=2, user_id="user-0", company="Company 0"))
+    assert [row["job_id"] for row in rows] == [ids[6], ids[0]]
+    # The cursor is the match id, so pages don't overlap
+    pages = walk(page_top_matched, 4, key="match_id")
+    assert [len(page) for page in pages] == [4, 4, 1]
+    assert len(set(sum(pages, []))) == 9
+
+
+def test_resumes_user_filter(data_dir):
+    for i in range(7):
+        insert_resume(f"user-{i % 2}", "generated", f"resume_{i}.pdf", b"%PDF-" + bytes([i]))
+    rows = list(iter_pages(page_resumes, limit=3, user_id="user-1"))
+    assert [row["file_name"] for row in rows] == ["resume_5.pdf", "resume_3.pdf", "resume_1.pdf"]
+    assert "pdf_sha256" not in rows[0]
+
+
+def hourly(ids):
+    # One row per hour from 2025-01-01 00:00 UTC, in id order
+    with transaction() as tx:
+        tx.execute("UPDATE scraped_jobs SET scraped_at = datetime('2025-01-01', '+' || (id - ?) || ' hours')",
+                   (ids[0],))
+
+
+def test_since_until_window(data_dir):
+    ids = add_jobs(20)
+    hourly(ids)
+
+    window = dict(since="2025-01-01 05:00:00", until="2025-01-01 12:00:00")
+    pages = walk(page_scraped_jobs, 3, **window)
+    assert sum(pages, []) == sorted(ids[5:12], reverse=True)
+
+    # Aware datetimes in another zone select the same rows
+    ist = timezone(timedelta(hours=5, minutes=30))
+    rows = list(iter_pages(page_scraped_jobs, since=datetime(2025, 1, 1, 10, 30, tzinfo=ist),
+                           until=datetime(2025, 1, 1, 17, 30, tzinfo=ist)))
+    assert [row["id"] for row in rows] == sorted(ids[5:12], reverse=True)
+
+    # Open-ended on either side
+    assert [row["id"] for row in iter_pages(page_scraped_jobs, since="2025-01-01 18:00:00")] == ids[:17:-1]
+    assert [row["id"] for row in iter_pages(page_scraped_jobs, until="2025-01-01 02:00:00")] == ids[1::-1]
+
+
+def test_empty_window(data_dir):
+    hourly(add_jobs(5))
+    # Nothing at or after `since`, or nothing before `until`: no id range at all
+    assert page_scraped_jobs(since="2026-01-01 00:00:00") == ([], None)
+    assert page_scraped_jobs(until="2024-01-01 00:00:00") == ([], None)
+    # A window between two rows, where the id range comes out inverted
+    assert page_scraped_jobs(since="2025-01-01 01:10:00", until="2025-01-01 01:50:00") == ([], None)
+
+
+def test_timestamp_converts_to_utc(local_tz):
+    assert _timestamp(None) is None
+    assert _timestamp("2025-01-01 05:00:00") == "2025-01-01 05:00:00"
+    # Naive datetimes and dates are local time (UTC+5:30 here)
+    assert _timestamp(datetime(2025, 1, 1, 10, 30)) == "2025-01-01 05:00:00"
+    assert _timestamp(date(2025, 1, 1)) == "2024-12-31 18:30:00"
+    assert _timestamp(datetime(2025, 1, 1, 5, tzinfo=timezone.utc)) == "2025-01-01 05:00:00"
+    assert _timestamp(datetime(2025, 1, 1, tzinfo=timezone(timedelta(hours=-5)))) == "2025-01-01 05:00:00"
@@ -0,0 +1,43 @@
+# tests/test_parsers.py
+# The lxml parser must return exactly what the BeautifulSoup reference does.
+from pathlib import Path
+
+import pytest
+
+from smart_applier.scraping.parsers import PARSERS, lxml_available, parse_pages
+
+FIXTURES_DIR = Path(__file__).resolve().parents[1] / "src" / "benchmarks" / "fixtures" / "karkidi"
+FIXTURES = sorted(FIXTURES_DIR.glob("*.html"))
+
+pytestmark = pytest.mark.skipif(not lxml_available(), reason="lxml is not installed")
+
+
+def test_fixtures_exist():
+    assert FIXTURES, f"no saved pages under {FIXTURES_DIR}"
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda p: p.name)
+def test_lxml_matches_bs4_on_saved_pages(path):
+    content = path.read_bytes()
+    expected = PARSERS["bs4"](content)
+    assert expected, "fixture parsed to no jobs"
+    assert PARSERS["lxml"](content) == expected
+
+
+@pytest.mark.parametrize("page", [1, 2, 3])
+def test_lxml_matches_bs4_on_rendered_pages(page):
+    from benchmarks.karkidi_stub import render_page
+    content = render_page(page, jobs_per_page=20)
+    assert PARSERS["lxml"](content) == PARSERS["bs4"](content)
+
+
+def test_empty_page_has_no_jobs():
+    content = b"<html><body><p>No jobs found</p></body></html>"
+    assert PARSERS["bs4"](content) == PARSERS["lxml"](content) == []
+
+
+def test_parse_pages_keeps_input_order():
+    contents = [path.read_bytes() for path in FIXTURES] * 2
+    serial = parse_pages(contents, PARSERS["lxml"], processes=0)
+    pooled = parse_pages(contents, PARSERS["lxml"], processes=2)
+    assert pooled == serial == [PARSERS["bs4"](content) for content in contents]
@@ -0,0 +1,70 @@
+# tests/test_scraped_jobs.py
+from smart_applier.utils import db_utils
+from smart_applier.utils.db_utils import bulk_upsert_scraped_jobs, get_scraped_jobs_by_ids
+from smart_applier.utils.job_fingerprint import job_fingerprint
+
+
+def job(i, **overrides):
+    return {"title": f"Data Engineer {i}", "company": f"Company {i}", "location": "Pune",
+            "experience": "2-4 years", "skills": "python, sql", "summary": f"Posting {i}",
+            "posted_on": "01 Oct 2025", **overrides}
+
+
+def titles(ids):
+    return [row["title"] for row in get_scraped_jobs_by_ids(ids)]
+
+
+def test_repeat_insert_returns_existing_id(data_dir):
+    ids, is_new = bulk_upsert_scraped_jobs([job(1)], notify=False)
+    assert is_new == [True]
+
+    again, is_new = bulk_upsert_scraped_jobs([job(1, experience="3-5 years", posted_on="05 Oct 2025")],
+                                             notify=False)
+    assert again == ids and is_new == [False]
+    # The stored row is refreshed, not duplicated
+    row = get_scraped_jobs_by_ids(ids)[0]
+    assert (row["experience"], row["posted_on"]) == ("3-5 years", "05 Oct 2025")
+    assert db_utils.get_connection().execute("SELECT COUNT(*) AS n FROM scraped_jobs").fetchone()["n"] == 1
+
+
+def test_duplicates_within_a_batch_collapse(data_dir):
+    batch = [job(1), job(2), job(1, title="  DATA engineer 1 "), job(2)]
+    ids, is_new = bulk_upsert_scraped_jobs(batch, notify=False)
+    assert ids[0] == ids[2] and ids[1] == ids[3] and ids[0] != ids[1]
+    # Only the first occurrence counts as new
+    assert is_new == [True, True, False, False]
+
+
+def test_ids_follow_input_order_in_mixed_batches(data_dir):
+    stored, _ = bulk_upsert_scraped_jobs([job(i) for i in (2, 5, 7)], notify=False)
+    existing = dict(zip((2, 5, 7), stored))
+
+    order = [9, 2, 10, 5, 11, 11, 7, 12]
+    ids, is_new = bulk_upsert_scraped_jobs([job(i) for i in order], notify=False)
+
+    assert titles(ids) == [f"Data Engineer {i}" for i in order]
+    assert [ids[1], ids[3], ids[6]] == [existing[2], existing[5], existing[7]]
+    assert is_new == [True, False, True, False, True, False, False, True]
+    assert len(set(ids)) == 7
+
+
+def test_listeners_only_see_new_rows(data_dir, monkeypatch):
+    calls = []
+    monkeypatch.setattr(db_utils, "_scraped_jobs_listeners", [lambda ids, jobs: calls.append((ids, jobs))])
+    bulk_upsert_scraped_jobs([job(1)])
+    ids, _ = bulk_upsert_scraped_jobs([job(1), job(2)])
+    assert len(calls) == 2
+    assert calls[1][0] == [ids[1]] and calls[1][1][0]["title"] == "Data Engineer 2"
+
+
+def test_fingerprint_ignores_case_and_whitespace():
+    base = job(1)
+    variant = {**base, "title": "  data   ENGINEER 1\t", "company": "COMPANY\n1",
+               "skills": "Python,  SQL"}
+    assert job_fingerprint(variant) == job_fingerprint(base)
+    # Capitalized scraper keys are understood too
+    capitalized = {key.title(): value for key, value in base.items()}
+    assert job_fingerprint(capitalized) == job_fingerprint(base)
+    # Experience and posting date don't identify a posting; content does
+    assert job_fingerprint({**base, "experience": "10 years"}) == job_fingerprint(base)
+    assert job_fingerprint({**base, "skills": "python, sql, spark"}) != job_fingerprint(base)
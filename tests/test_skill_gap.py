@@ -0,0 +1,142 @@
+# tests/test_skill_gap.py
+# The batched get_top_missing_skills must rank exactly like the per-job loop
+# it replaced (reference copy below).
+import zlib
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from smart_applier.embeddings import skill_vocabulary
+from smart_applier.embeddings.model_registry import get_model_registry
+from smart_applier.embeddings.skill_vocabulary import SkillVocabulary, cosine_matrix
+
+DIM = 32
+
+
+def unit(i):
+    v = np.zeros(DIM, dtype="float32")
+    v[i] = 1.0
+    return v
+
+
+def similar_to(i, cos, other):
+    """Unit vector with cosine `cos` to unit(i), orthogonal part along unit(other)."""
+    return cos * unit(i) + np.sqrt(1 - cos ** 2) * unit(other)
+
+
+# User skills are python (e0) and sql (e1)
+VECTORS = {
+    "python": unit(0),
+    "sql": unit(1),
+    "pandas": similar_to(0, 0.8, 2),       # covered
+    "postgres": similar_to(1, 0.5, 3),     # exactly at the threshold: covered
+    "rust": similar_to(0, 0.3, 4),         # rust and zig share a vector: full tie
+    "zig": similar_to(0, 0.3, 4),
+    "docker": similar_to(0, 0.2, 5),       # same similarity as kubernetes
+    "kubernetes": similar_to(1, 0.2, 6),
+    "excel": similar_to(1, 0.45, 7),
+}
+
+
+class StubEncoder:
+    """Deterministic encoder: fixed vectors above, seeded noise for anything else."""
+
+    def encode(self, phrases, convert_to_numpy=True, **kwargs):
+        return np.stack([self.vector(p) for p in phrases]).astype("float32")
+
+    @staticmethod
+    def vector(phrase):
+        if phrase in VECTORS:
+            return VECTORS[phrase]
+        return np.random.default_rng(zlib.crc32(phrase.encode())).standard_normal(DIM)
+
+
+def reference_top_missing_skills(encoder, user_skills, jobs_df, top_n=5, threshold=0.5):
+    """The per-job loop of the original SkillGapAgent (util.cos_sim → cosine_matrix)."""
+    user_embeddings = encoder.encode(user_skills)
+    all_missing_skills = defaultdict(list)
+    skill_col = [col for col in jobs_df.columns if "skill" in col.lower()][0]
+
+    for _, job in jobs_df.iterrows():
+        job_skills_text = str(job.get(skill_col, "")).strip()
+        if not job_skills_text:
+            continue
+        job_skills = [s.lower().strip() for s in job_skills_text.split(",") if s.strip()]
+        if not job_skills:
+            continue
+        cosine_scores = cosine_matrix(encoder.encode(job_skills), user_embeddings)
+        for i, job_skill in enumerate(job_skills):
+            similarity = float(cosine_scores[i].max())
+            if similarity < threshold:
+                all_missing_skills[job_skill].append(round(similarity, 3))
+
+    if not all_missing_skills:
+        return []
+    skill_scores = {
+        skill: (len(scores), sum(scores) / len(scores))
+        for skill, scores in all_missing_skills.items()
+    }
+    ranked = sorted(skill_scores.items(), key=lambda x: (-x[1][0], x[1][1]))[:top_n]
+    return [skill for skill, _ in ranked]
+
+
+PROFILE = {"skills": {"languages": ["Python", " SQL "], "other": [" "]}}
+
+
+@pytest.fixture
+def make_agent(data_dir, monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "")
+    monkeypatch.setattr(skill_vocabulary, "_vocabulary", SkillVocabulary(data_dir / "vocabulary.db"))
+    registry = get_model_registry()
+    registry.clear()
+    monkeypatch.setattr(registry, "loader", lambda model_name: StubEncoder())
+
+    from smart_applier.agents.skill_gap_agent import SkillGapAgent
+
+    def make(skills):
+        return SkillGapAgent(PROFILE, pd.DataFrame({"title": [f"job {i}" for i in range(len(skills))],
+                                                    "skills": skills}))
+
+    yield make
+    registry.clear()
+
+
+def assert_same_ranking(agent, top_ns=(1, 2, 3, 5, 10, 50)):
+    for top_n in top_ns:
+        expected = reference_top_missing_skills(StubEncoder(), agent.user_skills, agent.jobs_df, top_n)
+        assert agent.get_top_missing_skills(top_n=top_n) == expected
+
+
+def test_ties_duplicates_and_empty_cells(make_agent):
+    agent = make_agent([
+        "Rust, zig, Docker, kubernetes",
+        "zig, rust , excel, EXCEL",          # duplicates within a job count twice
+        "",                                   # empty cell
+        np.nan,                               # NaN cell ("nan" like the loop)
+        None,
+        " , ,",                               # only separators
+        "python, pandas, postgres, SQL",      # every skill covered
+        "kubernetes, docker, excel, terraform",
+    ])
+    assert_same_ranking(agent)
+    # Count first, then lower similarity; full ties keep first-seen order
+    assert agent.get_top_missing_skills() == ["excel", "docker", "kubernetes", "rust", "zig"]
+
+
+def test_every_skill_covered(make_agent):
+    agent = make_agent(["python, pandas", "SQL, postgres, python"])
+    assert agent.get_top_missing_skills() == []
+    assert_same_ranking(agent)
+
+
+def test_random_job_sets_match_the_loop(make_agent):
+    pool = list(VECTORS) + ["terraform", "go", "java", "scala", "airflow", "spark", "tableau", "nan"]
+    rng = np.random.default_rng(7)
+    skills = []
+    for _ in range(60):
+        picks = rng.choice(pool, size=rng.integers(0, 8))
+        cell = ", ".join(p.upper() if rng.random() < 0.2 else p for p in picks)
+        skills.append(cell if rng.random() > 0.05 else np.nan)
+    assert_same_ranking(make_agent(skills))
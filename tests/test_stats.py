@@ -0,0 +1,36 @@
+# tests/test_stats.py
+from smart_applier.database.stats import invalidate_stats, ttl_cached
+
+
+def test_ttl_cached_keys_on_args_and_kwargs():
+    calls = []
+
+    @ttl_cached
+    def per_day(days=30, user=None):
+        calls.append((days, user))
+        return (days, user)
+
+    invalidate_stats()
+    assert per_day(7) == (7, None)
+    assert per_day(7) == (7, None)
+    assert per_day(days=7, user="a") == (7, "a")
+    assert per_day(user="a", days=7) == (7, "a")
+    assert per_day(days=7, user="b") == (7, "b")
+    assert calls == [(7, None), (7, "a"), (7, "b")]
+
+
+def test_result_computed_before_invalidation_is_not_cached():
+    values = iter([1, 2, 3])
+
+    @ttl_cached
+    def count():
+        value = next(values)
+        if value == 1:
+            # A write lands while the aggregate is running
+            invalidate_stats()
+        return value
+
+    invalidate_stats()
+    assert count() == 1
+    assert count() == 2
+    assert count() == 2